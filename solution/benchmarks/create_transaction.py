@@ -0,0 +1,216 @@
+"""Бенчмарк задержки записи одной транзакции: прежний путь CreateTransaction против одного запроса.
+
+Прежний путь: SELECT пользователя, SELECT включённых правил, flush транзакции, flush результатов
+правил, COMMIT. Новый путь: пользователь уже загружен idp, правила берутся из процессного снимка,
+транзакция, локация и результаты правил пишутся одним INSERT с CTE, затем COMMIT.
+
+Запуск из директории solution/ (нужна БД с применёнными миграциями):
+python -m benchmarks.create_transaction --iterations 2000 --rules 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.domain.entity.fraud_rule import FraudRuleEvaluationResult
+from backend.domain.entity.transaction import Transaction, TransactionLocation
+from backend.domain.misc_types import TransactionChannel, TransactionStatus
+from backend.infrastructure.config_loader import Config
+from backend.infrastructure.database.gateway.fraud_rule import SAFraudRuleGateway
+from backend.infrastructure.database.gateway.transaction import SATransactionGateway
+from backend.infrastructure.database.gateway.user import SAUserGateway
+
+BENCH_EMAIL = "bench_create@bench.local"
+BENCH_RULE_PREFIX = "benchmark_create_rule_"
+WARMUP = 50
+
+SEED_USER = text(
+    """
+    INSERT INTO user_table (id, email, password, full_name, role, is_active, created_at, updated_at)
+    VALUES (gen_random_uuid(), :email, 'benchmark', 'Benchmark', 'USER', true, now(), now())
+    ON CONFLICT (email) DO NOTHING
+    """,
+)
+SEED_RULES = text(
+    """
+    INSERT INTO fraud_rule_table (id, name, description, dsl_expression, priority, enabled, created_at, updated_at)
+    SELECT gen_random_uuid(), :prefix || g, 'benchmark', 'amount > 1000', 1000 + g, false, now(), now()
+    FROM generate_series(1, :rules) AS g
+    ON CONFLICT (name) DO NOTHING
+    """,
+)
+# Результаты правил и локации ссылаются на транзакции, поэтому удаляются первыми
+CLEANUP = (
+    "DELETE FROM fraud_rule_evaluation_result_table WHERE transaction_id IN "
+    "(SELECT id FROM transaction_table WHERE user_id = :user_id)",
+    "DELETE FROM transaction_location_table WHERE id IN "
+    "(SELECT id FROM transaction_table WHERE user_id = :user_id)",
+    "DELETE FROM transaction_table WHERE user_id = :user_id",
+)
+
+type Rule = tuple[UUID, str, int]
+type WritePath = Callable[[AsyncSession, Transaction, list[FraudRuleEvaluationResult]], Awaitable[None]]
+
+
+def make_transaction(user_id: UUID) -> Transaction:
+    now = datetime.now(tz=UTC)
+
+    return Transaction(
+        id=uuid4(),
+        user_id=user_id,
+        amount=Decimal("123.45"),
+        currency="RUB",
+        status=TransactionStatus.APPROVED,
+        merchant_id="merchant_001",
+        merchant_category_code="5411",
+        timestamp=now,
+        ip_address="10.0.0.1",
+        device_id="device_1",
+        channel=TransactionChannel.WEB,
+        location=TransactionLocation(country="RU", city="Moscow"),
+        is_fraud=False,
+        metadata={"source": "benchmark"},
+        created_at=now,
+    )
+
+
+def make_rule_results(transaction: Transaction, rules: Sequence[Rule]) -> list[FraudRuleEvaluationResult]:
+    return [
+        FraudRuleEvaluationResult(
+            id=uuid4(),
+            transaction_id=transaction.id,
+            rule_id=rule_id,
+            rule_name=name,
+            priority=priority,
+            matched=False,
+            description='Правило "amount > 1000" не сработало',
+            created_at=transaction.created_at,
+        )
+        for rule_id, name, priority in rules
+    ]
+
+
+async def write_before(
+    session: AsyncSession,
+    transaction: Transaction,
+    rule_results: list[FraudRuleEvaluationResult],
+) -> None:
+    await SAUserGateway(session).get_by_id(transaction.user_id)
+    await SAFraudRuleGateway(session).get_many_by_priority(enabled=True)
+
+    session.add(transaction)
+    await session.flush((transaction,))
+
+    for rule_result in rule_results:
+        session.add(rule_result)
+    await session.flush((*rule_results,))
+
+    await session.commit()
+
+
+async def write_after(
+    session: AsyncSession,
+    transaction: Transaction,
+    rule_results: list[FraudRuleEvaluationResult],
+) -> None:
+    await SATransactionGateway(session).add(transaction, rule_results)
+    await session.commit()
+
+
+async def measure(
+    session_factory: async_sessionmaker[AsyncSession],
+    write: WritePath,
+    user_id: UUID,
+    rules: Sequence[Rule],
+    iterations: int,
+) -> list[float]:
+    timings: list[float] = []
+
+    for iteration in range(WARMUP + iterations):
+        transaction = make_transaction(user_id)
+        rule_results = make_rule_results(transaction, rules)
+
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await write(session, transaction, rule_results)
+            elapsed = time.perf_counter() - started
+
+        if iteration >= WARMUP:
+            timings.append(elapsed * 1000)
+
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    percentiles = statistics.quantiles(timings, n=100)
+    print(  # noqa: T201
+        f"{name}: p50 {percentiles[49]:7.3f} мс  p99 {percentiles[98]:7.3f} мс  "
+        f"среднее {statistics.fmean(timings):7.3f} мс",
+    )
+
+
+async def prepare(engine: AsyncEngine, rules_count: int) -> tuple[UUID, list[Rule]]:
+    async with engine.begin() as conn:
+        await conn.execute(SEED_USER, {"email": BENCH_EMAIL})
+        await conn.execute(SEED_RULES, {"prefix": BENCH_RULE_PREFIX, "rules": rules_count})
+
+        user_id = (
+            await conn.execute(text("SELECT id FROM user_table WHERE email = :email"), {"email": BENCH_EMAIL})
+        ).scalar_one()
+        rows = await conn.execute(
+            text(
+                "SELECT id, name, priority FROM fraud_rule_table WHERE name LIKE :pattern "
+                "ORDER BY priority LIMIT :rules",
+            ),
+            {"pattern": BENCH_RULE_PREFIX.replace("_", "\\_") + "%", "rules": rules_count},
+        )
+
+    return user_id, [(row.id, row.name, row.priority) for row in rows]
+
+
+async def cleanup(engine: AsyncEngine, user_id: UUID) -> None:
+    async with engine.begin() as conn:
+        for statement in CLEANUP:
+            await conn.execute(text(statement), {"user_id": user_id})
+
+
+async def run(iterations: int, rules_count: int) -> None:
+    config = Config.load_from_environment()
+    engine = create_async_engine(config.db.build_connection_str())
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+    try:
+        user_id, rules = await prepare(engine, rules_count)
+
+        try:
+            before = await measure(session_factory, write_before, user_id, rules, iterations)
+            after = await measure(session_factory, write_after, user_id, rules, iterations)
+        finally:
+            await cleanup(engine, user_id)
+    finally:
+        await engine.dispose()
+
+    print(f"Итераций: {iterations}, результатов правил на транзакцию: {len(rules)}")  # noqa: T201
+    report("до (6 запросов)  ", before)
+    report("после (1 запрос) ", after)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Сколько транзакций записать каждым путём")
+    parser.add_argument("--rules", type=int, default=10, help="Сколько результатов правил у каждой транзакции")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations, args.rules))
+
+
+if __name__ == "__main__":
+    main()
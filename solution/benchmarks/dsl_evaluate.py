@@ -0,0 +1,96 @@
+"""Микробенчмарк: DSLEvaluator (обход дерева) против скомпилированных функций и оценки пачкой.
+
+Запуск из директории solution/: python -m benchmarks.dsl_evaluate
+"""
+
+import random
+import timeit
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from backend.domain.entity.transaction import Transaction
+from backend.domain.misc_types import TransactionStatus
+from backend.domain.service.dsl.compile import build_context, compile_ast
+from backend.domain.service.dsl.evaluate import DSLEvaluator
+from backend.domain.service.dsl.lex import Lexer
+from backend.domain.service.dsl.normalize import normalize_ast
+from backend.domain.service.dsl.parser import DSLParser
+from backend.domain.service.dsl.vectorize import build_columns, vectorize_ast
+
+RULES = [
+    "amount >= 1000",
+    "currency != 'RUB' OR merchantId != 'merchant_001'",
+    "amount > 10 AND currency = 'USD' AND deviceId = 'device_1'",
+    "ipAddress = '10.0.0.1' OR ipAddress = '10.0.0.2' OR ipAddress = '10.0.0.3' OR amount < 5",
+    "amount > 100.5 AND amount <= 5000 AND merchantId != 'merchant_007' OR currency = 'EUR'",
+]
+TRANSACTIONS_COUNT = 1000
+REPEAT = 5
+
+
+def make_transaction(rnd: random.Random) -> Transaction:
+    return Transaction(
+        id=uuid4(),
+        user_id=uuid4(),
+        amount=Decimal(rnd.randint(1, 1_000_000)) / 100,
+        currency=rnd.choice(["RUB", "USD", "EUR"]),
+        status=TransactionStatus.APPROVED,
+        merchant_id=rnd.choice([None, "merchant_001", "merchant_007"]),
+        merchant_category_code=None,
+        timestamp=datetime.now(tz=UTC),
+        ip_address=rnd.choice([None, "10.0.0.1", "10.0.0.3", "192.168.1.1"]),
+        device_id=rnd.choice([None, "device_1", "device_2"]),
+        channel=None,
+        location=None,
+        is_fraud=False,
+    )
+
+
+def main() -> None:
+    rnd = random.Random(42)
+    transactions = [make_transaction(rnd) for _ in range(TRANSACTIONS_COUNT)]
+    asts = [normalize_ast(DSLParser(Lexer(rule).tokenize()).parse()) for rule in RULES]
+    predicates = [compile_ast(ast) for ast in asts]
+    batch_predicates = [vectorize_ast(ast) for ast in asts]
+
+    evaluators = [DSLEvaluator(transaction) for transaction in transactions]
+    contexts = [build_context(transaction) for transaction in transactions]
+
+    for evaluator, context in zip(evaluators, contexts, strict=True):
+        for ast, predicate in zip(asts, predicates, strict=True):
+            assert evaluator.eval(ast) == predicate(context)
+
+    columns = build_columns(transactions)
+    for ast, batch_predicate in zip(asts, batch_predicates, strict=True):
+        assert batch_predicate(columns).tolist() == [evaluator.eval(ast) for evaluator in evaluators]
+
+    def tree_walk() -> None:
+        for evaluator in evaluators:
+            for ast in asts:
+                evaluator.eval(ast)
+
+    def compiled() -> None:
+        for context in contexts:
+            for predicate in predicates:
+                predicate(context)
+
+    def batch() -> None:
+        batch_columns = build_columns(transactions)
+        for batch_predicate in batch_predicates:
+            batch_predicate(batch_columns)
+
+    tree_walk_time = min(timeit.repeat(tree_walk, number=1, repeat=REPEAT))
+    compiled_time = min(timeit.repeat(compiled, number=1, repeat=REPEAT))
+    batch_time = min(timeit.repeat(batch, number=1, repeat=REPEAT))
+    evaluations = TRANSACTIONS_COUNT * len(RULES)
+
+    print(f"Оценок правил за прогон: {evaluations}")  # noqa: T201
+    print(f"DSLEvaluator:  {tree_walk_time * 1e6 / evaluations:.2f} мкс/оценка")  # noqa: T201
+    print(f"compile_ast:   {compiled_time * 1e6 / evaluations:.2f} мкс/оценка")  # noqa: T201
+    print(f"vectorize_ast: {batch_time * 1e6 / evaluations:.2f} мкс/оценка (с построением столбцов)")  # noqa: T201
+    print(f"Ускорение:     x{tree_walk_time / compiled_time:.1f} / x{tree_walk_time / batch_time:.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
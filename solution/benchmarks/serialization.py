@@ -0,0 +1,83 @@
+"""Микробенчмарк: прежний Retort + JSONResponse против serializer + SerializedJSONResponse.
+
+Запуск из директории solution/: python -m benchmarks.serialization
+"""
+
+import timeit
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from adaptix import NameStyle, Retort, dumper, name_mapping
+from fastapi.responses import JSONResponse
+
+from backend.application.transaction.dto import FraudRuleEvaluationResultDTO, TransactionDecision
+from backend.domain.entity.transaction import Transaction, TransactionLocation
+from backend.domain.misc_types import TransactionChannel, TransactionStatus
+from backend.presentation.web.response import SerializedJSONResponse
+from backend.presentation.web.serializer import serializer
+
+RULES_COUNT = 50
+ITERATIONS = 2000
+REPEAT = 5
+
+legacy_serializer = Retort(
+    recipe=[
+        dumper(datetime, lambda x: f"{x.strftime('%Y-%m-%d')}T{x.strftime('%H:%M:%S')}Z"),
+        name_mapping(name_style=NameStyle.CAMEL),
+    ],
+)
+
+
+def make_decision() -> TransactionDecision:
+    transaction = Transaction(
+        id=uuid4(),
+        user_id=uuid4(),
+        amount=Decimal("1234.56"),
+        currency="RUB",
+        status=TransactionStatus.DECLINED,
+        merchant_id="merchant_001",
+        merchant_category_code="5411",
+        timestamp=datetime.now(tz=UTC),
+        ip_address="10.0.0.1",
+        device_id="device_1",
+        channel=TransactionChannel.WEB,
+        location=TransactionLocation(country="RU", city="Moscow", latitude=Decimal("55.75"), longitude=Decimal("37.62")),
+        is_fraud=True,
+    )
+    rule_results = [
+        FraudRuleEvaluationResultDTO(
+            rule_id=uuid4(),
+            rule_name=f"rule_{index}",
+            priority=index,
+            matched=index % 3 == 0,
+            description=f"amount >= {index * 100}",
+        )
+        for index in range(RULES_COUNT)
+    ]
+    return TransactionDecision(transaction=transaction, rule_results=rule_results)
+
+
+def main() -> None:
+    decision = make_decision()
+
+    legacy_body = JSONResponse(content=legacy_serializer.dump(decision)).body
+    assert SerializedJSONResponse(content=serializer.dump(decision)).body == legacy_body
+
+    def legacy() -> None:
+        JSONResponse(content=legacy_serializer.dump(decision))
+
+    def orjson_response() -> None:
+        SerializedJSONResponse(content=serializer.dump(decision))
+
+    legacy_time = min(timeit.repeat(legacy, number=ITERATIONS, repeat=REPEAT))
+    orjson_time = min(timeit.repeat(orjson_response, number=ITERATIONS, repeat=REPEAT))
+
+    print(f"Ответ: транзакция и {RULES_COUNT} результатов правил")  # noqa: T201
+    print(f"Retort + JSONResponse:               {legacy_time * 1e6 / ITERATIONS:.1f} мкс/ответ")  # noqa: T201
+    print(f"serializer + SerializedJSONResponse: {orjson_time * 1e6 / ITERATIONS:.1f} мкс/ответ")  # noqa: T201
+    print(f"Ускорение: x{legacy_time / orjson_time:.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Регрессионный бенчмарк планов запросов списка и подсчёта транзакций.
+
+Засеивает БД синтетическими транзакциями (по умолчанию 2 млн) и для каждого запроса
+сравнивает план и время без индексов (enable_indexscan и т.п. выключены) и с индексами.
+Завершается с кодом 1, если запрос, которому положен индекс, всё равно читается seq scan,
+или если в плане остались месячные секции вне окна запроса (не сработал partition pruning).
+
+Запуск из директории solution/ (переменные окружения БД как у приложения):
+python -m benchmarks.transaction_queries --rows 2000000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from backend.infrastructure.config_loader import Config
+from backend.infrastructure.database.partition import (
+    PARTITIONED_TABLES,
+    PartitionManager,
+    add_months,
+    is_partition,
+    month_start,
+    partition_name,
+)
+
+BENCH_EMAIL_DOMAIN = "@bench.local"
+BENCH_RULE_NAME = "benchmark_rule"
+SEED_CHUNK = 250_000
+SCAN_NODES = ("Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan", "Bitmap Index Scan")
+SEQ_SCAN_TABLES = PARTITIONED_TABLES
+# Засеянные транзакции разбросаны по последнему году
+SEED_MONTHS_BACK = 12
+
+SEED_USERS = text(
+    """
+    INSERT INTO user_table (id, email, password, full_name, role, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), 'bench_' || g || :domain, 'benchmark', 'Benchmark ' || g, 'USER', true, now(), now()
+    FROM generate_series(1, :users) AS g
+    ON CONFLICT (email) DO NOTHING
+    """,
+)
+SEED_RULE = text(
+    """
+    INSERT INTO fraud_rule_table (id, name, description, dsl_expression, priority, enabled, created_at, updated_at)
+    VALUES (gen_random_uuid(), :name, 'benchmark', 'amount > 1000', 1000, false, now(), now())
+    ON CONFLICT (name) DO NOTHING
+    """,
+)
+# timestamp и created_at разбросаны по последнему году, около 5% транзакций - мошеннические
+SEED_TRANSACTIONS = text(
+    """
+    WITH inserted AS (
+        INSERT INTO transaction_table (id, user_id, amount, currency, status, timestamp, is_fraud, created_at)
+        SELECT
+            gen_random_uuid(),
+            (CAST(:user_ids AS uuid[]))[1 + s.g % :users],
+            round((random() * 10000)::numeric, 2),
+            'RUB',
+            CAST(CASE WHEN s.g % 20 = 0 THEN 'DECLINED' ELSE 'APPROVED' END AS transactionstatus),
+            s.ts,
+            s.g % 20 = 0,
+            s.ts
+        FROM (
+            SELECT g, now() - random() * interval '365 days' AS ts
+            FROM generate_series(:start, :stop) AS g
+        ) AS s
+        RETURNING id, is_fraud, created_at
+    )
+    INSERT INTO fraud_rule_evaluation_result_table
+        (id, transaction_id, rule_id, rule_name, priority, matched, description, created_at)
+    SELECT gen_random_uuid(), id, :rule_id, :rule_name, 1000, is_fraud, 'benchmark', created_at
+    FROM inserted
+    """,
+)
+
+DISABLE_INDEXES = (
+    "SET LOCAL enable_indexscan = off",
+    "SET LOCAL enable_indexonlyscan = off",
+    "SET LOCAL enable_bitmapscan = off",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Query:
+    name: str
+    sql: str
+    # Запрос должен читаться через индекс, seq scan считается регрессией
+    expect_index: bool = True
+
+
+# Те же условия и сортировки, что строит SATransactionGateway / SAFraudRuleEvaluationResultGateway
+QUERIES = (
+    Query(
+        "list",
+        "SELECT * FROM transaction_table WHERE created_at >= :from_ AND created_at <= :to "
+        "ORDER BY timestamp DESC LIMIT 20 OFFSET 0",
+    ),
+    Query(
+        "list_user",
+        "SELECT * FROM transaction_table WHERE created_at >= :from_ AND created_at <= :to "
+        "AND user_id = :user_id ORDER BY timestamp DESC LIMIT 20 OFFSET 0",
+    ),
+    Query(
+        "count",
+        "SELECT count(*) FROM transaction_table WHERE created_at >= :from_ AND created_at <= :to",
+        # Окно в 90 дней - четверть таблицы, здесь планировщик вправе выбрать seq scan
+        expect_index=False,
+    ),
+    Query(
+        "count_user_fraud",
+        "SELECT count(*) FROM transaction_table WHERE created_at >= :from_ AND created_at <= :to "
+        "AND user_id = :user_id AND status = 'DECLINED' AND is_fraud = true",
+    ),
+    Query(
+        "rule_results",
+        "SELECT * FROM fraud_rule_evaluation_result_table WHERE transaction_id = :transaction_id "
+        "AND created_at = :created_at ORDER BY priority",
+    ),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class PlanSummary:
+    scans: list[str]
+    relations: list[str]
+    execution_time: float
+
+    @property
+    def has_seq_scan(self) -> bool:
+        return any(scan.startswith("Seq Scan") and scan.endswith(SEQ_SCAN_TABLES) for scan in self.scans)
+
+
+    def unpruned(self, expected_partitions: set[str]) -> list[str]:
+        return [
+            relation
+            for relation in self.relations
+            if is_partition(relation) and relation not in expected_partitions
+        ]
+
+
+def collect_scans(node: dict[str, Any], scans: list[str], relations: list[str]) -> None:
+    node_type = node["Node Type"]
+
+    if node_type in SCAN_NODES:
+        target = node.get("Index Name") or node.get("Relation Name", "")
+        direction = " Backward" if node.get("Scan Direction") == "Backward" else ""
+        scans.append(f"{node_type}{direction} {target}")
+
+        if "Relation Name" in node:
+            relations.append(node["Relation Name"])
+
+    for child in node.get("Plans", []):
+        collect_scans(child, scans, relations)
+
+
+def expected_partitions(params: dict[str, Any]) -> set[str]:
+    """Секции месяцев, которые пересекает окно запроса, и секция выбранной транзакции."""
+    months = {month_start(params["created_at"])}
+    month = month_start(params["from_"])
+    while month <= params["to"]:
+        months.add(month)
+        month = add_months(month, 1)
+
+    return {partition_name(table, month) for table in PARTITIONED_TABLES for month in months}
+
+
+async def explain(conn: AsyncConnection, query: Query, params: dict[str, Any], use_indexes: bool) -> PlanSummary:
+    async with conn.begin() as transaction:
+        if not use_indexes:
+            for statement in DISABLE_INDEXES:
+                await conn.execute(text(statement))
+
+        result = await conn.execute(text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query.sql), params)
+        raw_plan = result.scalar_one()
+        await transaction.rollback()
+
+    plan = (json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan)[0]
+    scans: list[str] = []
+    relations: list[str] = []
+    collect_scans(plan["Plan"], scans, relations)
+
+    return PlanSummary(scans=scans, relations=relations, execution_time=plan["Execution Time"])
+
+
+async def seed(engine: AsyncEngine, rows: int, users: int) -> None:
+    await PartitionManager(engine=engine).ensure(months_back=SEED_MONTHS_BACK)
+
+    async with engine.begin() as conn:
+        await conn.execute(SEED_USERS, {"users": users, "domain": BENCH_EMAIL_DOMAIN})
+        await conn.execute(SEED_RULE, {"name": BENCH_RULE_NAME})
+
+        user_ids = list(
+            (
+                await conn.execute(
+                    text("SELECT id FROM user_table WHERE email LIKE :pattern ORDER BY email"),
+                    {"pattern": "bench\\_%" + BENCH_EMAIL_DOMAIN},
+                )
+            ).scalars(),
+        )
+        rule_id = (
+            await conn.execute(text("SELECT id FROM fraud_rule_table WHERE name = :name"), {"name": BENCH_RULE_NAME})
+        ).scalar_one()
+        existing = (await conn.execute(text("SELECT count(*) FROM transaction_table"))).scalar_one()
+
+    for start in range(existing + 1, rows + 1, SEED_CHUNK):
+        stop = min(start + SEED_CHUNK - 1, rows)
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                SEED_TRANSACTIONS,
+                {
+                    "user_ids": user_ids,
+                    "users": len(user_ids),
+                    "start": start,
+                    "stop": stop,
+                    "rule_id": rule_id,
+                    "rule_name": BENCH_RULE_NAME,
+                },
+            )
+
+        print(f"Засеяно транзакций: {stop}/{rows}")  # noqa: T201
+
+    # VACUUM нужен для карты видимости (index only scan), выполняется вне транзакции
+    async with engine.connect() as conn:
+        autocommit_conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await autocommit_conn.execute(text("VACUUM ANALYZE transaction_table"))
+        await autocommit_conn.execute(text("VACUUM ANALYZE fraud_rule_evaluation_result_table"))
+
+
+async def sample_params(conn: AsyncConnection) -> dict[str, Any]:
+    now = datetime.now(tz=UTC)
+    row = (
+        await conn.execute(
+            text("SELECT id, user_id, created_at FROM transaction_table ORDER BY timestamp DESC LIMIT 1"),
+        )
+    ).one()
+    transaction_id: UUID = row.id
+    user_id: UUID = row.user_id
+    created_at: datetime = row.created_at
+
+    return {
+        "from_": now - timedelta(days=90),
+        "to": now,
+        "user_id": user_id,
+        "transaction_id": transaction_id,
+        "created_at": created_at,
+    }
+
+
+async def run(rows: int, users: int, skip_seed: bool) -> int:
+    config = Config.load_from_environment()
+    engine = create_async_engine(config.db.build_connection_str())
+    regressions: list[str] = []
+    unpruned: list[str] = []
+
+    try:
+        if not skip_seed:
+            await seed(engine, rows, users)
+
+        async with engine.connect() as conn:
+            params = await sample_params(conn)
+            partitions = expected_partitions(params)
+
+            for query in QUERIES:
+                without_indexes = await explain(conn, query, params, use_indexes=False)
+                with_indexes = await explain(conn, query, params, use_indexes=True)
+
+                print(f"\n{query.name}")  # noqa: T201
+                print(f"  без индексов: {without_indexes.execution_time:9.2f} мс  {without_indexes.scans}")  # noqa: T201
+                print(f"  с индексами:  {with_indexes.execution_time:9.2f} мс  {with_indexes.scans}")  # noqa: T201
+
+                if query.expect_index and with_indexes.has_seq_scan:
+                    regressions.append(query.name)
+                if extra_partitions := with_indexes.unpruned(partitions):
+                    unpruned.append(f"{query.name} ({', '.join(sorted(set(extra_partitions)))})")
+    finally:
+        await engine.dispose()
+
+    if regressions:
+        print(f"\nSeq scan вместо индекса: {', '.join(regressions)}")  # noqa: T201
+    if unpruned:
+        print(f"\nСекции вне окна запроса: {'; '.join(unpruned)}")  # noqa: T201
+
+    return 1 if regressions or unpruned else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Сколько транзакций должно быть в таблице")
+    parser.add_argument("--users", type=int, default=1000, help="Сколько синтетических пользователей создать")
+    parser.add_argument("--skip-seed", action="store_true", help="Не засеивать БД, только сравнить планы")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args.rows, args.users, args.skip_seed)))
+
+
+if __name__ == "__main__":
+    main()
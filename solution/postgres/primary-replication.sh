@@ -0,0 +1,4 @@
+#!/bin/sh
+# Разрешает реплике забирать WAL по паролю основного пользователя
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,11 @@
+#!/bin/sh
+# Hot standby: при первом запуске копирует основную БД через pg_basebackup, затем стримит WAL
+set -e
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_basebackup -h "$PRIMARY_HOST" -U "$POSTGRES_USER" -D "$PGDATA" -R -X stream; do
+        echo "Основная БД недоступна, повтор через секунду"
+        sleep 1
+    done
+    chmod 0700 "$PGDATA"
+fi
+exec postgres
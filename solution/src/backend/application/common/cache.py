@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+
+class CacheInvalidator(Protocol):
+    @abstractmethod
+    async def invalidate_rules(self) -> None: ...
+
+    @abstractmethod
+    async def invalidate_user(self, user_id: UUID) -> None: ...
+
+    @abstractmethod
+    async def invalidate_all(self) -> None: ...
@@ -0,0 +1,41 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Protocol
+from uuid import UUID
+
+from backend.domain.misc_types import TransactionStatus
+
+
+class CountMode(Enum):
+    # Точный COUNT(*)
+    EXACT = "EXACT"
+    # COUNT(*), закэшированный по набору фильтров на короткое время
+    CACHED = "CACHED"
+    # Оценка планировщика, небольшие выборки всё равно считаются точно
+    ESTIMATE = "ESTIMATE"
+
+
+@dataclass(slots=True, frozen=True)
+class CountModes:
+    transactions: CountMode = CountMode.EXACT
+    users: CountMode = CountMode.EXACT
+
+
+class TotalCounter(Protocol):
+    """Считает total для списков в отдельном соединении, параллельно с запросом страницы."""
+
+    @abstractmethod
+    async def count_transactions(
+        self,
+        mode: CountMode,
+        from_: datetime,
+        to: datetime,
+        user_id: UUID | None = None,
+        status: TransactionStatus | None = None,
+        is_fraud: bool | None = None,
+    ) -> int: ...
+
+    @abstractmethod
+    async def count_users(self, mode: CountMode) -> int: ...
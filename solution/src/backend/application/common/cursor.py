@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class Cursor:
+    # Позиция последнего отданного элемента: значение колонки сортировки и id для однозначности
+    sort_value: datetime
+    id: UUID
+
+
+class CursorCodec(Protocol):
+    @abstractmethod
+    def encode(self, cursor: Cursor, scope: str) -> str: ...
+
+    @abstractmethod
+    def decode(self, token: str, scope: str) -> Cursor: ...
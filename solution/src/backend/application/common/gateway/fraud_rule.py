@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from collections.abc import Sequence
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -28,4 +29,5 @@ class FraudRuleEvaluationResultGateway(Protocol):
     async def get_many(
         self,
         transaction_id: UUID | None = None,
+        created_at: datetime | None = None,
     ) -> Sequence[FraudRuleEvaluationResult]: ...
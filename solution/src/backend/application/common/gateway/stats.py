@@ -0,0 +1,39 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+
+from backend.application.stats.dto import MerchantStats, RuleMatchStats, StatsBucket
+from backend.domain.misc_types import StatsGroupBy, TransactionChannel
+
+
+class StatsGateway(Protocol):
+    @abstractmethod
+    async def get_totals(self, from_: datetime, to: datetime) -> StatsBucket: ...
+
+    @abstractmethod
+    async def get_top_risk_merchants(
+        self,
+        from_: datetime,
+        to: datetime,
+        limit: int,
+        merchant_category_code: str | None = None,
+    ) -> Sequence[MerchantStats]: ...
+
+    @abstractmethod
+    async def get_timeseries(
+        self,
+        from_: datetime,
+        to: datetime,
+        group_by: StatsGroupBy,
+        timezone: str,
+        channel: TransactionChannel | None = None,
+    ) -> Sequence[StatsBucket]: ...
+
+    @abstractmethod
+    async def get_rule_matches(
+        self,
+        from_: datetime,
+        to: datetime,
+        limit: int,
+    ) -> Sequence[RuleMatchStats]: ...
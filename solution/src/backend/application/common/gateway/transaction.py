@@ -4,6 +4,8 @@ from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
+from backend.application.common.cursor import Cursor
+from backend.domain.entity.fraud_rule import FraudRuleEvaluationResult
 from backend.domain.entity.transaction import Transaction
 from backend.domain.misc_types import TransactionStatus
 
@@ -22,6 +24,7 @@ class TransactionGateway(Protocol):
         user_id: UUID | None = None,
         status: TransactionStatus | None = None,
         is_fraud: bool | None = None,
+        after: Cursor | None = None,
     ) -> Sequence[Transaction]: ...
 
     @abstractmethod
@@ -33,3 +36,17 @@ class TransactionGateway(Protocol):
         status: TransactionStatus | None = None,
         is_fraud: bool | None = None,
     ) -> int | None: ...
+
+    @abstractmethod
+    async def add(
+        self,
+        transaction: Transaction,
+        rule_results: Sequence[FraudRuleEvaluationResult],
+    ) -> None: ...
+
+    @abstractmethod
+    async def add_many(
+        self,
+        transactions: Sequence[Transaction],
+        rule_results: Sequence[FraudRuleEvaluationResult],
+    ) -> None: ...
@@ -1,8 +1,9 @@
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from typing import Protocol
 from uuid import UUID
 
+from backend.application.common.cursor import Cursor
 from backend.domain.entity.user import User
 
 
@@ -10,11 +11,14 @@ class UserGateway(Protocol):
     @abstractmethod
     async def get_by_id(self, id: UUID) -> User | None: ...
 
+    @abstractmethod
+    async def get_many_by_ids(self, ids: Collection[UUID]) -> Sequence[User]: ...
+
     @abstractmethod
     async def get_by_email(self, email: str) -> User | None: ...
 
     @abstractmethod
-    async def get_many(self, offset: int, size: int) -> Sequence[User]: ...
+    async def get_many(self, offset: int, size: int, after: Cursor | None = None) -> Sequence[User]: ...
 
     @abstractmethod
     async def get_count(self) -> int | None: ...
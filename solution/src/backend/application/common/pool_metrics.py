@@ -0,0 +1,11 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from backend.application.stats.dto import DBPoolStats
+
+
+class DBPoolMetrics(Protocol):
+    """Состояние пула соединений с БД текущего воркера."""
+
+    @abstractmethod
+    def get(self) -> DBPoolStats: ...
@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from backend.application.stats.dto import UserRiskCounters
+from backend.domain.entity.transaction import Transaction
+
+
+class RiskProfileCounters(Protocol):
+    """Онлайн-счётчики профиля риска пользователя, обновляются при каждой записи транзакций."""
+
+    @abstractmethod
+    async def record(self, transactions: Sequence[Transaction]) -> None: ...
+
+    @abstractmethod
+    async def get(self, user_id: UUID, now: datetime) -> UserRiskCounters | None:
+        """None, если счётчики сейчас недоступны."""
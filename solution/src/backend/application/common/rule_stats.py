@@ -0,0 +1,28 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+
+from backend.application.stats.dto import RuleMatchStats
+from backend.domain.entity.fraud_rule import FraudRule, FraudRuleEvaluationResult
+from backend.domain.entity.transaction import Transaction
+
+
+class RuleMatchCounters(Protocol):
+    """Почасовые счётчики срабатываний правил со скетчами уникальных пользователей и мерчантов."""
+
+    @abstractmethod
+    async def record(
+        self,
+        transactions: Sequence[Transaction],
+        rule_results: Sequence[FraudRuleEvaluationResult],
+    ) -> None: ...
+
+    @abstractmethod
+    async def get(
+        self,
+        rules: Sequence[FraudRule],
+        from_: datetime,
+        to: datetime,
+    ) -> list[RuleMatchStats] | None:
+        """None, если счётчики сейчас недоступны."""
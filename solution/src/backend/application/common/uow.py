@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Protocol
 
 
@@ -15,3 +16,13 @@ class UoW(Protocol):
 
     @abstractmethod
     async def flush(self, objects: Sequence[Any] | None = None) -> None: ...
+
+    @abstractmethod
+    def begin_nested(self) -> AbstractAsyncContextManager[Any]: ...
+
+
+class ReadOnlyMode(Protocol):
+    """Переводит сессию запроса в READ ONLY (на реплику, если она есть), пока сессия не начала транзакцию."""
+
+    @abstractmethod
+    async def enable(self) -> None: ...
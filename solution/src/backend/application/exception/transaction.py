@@ -6,6 +6,9 @@ from backend.application.exception.base import ApplicationError
 class TransactionDoesNotExistError(ApplicationError): ...
 
 
+class TransactionPersistError(ApplicationError): ...
+
+
 class FromGreaterThanToError(ApplicationError): ...
 
 
@@ -6,3 +6,4 @@ from backend.application.forms.base import BaseForm
 class PagginationForm(BaseForm):
     page: int = Field(ge=0)
     size: int = Field(ge=1, le=100)
+    cursor: str | None = Field(default=None)
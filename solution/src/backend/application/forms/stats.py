@@ -0,0 +1,33 @@
+from datetime import UTC, datetime, timedelta
+
+from pydantic import Field
+
+from backend.application.forms.base import BaseForm
+from backend.domain.misc_types import StatsGroupBy, TransactionChannel
+
+
+class StatsOverviewForm(BaseForm):
+    from_: datetime = Field(alias="from", default_factory=lambda: datetime.now(tz=UTC) - timedelta(days=30))
+    to: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
+
+
+class MerchantRiskForm(BaseForm):
+    from_: datetime = Field(alias="from", default_factory=lambda: datetime.now(tz=UTC) - timedelta(days=30))
+    to: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
+    merchant_category_code: str | None = Field(default=None, alias="merchantCategoryCode", pattern=r"^\d{4}$")
+    top: int = Field(default=50, ge=1, le=200)
+
+
+class TransactionsTimeSeriesForm(BaseForm):
+    from_: datetime = Field(alias="from", default_factory=lambda: datetime.now(tz=UTC) - timedelta(days=7))
+    to: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
+    group_by: StatsGroupBy = Field(alias="groupBy", default=StatsGroupBy.DAY)
+    timezone: str = Field(default="UTC")
+    channel: TransactionChannel | None = Field(default=None)
+
+
+class RuleMatchesForm(BaseForm):
+    from_: datetime = Field(alias="from", default_factory=lambda: datetime.now(tz=UTC) - timedelta(days=30))
+    to: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
+    top: int = Field(default=20, ge=1, le=100)
+    exact: bool = Field(default=False)
@@ -1,6 +1,6 @@
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import Self
+from typing import Any, Self
 from uuid import UUID
 
 from pydantic import Field, model_validator
@@ -44,6 +44,11 @@ class TransactionForm(BaseForm):
     metadata: MetaDataJSON | None = Field(default=None)
 
 
+class TransactionBatchForm(BaseForm):
+    # Элементы валидируются по отдельности, чтобы ошибка одного не отклоняла всю пачку
+    items: list[dict[str, Any]] = Field(min_length=1, max_length=500)
+
+
 class AdminTransactionForm(BaseForm):
     user_id: UUID = Field(alias="userId")
     amount: Decimal = Field(ge=Decimal("0.01"), le=Decimal("999999999.99"))
@@ -68,3 +73,4 @@ class ManyTransactionReadForm(BaseForm):
     is_fraud: bool | None = Field(alias="isFraud", default=None)
     from_: datetime = Field(alias="from", default_factory=lambda: datetime.now(tz=UTC) - timedelta(days=90))
     to: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
+    cursor: str | None = Field(default=None)
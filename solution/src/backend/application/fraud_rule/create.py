@@ -1,5 +1,6 @@
 from uuid import uuid4
 
+from backend.application.common.cache import CacheInvalidator
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.fraud_rule import FraudRuleGateway
 from backend.application.common.idp import UserIdProvider
@@ -19,6 +20,7 @@ from backend.domain.service.dsl.parser import DSLParser
 @interactor
 class CreateFraudRule:
     uow: UoW
+    cache_invalidator: CacheInvalidator
     gateway: FraudRuleGateway
     idp: UserIdProvider
     dsl_validator: ValidateDSL
@@ -51,5 +53,6 @@ class CreateFraudRule:
         self.uow.add(fraud_rule)
         await self.uow.flush((fraud_rule,))
         await self.uow.commit()
+        await self.cache_invalidator.invalidate_rules()
 
         return fraud_rule
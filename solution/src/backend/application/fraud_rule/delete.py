@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from backend.application.common.cache import CacheInvalidator
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.fraud_rule import FraudRuleGateway
 from backend.application.common.idp import UserIdProvider
@@ -14,6 +15,7 @@ class DeleteFraudRule:
     idp: UserIdProvider
     gateway: FraudRuleGateway
     uow: UoW
+    cache_invalidator: CacheInvalidator
 
     async def execute(self, id: UUID) -> None:
         viewer = await self.idp.get_user()
@@ -27,3 +29,4 @@ class DeleteFraudRule:
         fraud_rule.enabled = False
 
         await self.uow.commit()
+        await self.cache_invalidator.invalidate_rules()
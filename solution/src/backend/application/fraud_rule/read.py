@@ -3,6 +3,7 @@ from uuid import UUID
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.fraud_rule import FraudRuleGateway
 from backend.application.common.idp import UserIdProvider
+from backend.application.common.uow import ReadOnlyMode
 from backend.application.exception.base import ForbiddenError
 from backend.application.exception.fraud_rule import FraudRuleDoesNotExistError
 from backend.domain.entity.fraud_rule import FraudRule
@@ -13,8 +14,11 @@ from backend.domain.misc_types import Role
 class ReadFraudRule:
     idp: UserIdProvider
     gateway: FraudRuleGateway
+    read_only: ReadOnlyMode
 
     async def execute(self, id: UUID) -> FraudRule:
+        await self.read_only.enable()
+
         viewer = await self.idp.get_user()
 
         if viewer.role != Role.ADMIN:
@@ -32,8 +36,11 @@ class ReadFraudRule:
 class ReadFraudRules:
     gateway: FraudRuleGateway
     idp: UserIdProvider
+    read_only: ReadOnlyMode
 
     async def execute(self) -> list[FraudRule]:
+        await self.read_only.enable()
+
         viewer = await self.idp.get_user()
 
         if viewer.role != Role.ADMIN:
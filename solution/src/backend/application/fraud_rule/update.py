@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
+from backend.application.common.cache import CacheInvalidator
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.fraud_rule import FraudRuleGateway
 from backend.application.common.idp import UserIdProvider
@@ -21,6 +22,7 @@ class UpdateFraudRule:
     idp: UserIdProvider
     gateway: FraudRuleGateway
     uow: UoW
+    cache_invalidator: CacheInvalidator
     dsl_validator: ValidateDSL
 
     async def execute(self, form: UpdateFraudRuleForm, id: UUID) -> FraudRule:
@@ -45,5 +47,6 @@ class UpdateFraudRule:
         fraud_rule.updated_at = datetime.now(tz=UTC)
 
         await self.uow.commit()
+        await self.cache_invalidator.invalidate_rules()
 
         return fraud_rule
@@ -0,0 +1,107 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from backend.domain.entity.fraud_rule import FraudRule
+from backend.domain.exception.dsl import DSLError
+from backend.domain.service.dsl.ast_node import ASTNode
+from backend.domain.service.dsl.compile import CompiledDSL, compile_ast
+from backend.domain.service.dsl.lex import Lexer
+from backend.domain.service.dsl.normalize import normalize_ast, reorder_by_cost
+from backend.domain.service.dsl.parser import DSLParser
+from backend.domain.service.dsl.validation import validate_dsl
+from backend.domain.service.dsl.vectorize import VectorizedDSL, vectorize_ast
+
+DEFAULT_MAX_SIZE = 1024
+
+type RuleCacheKey = tuple[UUID, datetime]
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledRule:
+    # predicate = None - правило не удалось скомпилировать, при оценке оно всегда считается несработавшим
+    ast: ASTNode | None
+    predicate: CompiledDSL | None
+    batch_predicate: VectorizedDSL | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.predicate is not None
+
+
+def compile_rule(dsl_expression: str, reorder: bool = True) -> CompiledRule:
+    ast = None
+
+    try:
+        validate_dsl(dsl_expression)
+        tokens = Lexer(dsl_expression).tokenize()
+        ast = normalize_ast(DSLParser(tokens).parse())
+        if reorder:
+            ast = reorder_by_cost(ast)
+        predicate = compile_ast(ast)
+        batch_predicate = vectorize_ast(ast)
+    except DSLError:
+        return CompiledRule(ast=ast, predicate=None)
+
+    return CompiledRule(ast=ast, predicate=predicate, batch_predicate=batch_predicate)
+
+
+@dataclass(slots=True)
+class CompiledRuleCache:
+    """Процессный LRU-кэш разобранных правил.
+
+    Ключ - (id правила, updated_at), поэтому каждая версия правила разбирается один раз.
+    """
+
+    max_size: int = DEFAULT_MAX_SIZE
+    reorder: bool = True
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict[RuleCacheKey, CompiledRule] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    _versions: dict[UUID, datetime] = field(default_factory=dict, init=False, repr=False)
+
+    def get(self, rule: FraudRule) -> CompiledRule:
+        key = (rule.id, rule.updated_at)
+
+        if (compiled_rule := self._entries.get(key)) is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return compiled_rule
+
+        self.misses += 1
+        compiled_rule = compile_rule(rule.dsl_expression, reorder=self.reorder)
+        self._put(key, compiled_rule)
+
+        return compiled_rule
+
+    def _put(self, key: RuleCacheKey, compiled_rule: CompiledRule) -> None:
+        rule_id, updated_at = key
+
+        # Старая версия правила больше не понадобится
+        if (previous := self._versions.get(rule_id)) is not None and previous != updated_at:
+            self._entries.pop((rule_id, previous), None)
+
+        self._versions[rule_id] = updated_at
+        self._entries[key] = compiled_rule
+
+        while len(self._entries) > self.max_size:
+            (evicted_id, evicted_updated_at), _ = self._entries.popitem(last=False)
+            if self._versions.get(evicted_id) == evicted_updated_at:
+                del self._versions[evicted_id]
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._versions.clear()
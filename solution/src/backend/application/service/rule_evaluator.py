@@ -1,16 +1,16 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from uuid import uuid4
 
 from backend.application.common.decorator import interactor
-from backend.application.common.gateway.fraud_rule import FraudRuleGateway
-from backend.domain.entity.fraud_rule import FraudRuleEvaluationResult
+from backend.application.service.rule_cache import CompiledRuleCache
+from backend.application.service.rule_snapshot import EnabledRules
+from backend.domain.entity.fraud_rule import FraudRule, FraudRuleEvaluationResult
 from backend.domain.entity.transaction import Transaction
 from backend.domain.exception.dsl import DSLError
 from backend.domain.misc_types import TransactionStatus
-from backend.domain.service.dsl.evaluate import DSLEvaluator
-from backend.domain.service.dsl.lex import Lexer
-from backend.domain.service.dsl.parser import DSLParser
-from backend.domain.service.dsl.validation import validate_dsl
+from backend.domain.service.dsl.compile import build_context
+from backend.domain.service.dsl.vectorize import build_columns
 
 
 @dataclass(slots=True, frozen=True)
@@ -20,48 +20,95 @@ class RuleEvaluatorResult:
     rule_results: list[FraudRuleEvaluationResult]
 
 
+def build_evaluator_result(
+    transaction: Transaction,
+    rules: Sequence[FraudRule],
+    matches: Sequence[bool],
+) -> RuleEvaluatorResult:
+    rule_results: list[FraudRuleEvaluationResult] = []
+
+    is_fraud = False
+    status = TransactionStatus.APPROVED
+
+    for rule, result in zip(rules, matches, strict=True):
+        if result is True:
+            is_fraud = True
+            status = TransactionStatus.DECLINED
+
+        description = f'Правило "{rule.dsl_expression}" {"сработало" if result else "не сработало"}'
+
+        rule_result = FraudRuleEvaluationResult(
+            id=uuid4(),
+            transaction_id=transaction.id,
+            rule_id=rule.id,
+            rule_name=rule.name,
+            priority=rule.priority,
+            matched=result,
+            description=description,
+            created_at=transaction.created_at,
+        )
+
+        rule_results.append(rule_result)
+
+    return RuleEvaluatorResult(
+        status=status,
+        is_fraud=is_fraud,
+        rule_results=rule_results,
+    )
+
+
 @interactor
 class RuleEvaluator:
-    rule_gateway: FraudRuleGateway
+    enabled_rules: EnabledRules
+    rule_cache: CompiledRuleCache
 
     async def execute(self, transaction: Transaction) -> RuleEvaluatorResult:
-        rule_results: list[FraudRuleEvaluationResult] = []
+        context = build_context(transaction)
+        enabled_rules = await self.enabled_rules.execute()
+        matches: list[bool] = []
+
+        for rule in enabled_rules:
+            compiled_rule = self.rule_cache.get(rule)
 
-        is_fraud = False
-        status = TransactionStatus.APPROVED
+            result = False
+            if compiled_rule.predicate is not None:
+                try:
+                    result = compiled_rule.predicate(context)
+                except DSLError:
+                    result = False
 
-        dsl_evaluator = DSLEvaluator(transaction=transaction)
-        enabled_rules = list(await self.rule_gateway.get_many_by_priority(enabled=True))
+            matches.append(result)
+
+        return build_evaluator_result(transaction, enabled_rules, matches)
+
+
+@interactor
+class BatchRuleEvaluator:
+    """Оценивает пачку транзакций: каждое правило применяется один раз ко всем столбцам сразу.
+
+    Результаты совпадают с RuleEvaluator для каждой транзакции по отдельности.
+    """
+
+    enabled_rules: EnabledRules
+    rule_cache: CompiledRuleCache
+
+    async def execute(self, transactions: Sequence[Transaction]) -> list[RuleEvaluatorResult]:
+        if not transactions:
+            return []
+
+        columns = build_columns(transactions)
+        enabled_rules = await self.enabled_rules.execute()
+        rule_matches: list[list[bool]] = []
 
         for rule in enabled_rules:
-            try:
-                validate_dsl(rule.dsl_expression)
-                tokens = Lexer(rule.dsl_expression).tokenize()
-                ast = DSLParser(tokens).parse()
-                result = dsl_evaluator.eval(ast)
-            except DSLError:
-                result = False
-
-            if result is True:
-                is_fraud = True
-                status = TransactionStatus.DECLINED
-
-            description = f'Правило "{rule.dsl_expression}" {"сработало" if result else "не сработало"}'
-
-            rule_result = FraudRuleEvaluationResult(
-                id=uuid4(),
-                transaction_id=transaction.id,
-                rule_id=rule.id,
-                rule_name=rule.name,
-                priority=rule.priority,
-                matched=result,
-                description=description,
-            )
-
-            rule_results.append(rule_result)
-
-        return RuleEvaluatorResult(
-            status=status,
-            is_fraud=is_fraud,
-            rule_results=rule_results,
-        )
+            compiled_rule = self.rule_cache.get(rule)
+
+            if compiled_rule.batch_predicate is None:
+                rule_matches.append([False] * len(transactions))
+            else:
+                rule_matches.append(compiled_rule.batch_predicate(columns).tolist())
+
+        return [
+            build_evaluator_result(transaction, enabled_rules, [matches[i] for matches in rule_matches])
+            for i, transaction in enumerate(transactions)
+        ]
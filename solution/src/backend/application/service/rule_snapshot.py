@@ -0,0 +1,78 @@
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+
+from backend.application.common.decorator import interactor
+from backend.application.common.gateway.fraud_rule import FraudRuleGateway
+from backend.domain.entity.fraud_rule import FraudRule
+
+DEFAULT_TTL = 30.0
+
+
+@dataclass(slots=True, frozen=True)
+class RuleSnapshot:
+    rules: tuple[FraudRule, ...]
+    loaded_at: float
+
+
+@dataclass(slots=True)
+class EnabledRuleSnapshot:
+    """Процессный снимок включённых правил, отсортированных по приоритету.
+
+    Сбрасывается явно (invalidate) после изменения правил и, на случай потерянного
+    сообщения об инвалидации, по истечении ttl секунд.
+    """
+
+    ttl: float = DEFAULT_TTL
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _snapshot: RuleSnapshot | None = field(default=None, init=False, repr=False)
+    # Растёт при каждой инвалидации, чтобы не сохранить снимок, загруженный до неё
+    _version: int = field(default=0, init=False, repr=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self) -> tuple[FraudRule, ...] | None:
+        snapshot = self._snapshot
+
+        if snapshot is None or time.monotonic() - snapshot.loaded_at > self.ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return snapshot.rules
+
+    def put(self, rules: Sequence[FraudRule], version: int) -> tuple[FraudRule, ...]:
+        # Копии не привязаны к сессии, в которой были загружены
+        snapshot_rules = tuple(replace(rule) for rule in rules)
+
+        if version == self._version:
+            self._snapshot = RuleSnapshot(rules=snapshot_rules, loaded_at=time.monotonic())
+
+        return snapshot_rules
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._snapshot = None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@interactor
+class EnabledRules:
+    rule_gateway: FraudRuleGateway
+    snapshot: EnabledRuleSnapshot
+
+    async def execute(self) -> tuple[FraudRule, ...]:
+        if (rules := self.snapshot.get()) is not None:
+            return rules
+
+        version = self.snapshot.version
+        rules_from_db = await self.rule_gateway.get_many_by_priority(enabled=True)
+
+        return self.snapshot.put(rules_from_db, version)
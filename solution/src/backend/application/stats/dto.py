@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class StatsBucket:
+    bucket_start: datetime
+    tx_count: int
+    gmv: Decimal
+    approved_count: int
+    declined_count: int
+
+
+@dataclass(slots=True, frozen=True)
+class MerchantStats:
+    merchant_id: str
+    merchant_category_code: str | None
+    tx_count: int
+    gmv: Decimal
+    declined_count: int
+
+
+@dataclass(slots=True, frozen=True)
+class MerchantRiskRow:
+    merchant_id: str
+    merchant_category_code: str | None
+    tx_count: int
+    gmv: float
+    decline_rate: float
+
+
+@dataclass(slots=True, frozen=True)
+class StatsOverview:
+    from_: datetime
+    to: datetime
+    volume: int
+    gmv: float
+    approval_rate: float
+    decline_rate: float
+    top_risk_merchants: list[MerchantRiskRow]
+
+
+@dataclass(slots=True, frozen=True)
+class MerchantRiskLeaderboard:
+    from_: datetime
+    to: datetime
+    items: list[MerchantRiskRow]
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionsTimePoint:
+    bucket_start: datetime
+    tx_count: int
+    gmv: float
+    approval_rate: float
+    decline_rate: float
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionsTimeSeries:
+    points: list[TransactionsTimePoint]
+
+
+@dataclass(slots=True, frozen=True)
+class UserRiskCounters:
+    tx_count_24h: int
+    gmv_24h: Decimal
+    distinct_devices_24h: int
+    distinct_ips_24h: int
+    distinct_cities_24h: int
+    tx_count_30d: int
+    declined_count_30d: int
+    last_seen_at: datetime | None
+
+
+NO_RISK_COUNTERS = UserRiskCounters(
+    tx_count_24h=0,
+    gmv_24h=Decimal(0),
+    distinct_devices_24h=0,
+    distinct_ips_24h=0,
+    distinct_cities_24h=0,
+    tx_count_30d=0,
+    declined_count_30d=0,
+    last_seen_at=None,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class UserRiskProfile:
+    user_id: UUID
+    tx_count_24h: int
+    gmv_24h: float
+    distinct_devices_24h: int
+    distinct_ips_24h: int
+    distinct_cities_24h: int
+    decline_rate_30d: float
+    last_seen_at: datetime | None
+
+
+@dataclass(slots=True, frozen=True)
+class RuleMatchStats:
+    rule_id: UUID
+    rule_name: str
+    matches: int
+    unique_users: int
+    unique_merchants: int
+    declined_matches: int
+
+
+@dataclass(slots=True, frozen=True)
+class RuleMatchRow:
+    rule_id: UUID
+    rule_name: str
+    matches: int
+    unique_users: int
+    unique_merchants: int
+    share_of_declines: float
+
+
+@dataclass(slots=True, frozen=True)
+class RuleMatchesStats:
+    from_: datetime
+    to: datetime
+    exact: bool
+    items: list[RuleMatchRow]
+
+
+@dataclass(slots=True, frozen=True)
+class DBPoolStats:
+    worker_pid: int
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
@@ -0,0 +1,288 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from backend.application.common.decorator import interactor
+from backend.application.common.gateway.fraud_rule import FraudRuleGateway
+from backend.application.common.gateway.stats import StatsGateway
+from backend.application.common.gateway.user import UserGateway
+from backend.application.common.idp import UserIdProvider
+from backend.application.common.pool_metrics import DBPoolMetrics
+from backend.application.common.risk_profile import RiskProfileCounters
+from backend.application.common.rule_stats import RuleMatchCounters
+from backend.application.common.uow import ReadOnlyMode
+from backend.application.exception.base import CustomValidationError, ForbiddenError
+from backend.application.exception.user import UserDoesNotExistError
+from backend.application.forms.stats import (
+    MerchantRiskForm,
+    RuleMatchesForm,
+    StatsOverviewForm,
+    TransactionsTimeSeriesForm,
+)
+from backend.application.stats.dto import (
+    NO_RISK_COUNTERS,
+    DBPoolStats,
+    MerchantRiskLeaderboard,
+    MerchantRiskRow,
+    MerchantStats,
+    RuleMatchesStats,
+    RuleMatchRow,
+    RuleMatchStats,
+    StatsOverview,
+    TransactionsTimePoint,
+    TransactionsTimeSeries,
+    UserRiskProfile,
+)
+from backend.domain.misc_types import Role, StatsGroupBy
+
+MAX_PERIOD = timedelta(days=90)
+MAX_HOURLY_PERIOD = timedelta(days=7)
+MAX_WEEKLY_PERIOD = timedelta(days=365)
+# Предел интервала временного ряда зависит от размера бакета
+MAX_TIMESERIES_PERIOD = {
+    StatsGroupBy.HOUR: MAX_HOURLY_PERIOD,
+    StatsGroupBy.DAY: MAX_PERIOD,
+    StatsGroupBy.WEEK: MAX_WEEKLY_PERIOD,
+}
+TOP_RISK_MERCHANTS = 10
+
+
+def validate_period(from_: datetime, to: datetime, max_period: timedelta) -> None:
+    if from_ >= to:
+        raise CustomValidationError(field="from", rejected_value=from_, issue="Некорректный from")
+
+    if to - from_ > max_period:
+        raise CustomValidationError(field="to", rejected_value=to, issue="Слишком большой интервал дат")
+
+
+def round_gmv(gmv: Decimal) -> float:
+    return float(gmv.quantize(Decimal("0.00"), rounding=ROUND_HALF_UP))
+
+
+def share(part: int, total: int) -> float:
+    return part / total if total else 0.0
+
+
+def build_merchant_risk_row(merchant: MerchantStats) -> MerchantRiskRow:
+    return MerchantRiskRow(
+        merchant_id=merchant.merchant_id,
+        merchant_category_code=merchant.merchant_category_code,
+        tx_count=merchant.tx_count,
+        gmv=round_gmv(merchant.gmv),
+        decline_rate=share(merchant.declined_count, merchant.tx_count),
+    )
+
+
+@interactor
+class ReadStatsOverview:
+    idp: UserIdProvider
+    gateway: StatsGateway
+    read_only: ReadOnlyMode
+
+    async def execute(self, form: StatsOverviewForm) -> StatsOverview:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        validate_period(form.from_, form.to, MAX_PERIOD)
+
+        totals = await self.gateway.get_totals(form.from_, form.to)
+        merchants = await self.gateway.get_top_risk_merchants(form.from_, form.to, TOP_RISK_MERCHANTS)
+
+        return StatsOverview(
+            from_=form.from_,
+            to=form.to,
+            volume=totals.tx_count,
+            gmv=round_gmv(totals.gmv),
+            approval_rate=share(totals.approved_count, totals.tx_count),
+            decline_rate=share(totals.declined_count, totals.tx_count),
+            top_risk_merchants=[build_merchant_risk_row(merchant) for merchant in merchants],
+        )
+
+
+@interactor
+class ReadMerchantRisk:
+    idp: UserIdProvider
+    gateway: StatsGateway
+    read_only: ReadOnlyMode
+
+    async def execute(self, form: MerchantRiskForm) -> MerchantRiskLeaderboard:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        validate_period(form.from_, form.to, MAX_PERIOD)
+
+        merchants = await self.gateway.get_top_risk_merchants(
+            form.from_,
+            form.to,
+            form.top,
+            merchant_category_code=form.merchant_category_code,
+        )
+
+        return MerchantRiskLeaderboard(
+            from_=form.from_,
+            to=form.to,
+            items=[build_merchant_risk_row(merchant) for merchant in merchants],
+        )
+
+
+@interactor
+class ReadTransactionsTimeSeries:
+    idp: UserIdProvider
+    gateway: StatsGateway
+    read_only: ReadOnlyMode
+
+    async def execute(self, form: TransactionsTimeSeriesForm) -> TransactionsTimeSeries:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        validate_period(form.from_, form.to, MAX_TIMESERIES_PERIOD[form.group_by])
+
+        try:
+            ZoneInfo(form.timezone)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise CustomValidationError(
+                field="timezone",
+                rejected_value=form.timezone,
+                issue="Неизвестный часовой пояс",
+            ) from e
+
+        buckets = await self.gateway.get_timeseries(
+            form.from_,
+            form.to,
+            group_by=form.group_by,
+            timezone=form.timezone,
+            channel=form.channel,
+        )
+
+        return TransactionsTimeSeries(
+            points=[
+                TransactionsTimePoint(
+                    bucket_start=bucket.bucket_start,
+                    tx_count=bucket.tx_count,
+                    gmv=round_gmv(bucket.gmv),
+                    approval_rate=share(bucket.approved_count, bucket.tx_count),
+                    decline_rate=share(bucket.declined_count, bucket.tx_count),
+                )
+                for bucket in buckets
+            ],
+        )
+
+
+@interactor
+class ReadUserRiskProfile:
+    idp: UserIdProvider
+    user_gateway: UserGateway
+    counters: RiskProfileCounters
+    read_only: ReadOnlyMode
+
+    async def execute(self, id: UUID) -> UserRiskProfile:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if id != viewer.id:
+            if viewer.role != Role.ADMIN:
+                raise ForbiddenError
+
+            if await self.user_gateway.get_by_id(id) is None:
+                raise UserDoesNotExistError
+
+        counters = await self.counters.get(id, datetime.now(tz=UTC))
+        # Профиль строится только по онлайн-счётчикам, при недоступном Redis отдаём пустой
+        if counters is None:
+            counters = NO_RISK_COUNTERS
+
+        return UserRiskProfile(
+            user_id=id,
+            tx_count_24h=counters.tx_count_24h,
+            gmv_24h=round_gmv(counters.gmv_24h),
+            distinct_devices_24h=counters.distinct_devices_24h,
+            distinct_ips_24h=counters.distinct_ips_24h,
+            distinct_cities_24h=counters.distinct_cities_24h,
+            decline_rate_30d=share(counters.declined_count_30d, counters.tx_count_30d),
+            last_seen_at=counters.last_seen_at,
+        )
+
+
+@interactor
+class ReadRuleMatches:
+    idp: UserIdProvider
+    gateway: StatsGateway
+    rule_gateway: FraudRuleGateway
+    counters: RuleMatchCounters
+    read_only: ReadOnlyMode
+
+    async def execute(self, form: RuleMatchesForm) -> RuleMatchesStats:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        validate_period(form.from_, form.to, MAX_PERIOD)
+
+        exact = form.exact
+        counted = None
+        if not exact:
+            rules = await self.rule_gateway.get_many()
+            counted = await self.counters.get(rules, form.from_, form.to)
+
+        # exact - аудит: точный JOIN результатов с транзакциями вместо счётчиков и HyperLogLog.
+        # К нему же откатываемся, если счётчики недоступны
+        rule_stats_rows: Sequence[RuleMatchStats]
+        if counted is None:
+            exact = True
+            rule_stats_rows = await self.gateway.get_rule_matches(form.from_, form.to, form.top)
+        else:
+            counted.sort(key=lambda rule_stats: rule_stats.matches, reverse=True)
+            rule_stats_rows = counted[: form.top]
+
+        # Любое срабатывание отклоняет транзакцию, поэтому доля считается от всех отклонённых за окно
+        totals = await self.gateway.get_totals(form.from_, form.to)
+
+        return RuleMatchesStats(
+            from_=form.from_,
+            to=form.to,
+            exact=exact,
+            items=[
+                RuleMatchRow(
+                    rule_id=rule_stats.rule_id,
+                    rule_name=rule_stats.rule_name,
+                    matches=rule_stats.matches,
+                    unique_users=rule_stats.unique_users,
+                    unique_merchants=rule_stats.unique_merchants,
+                    share_of_declines=share(rule_stats.declined_matches, totals.declined_count),
+                )
+                for rule_stats in rule_stats_rows
+            ],
+        )
+
+
+@interactor
+class ReadDBPoolStats:
+    idp: UserIdProvider
+    pool_metrics: DBPoolMetrics
+
+    async def execute(self) -> DBPoolStats:
+        viewer = await self.idp.get_user()
+
+        if viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        # Пул у каждого воркера свой, ответ описывает только воркер, принявший запрос
+        return self.pool_metrics.get()
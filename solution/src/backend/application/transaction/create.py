@@ -1,111 +1,229 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
 
 from backend.application.common.decorator import interactor
-from backend.application.common.gateway.fraud_rule import FraudRuleGateway
 from backend.application.common.gateway.transaction import TransactionGateway
 from backend.application.common.gateway.user import UserGateway
 from backend.application.common.idp import UserIdProvider
+from backend.application.common.risk_profile import RiskProfileCounters
+from backend.application.common.rule_stats import RuleMatchCounters
 from backend.application.common.uow import UoW
-from backend.application.exception.base import CustomValidationError, ForbiddenError
+from backend.application.exception.base import ApplicationError, CustomValidationError, ForbiddenError
+from backend.application.exception.transaction import TransactionPersistError
 from backend.application.exception.user import UserDoesNotExistError
-from backend.application.forms.transaction import TransactionForm
-from backend.application.service.rule_evaluator import RuleEvaluator
-from backend.application.transaction.dto import FraudRuleEvaluationResultDTO, TransactionDecision
+from backend.application.forms.transaction import TransactionBatchForm, TransactionForm
+from backend.application.service.rule_evaluator import BatchRuleEvaluator, RuleEvaluator, RuleEvaluatorResult
+from backend.application.transaction.dto import (
+    FraudRuleEvaluationResultDTO,
+    TransactionBatchItem,
+    TransactionBatchResult,
+    TransactionDecision,
+)
+from backend.domain.entity.fraud_rule import FraudRuleEvaluationResult
 from backend.domain.entity.transaction import Transaction, TransactionLocation
+from backend.domain.entity.user import User
 from backend.domain.misc_types import Role, TransactionStatus
 
 
+def resolve_user_id(viewer: User, form: TransactionForm) -> UUID:
+    if viewer.role == Role.USER:
+        return viewer.id
+
+    if form.user_id is None:
+        raise CustomValidationError(field="userId", rejected_value=None, issue="UserId Отсуствует")
+
+    return form.user_id
+
+
+def build_transaction(form: TransactionForm, user_id: UUID) -> Transaction:
+    location: TransactionLocation | None = None
+    if form.location is not None:
+        location = TransactionLocation(
+            country=form.location.country,
+            city=form.location.city,
+            latitude=form.location.latitude,
+            longitude=form.location.longitude,
+        )
+
+    rounded_amount = form.amount.quantize(Decimal("0.00"), rounding=ROUND_HALF_UP)
+
+    if form.timestamp > (datetime.now(tz=UTC) + timedelta(minutes=5)):
+        raise CustomValidationError(
+            field="timestamp",
+            rejected_value=form.timestamp,
+            issue="Транзакция из далекого будущего",
+        )
+
+    return Transaction(
+        id=uuid4(),
+        user_id=user_id,
+        amount=rounded_amount,
+        currency=form.currency,
+        status=TransactionStatus.APPROVED,
+        merchant_id=form.merchant_id,
+        merchant_category_code=form.merchant_category_code,
+        timestamp=form.timestamp,
+        ip_address=form.ip_address,
+        device_id=form.device_id,
+        channel=form.channel,
+        location=location,
+        metadata=form.metadata,
+        is_fraud=False,
+    )
+
+
+def build_decision(transaction: Transaction, evaluator_result: RuleEvaluatorResult) -> TransactionDecision:
+    transaction.is_fraud = evaluator_result.is_fraud
+    transaction.status = evaluator_result.status
+
+    rule_results_dto = [
+        FraudRuleEvaluationResultDTO(
+            rule_id=result.rule_id,
+            rule_name=result.rule_name,
+            priority=result.priority,
+            matched=result.matched,
+            description=result.description,
+        )
+        for result in evaluator_result.rule_results
+    ]
+
+    return TransactionDecision(transaction=transaction, rule_results=rule_results_dto)
+
+
 @interactor
 class CreateTransaction:
     uow: UoW
     gateway: TransactionGateway
-    rule_gateway: FraudRuleGateway
     idp: UserIdProvider
     user_gateway: UserGateway
     rule_evaluator: RuleEvaluator
+    risk_counters: RiskProfileCounters
+    rule_counters: RuleMatchCounters
 
     async def execute(self, form: TransactionForm) -> TransactionDecision:
         viewer = await self.idp.get_user()
-        user_id = viewer.id
 
         if viewer.is_active is False:
             raise ForbiddenError
 
-        if viewer.role == Role.USER:
-            user_id = viewer.id
-        else:
-            if form.user_id is None:
-                raise CustomValidationError(field="userId", rejected_value=None, issue="UserId Отсуствует")
-            user_id = form.user_id
+        user_id = resolve_user_id(viewer, form)
 
-        if await self.user_gateway.get_by_id(user_id) is None:
+        # Сам пользователь уже загружен idp, проверять нужно только чужой user_id
+        if user_id != viewer.id and await self.user_gateway.get_by_id(user_id) is None:
             raise UserDoesNotExistError
 
-        location: TransactionLocation | None = None
-        if form.location is not None:
-            location = TransactionLocation(
-                country=form.location.country,
-                city=form.location.city,
-                latitude=form.location.latitude,
-                longitude=form.location.longitude,
-            )
+        transaction = build_transaction(form, user_id)
 
-        rounded_amount = form.amount.quantize(Decimal("0.00"), rounding=ROUND_HALF_UP)
+        evaluator_result = await self.rule_evaluator.execute(transaction)
+        transaction_decision = build_decision(transaction, evaluator_result)
 
-        if form.timestamp > (datetime.now(tz=UTC) + timedelta(minutes=5)):
-            raise CustomValidationError(
-                field="timestamp",
-                rejected_value=form.timestamp,
-                issue="Транзакция из далекого будущего",
-            )
+        await self.gateway.add(transaction, evaluator_result.rule_results)
+        await self.uow.commit()
 
-        transaction = Transaction(
-            id=uuid4(),
-            user_id=user_id,
-            amount=rounded_amount,
-            currency=form.currency,
-            status=TransactionStatus.APPROVED,
-            merchant_id=form.merchant_id,
-            merchant_category_code=form.merchant_category_code,
-            timestamp=form.timestamp,
-            ip_address=form.ip_address,
-            device_id=form.device_id,
-            channel=form.channel,
-            location=location,
-            metadata=form.metadata,
-            is_fraud=False,
+        await asyncio.gather(
+            self.risk_counters.record((transaction,)),
+            self.rule_counters.record((transaction,), evaluator_result.rule_results),
         )
 
-        evaluator_result = await self.rule_evaluator.execute(transaction)
-
-        rule_results_dto = [
-            FraudRuleEvaluationResultDTO(
-                rule_id=result.rule_id,
-                rule_name=result.rule_name,
-                priority=result.priority,
-                matched=result.matched,
-                description=result.description,
-            )
-            for result in evaluator_result.rule_results
-        ]
+        return transaction_decision
 
-        transaction.is_fraud = evaluator_result.is_fraud
-        transaction.status = evaluator_result.status
 
-        self.uow.add(transaction)
-        await self.uow.flush((transaction,))
+@interactor
+class CreateTransactionsBatch:
+    uow: UoW
+    gateway: TransactionGateway
+    idp: UserIdProvider
+    user_gateway: UserGateway
+    rule_evaluator: BatchRuleEvaluator
+    risk_counters: RiskProfileCounters
+    rule_counters: RuleMatchCounters
 
-        for rule_result in evaluator_result.rule_results:
-            self.uow.add(rule_result)
-        await self.uow.flush((*evaluator_result.rule_results,))
+    async def execute(self, form: TransactionBatchForm) -> TransactionBatchResult:
+        viewer = await self.idp.get_user()
 
-        await self.uow.commit()
+        if viewer.is_active is False:
+            raise ForbiddenError
 
-        transaction_decision = TransactionDecision(
-            transaction=transaction,
-            rule_results=rule_results_dto,
+        errors: dict[int, Exception] = {}
+        transactions: dict[int, Transaction] = {}
+
+        for index, item in enumerate(form.items):
+            try:
+                item_form = TransactionForm.model_validate(item)
+                transactions[index] = build_transaction(item_form, resolve_user_id(viewer, item_form))
+            except (ValidationError, ApplicationError) as e:
+                errors[index] = e
+
+        # Все упомянутые пользователи загружаются одним запросом
+        user_ids = {transaction.user_id for transaction in transactions.values()} - {viewer.id}
+        existing_ids = {user.id for user in await self.user_gateway.get_many_by_ids(user_ids)} | {viewer.id}
+
+        for index, transaction in list(transactions.items()):
+            if transaction.user_id not in existing_ids:
+                errors[index] = UserDoesNotExistError()
+                del transactions[index]
+
+        evaluator_results = await self.rule_evaluator.execute(list(transactions.values()))
+        decisions = {
+            index: build_decision(transaction, evaluator_result)
+            for (index, transaction), evaluator_result in zip(
+                transactions.items(),
+                evaluator_results,
+                strict=True,
+            )
+        }
+        rule_results = {
+            index: evaluator_result.rule_results
+            for index, evaluator_result in zip(transactions, evaluator_results, strict=True)
+        }
+
+        await self._persist(transactions, rule_results, errors)
+        persisted = [index for index in transactions if index not in errors]
+        await asyncio.gather(
+            self.risk_counters.record([transactions[index] for index in persisted]),
+            self.rule_counters.record(
+                [transactions[index] for index in persisted],
+                [result for index in persisted for result in rule_results[index]],
+            ),
         )
 
-        return transaction_decision
+        items = [
+            TransactionBatchItem(index=index, error=errors[index])
+            if index in errors
+            else TransactionBatchItem(index=index, decision=decisions[index])
+            for index in range(len(form.items))
+        ]
+
+        return TransactionBatchResult(items=items)
+
+    async def _persist(
+        self,
+        transactions: dict[int, Transaction],
+        rule_results: dict[int, list[FraudRuleEvaluationResult]],
+        errors: dict[int, Exception],
+    ) -> None:
+        if not transactions:
+            return
+
+        # Обычно вся пачка пишется многострочными INSERT внутри одной точки сохранения
+        try:
+            async with self.uow.begin_nested():
+                await self.gateway.add_many(
+                    list(transactions.values()),
+                    [result for results in rule_results.values() for result in results],
+                )
+        except TransactionPersistError:
+            # Если пачка не записалась целиком, каждый элемент пишется в своей точке сохранения,
+            # чтобы ошибка одного не откатывала остальные
+            for index, transaction in transactions.items():
+                try:
+                    async with self.uow.begin_nested():
+                        await self.gateway.add_many((transaction,), rule_results[index])
+                except TransactionPersistError as e:
+                    errors[index] = e
+
+        await self.uow.commit()
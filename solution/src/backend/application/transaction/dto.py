@@ -25,3 +25,20 @@ class TransactionsList:
     total: int
     page: int
     size: int
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionBatchItem:
+    index: int
+    decision: TransactionDecision | None = None
+    error: Exception | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionBatchResult:
+    items: list[TransactionBatchItem]
+
+    @property
+    def has_errors(self) -> bool:
+        return any(item.error is not None for item in self.items)
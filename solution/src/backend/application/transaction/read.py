@@ -1,9 +1,13 @@
+import asyncio
 from uuid import UUID
 
+from backend.application.common.count import CountModes, TotalCounter
+from backend.application.common.cursor import Cursor, CursorCodec
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.fraud_rule import FraudRuleEvaluationResultGateway
 from backend.application.common.gateway.transaction import TransactionGateway
 from backend.application.common.idp import UserIdProvider
+from backend.application.common.uow import ReadOnlyMode
 from backend.application.exception.base import CustomValidationError, ForbiddenError
 from backend.application.exception.transaction import (
     TransactionDoesNotExistError,
@@ -16,14 +20,19 @@ from backend.application.transaction.dto import (
 )
 from backend.domain.misc_types import Role
 
+TRANSACTIONS_CURSOR_SCOPE = "transactions"
+
 
 @interactor
 class ReadTransaction:
     idp: UserIdProvider
     transaction_gateway: TransactionGateway
     rule_result_gateway: FraudRuleEvaluationResultGateway
+    read_only: ReadOnlyMode
 
     async def execute(self, id: UUID) -> TransactionDecision:
+        await self.read_only.enable()
+
         viewer = await self.idp.get_user()
 
         transaction = await self.transaction_gateway.get_by_id(id)
@@ -34,7 +43,9 @@ class ReadTransaction:
         if transaction.user_id != viewer.id and viewer.role != Role.ADMIN:
             raise ForbiddenError
 
-        rule_results = list(await self.rule_result_gateway.get_many(transaction_id=id))
+        rule_results = list(
+            await self.rule_result_gateway.get_many(transaction_id=id, created_at=transaction.created_at),
+        )
 
         rule_results_dto = [
             FraudRuleEvaluationResultDTO(
@@ -54,8 +65,14 @@ class ReadTransaction:
 class ReadTransactions:
     gateway: TransactionGateway
     idp: UserIdProvider
+    cursor_codec: CursorCodec
+    counter: TotalCounter
+    count_modes: CountModes
+    read_only: ReadOnlyMode
 
     async def execute(self, form: ManyTransactionReadForm) -> TransactionsList:
+        await self.read_only.enable()
+
         viewer = await self.idp.get_user()
 
         if viewer.role != Role.ADMIN:
@@ -71,23 +88,50 @@ class ReadTransactions:
                 issue="Слишком большой интервал дат",
             )
 
+        # С курсором страница продолжается после него, page не учитывается
+        after = None
         offset = form.page * form.size
+        if form.cursor is not None:
+            after = self.cursor_codec.decode(form.cursor, TRANSACTIONS_CURSOR_SCOPE)
+            offset = 0
+
+        # Лишний элемент показывает, есть ли следующая страница.
+        # total считается в отдельном соединении параллельно со страницей
+        rows, total = await asyncio.gather(
+            self.gateway.get_many(
+                offset=offset,
+                size=form.size + 1,
+                from_=form.from_,
+                to=form.to,
+                user_id=form.user_id,
+                status=form.status,
+                is_fraud=form.is_fraud,
+                after=after,
+            ),
+            self.counter.count_transactions(
+                self.count_modes.transactions,
+                from_=form.from_,
+                to=form.to,
+                user_id=form.user_id,
+                status=form.status,
+                is_fraud=form.is_fraud,
+            ),
+        )
+        transactions = list(rows)
+
+        next_cursor = None
+        if len(transactions) > form.size:
+            transactions = transactions[: form.size]
+            last = transactions[-1]
+            next_cursor = self.cursor_codec.encode(
+                Cursor(sort_value=last.timestamp, id=last.id),
+                TRANSACTIONS_CURSOR_SCOPE,
+            )
 
-        transactions = await self.gateway.get_many(
-            offset=offset,
+        return TransactionsList(
+            items=transactions,
+            total=total,
+            page=form.page,
             size=form.size,
-            from_=form.from_,
-            to=form.to,
-            user_id=form.user_id,
-            status=form.status,
-            is_fraud=form.is_fraud,
+            next_cursor=next_cursor,
         )
-        total = await self.gateway.get_count(
-            from_=form.from_,
-            to=form.to,
-            user_id=form.user_id,
-            status=form.status,
-            is_fraud=form.is_fraud,
-        )
-
-        return TransactionsList(items=list(transactions), total=total or 0, page=form.page, size=form.size)
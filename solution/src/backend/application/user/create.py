@@ -19,7 +19,7 @@ class CreateUser:
     gateway: UserGateway
 
     async def execute(self, form: UserForm) -> User:
-        hashed_password = self.hasher.hash(form.password)
+        hashed_password = await self.hasher.hash(form.password)
 
         if await self.gateway.get_by_email(form.email):
             raise EmailAlreadyExistsError(email=form.email)
@@ -55,7 +55,7 @@ class CreateAdminUser:
         if viewer.role != Role.ADMIN:
             raise ForbiddenError
 
-        hashed_password = self.hasher.hash(form.password)
+        hashed_password = await self.hasher.hash(form.password)
 
         if await self.gateway.get_by_email(form.email):
             raise EmailAlreadyExistsError(email=form.email)
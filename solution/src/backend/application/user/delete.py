@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from backend.application.common.cache import CacheInvalidator
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.user import UserGateway
 from backend.application.common.idp import UserIdProvider
@@ -14,6 +15,7 @@ class DeleteUser:
     idp: UserIdProvider
     gateway: UserGateway
     uow: UoW
+    cache_invalidator: CacheInvalidator
 
     async def execute(self, id: UUID) -> None:
         viewer = await self.idp.get_user()
@@ -27,3 +29,4 @@ class DeleteUser:
         user.is_active = False
 
         await self.uow.commit()
+        await self.cache_invalidator.invalidate_user(user.id)
@@ -9,3 +9,4 @@ class UsersList:
     total: int
     page: int
     size: int
+    next_cursor: str | None = None
@@ -1,53 +1,92 @@
-from uuid import UUID
-
-from backend.application.common.decorator import interactor
-from backend.application.common.gateway.user import UserGateway
-from backend.application.common.idp import UserIdProvider
-from backend.application.exception.base import ForbiddenError
-from backend.application.exception.user import UserDoesNotExistError
-from backend.application.forms.paggination import PagginationForm
-from backend.application.user.dto import UsersList
-from backend.domain.entity.user import User
-from backend.domain.misc_types import Role
-
-
-@interactor
-class ReadUser:
-    idp: UserIdProvider
-    gateway: UserGateway
-
-    async def execute(self, id: UUID | None = None) -> User:
-        viewer = await self.idp.get_user()
-
-        if id is None or id == viewer.id:
-            return viewer
-
-        if viewer.role != Role.ADMIN:
-            raise ForbiddenError
-
-        user = await self.gateway.get_by_id(id)
-
-        if user is None:
-            raise UserDoesNotExistError
-
-        return user
-
-
-@interactor
-class ReadUsers:
-    gateway: UserGateway
-    idp: UserIdProvider
-
-    async def execute(self, size: int, page: int) -> UsersList:
-        viewer = await self.idp.get_user()
-
-        if viewer.role != Role.ADMIN:
-            raise ForbiddenError
-
-        form = PagginationForm(size=size, page=page)
-        offset = form.page * form.size
-
-        users = await self.gateway.get_many(offset=offset, size=form.size)
-        total = await self.gateway.get_count()
-
-        return UsersList(items=list(users), total=total or 0, page=form.page, size=form.size)
+import asyncio
+from uuid import UUID
+
+from backend.application.common.count import CountModes, TotalCounter
+from backend.application.common.cursor import Cursor, CursorCodec
+from backend.application.common.decorator import interactor
+from backend.application.common.gateway.user import UserGateway
+from backend.application.common.idp import UserIdProvider
+from backend.application.common.uow import ReadOnlyMode
+from backend.application.exception.base import ForbiddenError
+from backend.application.exception.user import UserDoesNotExistError
+from backend.application.forms.paggination import PagginationForm
+from backend.application.user.dto import UsersList
+from backend.domain.entity.user import User
+from backend.domain.misc_types import Role
+
+USERS_CURSOR_SCOPE = "users"
+
+
+@interactor
+class ReadUser:
+    idp: UserIdProvider
+    gateway: UserGateway
+    read_only: ReadOnlyMode
+
+    async def execute(self, id: UUID | None = None) -> User:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if id is not None and id != viewer.id and viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        # viewer - копия из кэша без хэша пароля, поэтому ответ всегда строится по пользователю из БД
+        user = await self.gateway.get_by_id(id or viewer.id)
+
+        if user is None:
+            raise UserDoesNotExistError
+
+        return user
+
+
+@interactor
+class ReadUsers:
+    gateway: UserGateway
+    idp: UserIdProvider
+    cursor_codec: CursorCodec
+    counter: TotalCounter
+    count_modes: CountModes
+    read_only: ReadOnlyMode
+
+    async def execute(self, size: int, page: int, cursor: str | None = None) -> UsersList:
+        await self.read_only.enable()
+
+        viewer = await self.idp.get_user()
+
+        if viewer.role != Role.ADMIN:
+            raise ForbiddenError
+
+        form = PagginationForm(size=size, page=page, cursor=cursor)
+
+        # С курсором страница продолжается после него, page не учитывается
+        after = None
+        offset = form.page * form.size
+        if form.cursor is not None:
+            after = self.cursor_codec.decode(form.cursor, USERS_CURSOR_SCOPE)
+            offset = 0
+
+        # Лишний элемент показывает, есть ли следующая страница.
+        # total считается в отдельном соединении параллельно со страницей
+        rows, total = await asyncio.gather(
+            self.gateway.get_many(offset=offset, size=form.size + 1, after=after),
+            self.counter.count_users(self.count_modes.users),
+        )
+        users = list(rows)
+
+        next_cursor = None
+        if len(users) > form.size:
+            users = users[: form.size]
+            last = users[-1]
+            next_cursor = self.cursor_codec.encode(
+                Cursor(sort_value=last.created_at, id=last.id),
+                USERS_CURSOR_SCOPE,
+            )
+
+        return UsersList(
+            items=users,
+            total=total,
+            page=form.page,
+            size=form.size,
+            next_cursor=next_cursor,
+        )
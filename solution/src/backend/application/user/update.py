@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
+from backend.application.common.cache import CacheInvalidator
 from backend.application.common.decorator import interactor
 from backend.application.common.gateway.user import UserGateway
 from backend.application.common.idp import UserIdProvider
@@ -17,6 +18,7 @@ class UpdateUser:
     idp: UserIdProvider
     gateway: UserGateway
     uow: UoW
+    cache_invalidator: CacheInvalidator
 
     async def execute(self, form: UpdateUserForm, id: UUID | None = None) -> User:
         viewer = await self.idp.get_user()
@@ -27,13 +29,9 @@ class UpdateUser:
         if id is not None and id != viewer.id and viewer.role != Role.ADMIN:
             raise ForbiddenError
 
-        if id is None or id == viewer.id:
-            user = viewer
-        else:
-            if not (usr := await self.gateway.get_by_id(id)):
-                raise UserDoesNotExistError
-
-            user = usr
+        # viewer может быть копией из кэша, поэтому изменяемый пользователь всегда загружается из сессии
+        if not (user := await self.gateway.get_by_id(id or viewer.id)):
+            raise UserDoesNotExistError
 
         user.full_name = form.full_name
         user.age = form.age
@@ -49,5 +47,6 @@ class UpdateUser:
             user.is_active = form.is_active
 
         await self.uow.commit()
+        await self.cache_invalidator.invalidate_user(user.id)
 
         return user
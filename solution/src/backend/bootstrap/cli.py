@@ -1,11 +1,16 @@
 import argparse
+import asyncio
 import contextlib
 import sys
 
 import alembic.config
+from sqlalchemy.ext.asyncio import create_async_engine
 
-from backend.bootstrap.entrypoint.fastapi import run_api
+from backend.bootstrap.entrypoint.fastapi import HOST, PORT, run_api, serve
+from backend.infrastructure.config_loader import Config
+from backend.infrastructure.database.aggregate import StatsAggregateRebuilder
 from backend.infrastructure.database.alembic.config import get_alembic_config_path
+from backend.infrastructure.database.partition import PartitionManager
 
 
 def run_migrations() -> None:
@@ -24,6 +29,35 @@ def autogenerate_migrations(message: str) -> None:
         next(alembic_path_gen)
 
 
+async def manage_partitions(args: argparse.Namespace) -> None:
+    config = Config.load_from_environment()
+    engine = create_async_engine(config.db.build_connection_str())
+    manager = PartitionManager(engine=engine)
+
+    try:
+        if args.operation == "ensure":
+            created = await manager.ensure(months_ahead=args.months_ahead, months_back=args.months_back)
+            print(f"Создано секций: {len(created)}")  # noqa: T201
+        else:
+            detached = await manager.detach(retention_months=args.retention_months, drop=args.drop)
+            print(f"{'Удалено' if args.drop else 'Отсоединено'} секций: {len(detached)}")  # noqa: T201
+    finally:
+        await engine.dispose()
+
+
+async def rebuild_stats() -> None:
+    config = Config.load_from_environment()
+    engine = create_async_engine(config.db.build_connection_str())
+
+    try:
+        rows = await StatsAggregateRebuilder(engine=engine).rebuild()
+    finally:
+        await engine.dispose()
+
+    for table, count in rows.items():
+        print(f"{table}: {count} строк")  # noqa: T201
+
+
 def main(argv: list[str] | None = None) -> None:
     if argv is None:
         argv = sys.argv[1:]
@@ -37,6 +71,23 @@ def main(argv: list[str] | None = None) -> None:
     run_api_parser = run_subparsers.add_parser("api")
     run_api_parser.set_defaults(func=lambda _: run_api(argv))
 
+    serve_parser = subparsers.add_parser("serve")
+    serve_parser.add_argument("--host", default=HOST)
+    serve_parser.add_argument("--port", type=int, default=PORT)
+    # По умолчанию - по воркеру на ядро
+    serve_parser.add_argument("--workers", type=int, default=None)
+    serve_parser.add_argument("--require-speedups", action="store_true")
+    serve_parser.add_argument("--graceful-timeout", type=int, default=30)
+    serve_parser.set_defaults(
+        func=lambda args: serve(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            require_speedups=args.require_speedups,
+            graceful_timeout=args.graceful_timeout,
+        ),
+    )
+
     migration_parser = subparsers.add_parser("migrations")
     migration_subparsers = migration_parser.add_subparsers(dest="operation", required=True)
 
@@ -44,6 +95,25 @@ def main(argv: list[str] | None = None) -> None:
     autogen_parser.add_argument("message")
     autogen_parser.set_defaults(func=lambda args: autogenerate_migrations(args.message))
 
+    partitions_parser = subparsers.add_parser("partitions")
+    partitions_subparsers = partitions_parser.add_subparsers(dest="operation", required=True)
+
+    ensure_parser = partitions_subparsers.add_parser("ensure")
+    ensure_parser.add_argument("--months-ahead", type=int, default=3)
+    ensure_parser.add_argument("--months-back", type=int, default=0)
+    ensure_parser.set_defaults(func=lambda args: asyncio.run(manage_partitions(args)))
+
+    detach_parser = partitions_subparsers.add_parser("detach")
+    detach_parser.add_argument("--retention-months", type=int, required=True)
+    detach_parser.add_argument("--drop", action="store_true")
+    detach_parser.set_defaults(func=lambda args: asyncio.run(manage_partitions(args)))
+
+    stats_parser = subparsers.add_parser("stats")
+    stats_subparsers = stats_parser.add_subparsers(dest="operation", required=True)
+
+    rebuild_parser = stats_subparsers.add_parser("rebuild")
+    rebuild_parser.set_defaults(func=lambda _: asyncio.run(rebuild_stats()))
+
     args = parser.parse_args(argv)
     run_migrations()
 
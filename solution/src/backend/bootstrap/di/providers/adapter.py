@@ -1,40 +1,127 @@
+from collections.abc import AsyncIterator, Iterator
+
 from argon2 import PasswordHasher
 from dishka import AnyOf, Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from backend.application.common.count import TotalCounter
+from backend.application.common.cursor import CursorCodec
+from backend.application.common.gateway.user import UserGateway
 from backend.application.common.idp import UserIdProvider
 from backend.application.common.storage import IStorageClient
-from backend.application.common.uow import UoW
-from backend.infrastructure.auth.hasher import ArgonHasher, Hasher
+from backend.application.common.uow import ReadOnlyMode, UoW
+from backend.infrastructure.auth.hasher import ArgonHasher, Hasher, HashingPool
 from backend.infrastructure.auth.idp.token_parser import AccessTokenParser
 from backend.infrastructure.auth.idp.token_processor import AccessTokenProcessor
 from backend.infrastructure.auth.idp.web import FastAPITokenParser, WebUserIdProvider
-from backend.infrastructure.config_loader import JWTConfig, RedisConfig
+from backend.infrastructure.auth.user_cache import CachedUserLoader, LocalUserCache
+from backend.infrastructure.config_loader import (
+    CacheConfig,
+    CountConfig,
+    HasherConfig,
+    JWTConfig,
+    PartitionConfig,
+    RedisConfig,
+)
+from backend.infrastructure.cursor import HMACCursorCodec
+from backend.infrastructure.database.gateway.count import SATotalCounter
+from backend.infrastructure.database.partition import PartitionMaintainer, PartitionManager
 from backend.infrastructure.database.provider import (
     get_async_engine,
     get_async_session,
     get_async_sessionmaker,
+    get_replica_router,
 )
+from backend.infrastructure.database.read_only import SAReadOnlyMode
+from backend.infrastructure.database.replica import ReplicaRouter
 from backend.infrastructure.redis import RedisClient
 
 
 class AdapterProvider(Provider):
     hasher = provide(ArgonHasher, scope=Scope.APP, provides=Hasher)
     token_parser = provide(FastAPITokenParser, provides=AccessTokenParser, scope=Scope.REQUEST)
-    idp = provide(
-        WebUserIdProvider,
-        provides=UserIdProvider,
+    read_only_mode = provide(
+        SAReadOnlyMode,
+        provides=AnyOf[SAReadOnlyMode, ReadOnlyMode],
         scope=Scope.REQUEST,
     )
 
+    @provide(scope=Scope.REQUEST, provides=UserIdProvider)
+    async def idp(
+        self,
+        token_parser: AccessTokenParser,
+        user_loader: CachedUserLoader,
+        session: AsyncSession,
+        router: ReplicaRouter,
+    ) -> AsyncIterator[WebUserIdProvider]:
+        idp = WebUserIdProvider(token_parser=token_parser, user_loader=user_loader)
+
+        yield idp
+
+        # После commit чтения пользователя идут в основную БД, пока реплики не догонят
+        if idp.user is not None:
+            await router.mark_write_if_committed(session, idp.user.id)
+
     @provide(scope=Scope.APP)
     def argon(self) -> PasswordHasher:
         return PasswordHasher()
 
+    @provide(scope=Scope.APP)
+    def hashing_pool(self, config: HasherConfig) -> Iterator[HashingPool]:
+        pool = HashingPool(workers=config.workers)
+        yield pool
+        pool.shutdown()
+
+    @provide(scope=Scope.APP)
+    def cursor_codec(self, config: JWTConfig) -> CursorCodec:
+        return HMACCursorCodec(secret_key=config.secret_key)
+
+    @provide(scope=Scope.REQUEST)
+    def total_counter(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        read_only: SAReadOnlyMode,
+        storage: IStorageClient,
+        config: CountConfig,
+    ) -> TotalCounter:
+        return SATotalCounter(
+            session_factory=session_factory,
+            read_only=read_only,
+            storage=storage,
+            cache_ttl=config.cache_ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def partition_manager(self, engine: AsyncEngine) -> PartitionManager:
+        return PartitionManager(engine=engine)
+
+    @provide(scope=Scope.APP)
+    def partition_maintainer(self, manager: PartitionManager, config: PartitionConfig) -> PartitionMaintainer:
+        return PartitionMaintainer(
+            manager=manager,
+            months_ahead=config.months_ahead,
+            interval=config.check_interval,
+        )
+
     @provide(scope=Scope.APP)
     def token_processor(self, config: JWTConfig) -> AccessTokenProcessor:
         return AccessTokenProcessor(config.secret_key)
 
+    @provide(scope=Scope.REQUEST)
+    def user_loader(
+        self,
+        local_cache: LocalUserCache,
+        storage: IStorageClient,
+        gateway: UserGateway,
+        config: CacheConfig,
+    ) -> CachedUserLoader:
+        return CachedUserLoader(
+            local_cache=local_cache,
+            storage=storage,
+            gateway=gateway,
+            storage_ttl=config.users_storage_ttl,
+        )
+
     @provide(scope=Scope.APP, provides=AnyOf[IStorageClient, RedisClient])
     def redis_client(self, config: RedisConfig) -> RedisClient:
         return RedisClient(config=config)
@@ -44,6 +131,7 @@ def adapter_provider() -> AdapterProvider:
     provider = AdapterProvider()
     provider.provide(get_async_engine, scope=Scope.APP)
     provider.provide(get_async_sessionmaker, scope=Scope.APP)
+    provider.provide(get_replica_router, scope=Scope.APP)
     provider.provide(get_async_session, provides=AnyOf[AsyncSession, UoW], scope=Scope.REQUEST)
 
     return provider
@@ -5,8 +5,17 @@ from backend.application.fraud_rule.delete import DeleteFraudRule
 from backend.application.fraud_rule.read import ReadFraudRule, ReadFraudRules
 from backend.application.fraud_rule.update import UpdateFraudRule
 from backend.application.fraud_rule.validate_dsl import ValidateDSL
-from backend.application.service.rule_evaluator import RuleEvaluator
-from backend.application.transaction.create import CreateTransaction
+from backend.application.service.rule_evaluator import BatchRuleEvaluator, RuleEvaluator
+from backend.application.service.rule_snapshot import EnabledRules
+from backend.application.stats.read import (
+    ReadDBPoolStats,
+    ReadMerchantRisk,
+    ReadRuleMatches,
+    ReadStatsOverview,
+    ReadTransactionsTimeSeries,
+    ReadUserRiskProfile,
+)
+from backend.application.transaction.create import CreateTransaction, CreateTransactionsBatch
 from backend.application.transaction.read import ReadTransaction, ReadTransactions
 from backend.application.user.create import CreateAdminUser, CreateUser
 from backend.application.user.delete import DeleteUser
@@ -26,6 +35,8 @@ class CommandProvider(Provider):
 
     service = provide_all(
         RuleEvaluator,
+        BatchRuleEvaluator,
+        EnabledRules,
     )
 
     commands = provide_all(
@@ -42,6 +53,13 @@ class CommandProvider(Provider):
         DeleteFraudRule,
         ValidateDSL,
         CreateTransaction,
+        CreateTransactionsBatch,
         ReadTransactions,
         ReadTransaction,
+        ReadStatsOverview,
+        ReadTransactionsTimeSeries,
+        ReadUserRiskProfile,
+        ReadRuleMatches,
+        ReadMerchantRisk,
+        ReadDBPoolStats,
     )
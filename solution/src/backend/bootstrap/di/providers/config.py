@@ -1,10 +1,15 @@
 from dishka import Provider, Scope, provide
 
+from backend.application.common.count import CountMode, CountModes
 from backend.infrastructure.config_loader import (
     AdminConfig,
+    CacheConfig,
     Config,
+    CountConfig,
     DataBaseConfig,
+    HasherConfig,
     JWTConfig,
+    PartitionConfig,
     RedisConfig,
 )
 
@@ -31,3 +36,26 @@ class ConfigProvider(Provider):
     @provide
     def jwt(self, config: Config) -> JWTConfig:
         return config.jwt
+
+    @provide
+    def cache(self, config: Config) -> CacheConfig:
+        return config.cache
+
+    @provide
+    def partition(self, config: Config) -> PartitionConfig:
+        return config.partition
+
+    @provide
+    def hasher(self, config: Config) -> HasherConfig:
+        return config.hasher
+
+    @provide
+    def count(self, config: Config) -> CountConfig:
+        return config.count
+
+    @provide
+    def count_modes(self, config: CountConfig) -> CountModes:
+        return CountModes(
+            transactions=CountMode(config.transactions_mode.upper()),
+            users=CountMode(config.users_mode.upper()),
+        )
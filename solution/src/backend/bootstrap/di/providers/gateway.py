@@ -4,6 +4,7 @@ from backend.infrastructure.database.gateway.fraud_rule import (
     SAFraudRuleEvaluationResultGateway,
     SAFraudRuleGateway,
 )
+from backend.infrastructure.database.gateway.stats import SAStatsGateway
 from backend.infrastructure.database.gateway.transaction import SATransactionGateway
 from backend.infrastructure.database.gateway.user import SAUserGateway
 
@@ -16,4 +17,5 @@ class GatewayProvider(Provider):
         WithParents[SAFraudRuleGateway],
         WithParents[SAFraudRuleEvaluationResultGateway],
         WithParents[SATransactionGateway],
+        WithParents[SAStatsGateway],
     )
@@ -1,5 +1,41 @@
-from dishka import Provider, Scope
+from dishka import Provider, Scope, provide
+
+from backend.application.common.cache import CacheInvalidator
+from backend.application.common.pool_metrics import DBPoolMetrics
+from backend.application.common.risk_profile import RiskProfileCounters
+from backend.application.common.rule_stats import RuleMatchCounters
+from backend.application.service.rule_cache import CompiledRuleCache
+from backend.application.service.rule_snapshot import EnabledRuleSnapshot
+from backend.infrastructure.auth.token_cache import VerifiedTokenCache
+from backend.infrastructure.auth.user_cache import LocalUserCache
+from backend.infrastructure.cache_invalidation import CacheInvalidationListener, RedisCacheInvalidator
+from backend.infrastructure.config_loader import CacheConfig
+from backend.infrastructure.database.pool import SAPoolMetrics
+from backend.infrastructure.risk_profile import RedisRiskProfileCounters
+from backend.infrastructure.rule_stats import RedisRuleMatchCounters
 
 
 class MiscProvider(Provider):
     scope = Scope.APP
+
+    cache_invalidator = provide(RedisCacheInvalidator, provides=CacheInvalidator)
+    cache_invalidation_listener = provide(CacheInvalidationListener)
+    risk_profile_counters = provide(RedisRiskProfileCounters, provides=RiskProfileCounters)
+    rule_match_counters = provide(RedisRuleMatchCounters, provides=RuleMatchCounters)
+    db_pool_metrics = provide(SAPoolMetrics, provides=DBPoolMetrics)
+
+    @provide
+    def compiled_rule_cache(self) -> CompiledRuleCache:
+        return CompiledRuleCache()
+
+    @provide
+    def enabled_rule_snapshot(self, config: CacheConfig) -> EnabledRuleSnapshot:
+        return EnabledRuleSnapshot(ttl=config.rules_ttl)
+
+    @provide
+    def local_user_cache(self, config: CacheConfig) -> LocalUserCache:
+        return LocalUserCache(ttl=config.users_local_ttl)
+
+    @provide
+    def verified_token_cache(self, config: CacheConfig) -> VerifiedTokenCache:
+        return VerifiedTokenCache(max_size=config.tokens_max_size)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
+from json import JSONDecodeError
 from typing import TypeVar
 
 from dishka import FromDishka, Provider, Scope, provide
 from fastapi import Request
+from pydantic import ValidationError
 
 from backend.application.forms.base import BaseForm
 
@@ -17,7 +19,17 @@ class ParsedData[T: BaseForm]:
 class ParsedDataProvider(Provider):
     @provide(scope=Scope.REQUEST)
     async def parse_data(self, request: Request, t: type[T]) -> ParsedData[T]:
-        return ParsedData(t(**(await request.json())))
+        body = await request.body()
+
+        # pydantic-core разбирает и валидирует байты за один проход, валидатор собирается один раз на класс
+        try:
+            return ParsedData(t.model_validate_json(body))
+        except ValidationError as e:
+            # Ошибка без поля - тело не JSON или не объект, отвечаем как на невалидный JSON
+            error = next((error for error in e.errors() if not error["loc"]), None)
+            if error is not None:
+                raise JSONDecodeError(error["msg"], body.decode(errors="replace"), 0) from e
+            raise
 
 
 RequestBody = FromDishka[ParsedData[T]]
@@ -1,7 +1,10 @@
+import asyncio
+import importlib.util
 import logging
+import os
 import sys
 from collections.abc import AsyncIterator
-from contextlib import suppress
+from contextlib import AsyncExitStack, suppress
 from uuid import uuid4
 
 import uvicorn
@@ -10,54 +13,119 @@ from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from backend.application.common.uow import UoW
 from backend.application.forms.user import AdminUserForm
+from backend.application.service.rule_cache import CompiledRuleCache
+from backend.application.service.rule_snapshot import EnabledRules
 from backend.bootstrap.di.container import get_async_container
 from backend.domain.entity.user import User
 from backend.domain.misc_types import Role
 from backend.infrastructure.auth.hasher import Hasher
-from backend.infrastructure.config_loader import AdminConfig
+from backend.infrastructure.cache_invalidation import CacheInvalidationListener
+from backend.infrastructure.config_loader import AdminConfig, DataBaseConfig, PartitionConfig
+from backend.infrastructure.database.partition import PartitionMaintainer, PartitionManager
+from backend.infrastructure.database.replica import ReplicaRouter
 from backend.presentation.web.fastapi import (
     include_exception_handlers,
     include_middlewares,
     include_routers,
 )
 
+APP = "backend.bootstrap.entrypoint.fastapi:app"
+HOST = "0.0.0.0"
+PORT = 8080
+
+logger = logging.getLogger(__name__)
+
+
+async def prepare_database() -> None:
+    """Разовая подготовка БД перед запуском воркеров: секции транзакций и администратор."""
+    container = get_async_container()
+
+    try:
+        # Секции на ближайшие месяцы, иначе новые транзакции попадут в DEFAULT.
+        # Ошибка здесь не глушится: без секций процесс запускаться не должен
+        partition_config = await container.get(PartitionConfig)
+        partition_manager = await container.get(PartitionManager)
+        await partition_manager.ensure(months_ahead=partition_config.months_ahead)
+
+        async with container() as r_container:
+            cfg = await r_container.get(AdminConfig)
+            uow = await r_container.get(UoW)
+            hasher = await r_container.get(Hasher)
+
+            form = AdminUserForm(
+                email=cfg.admin_email,
+                password=cfg.admin_password,
+                fullName=cfg.admin_full_name,
+                role=Role.ADMIN,
+            )
+
+            user = User(
+                id=uuid4(),
+                email=form.email,
+                password=await hasher.hash(form.password),
+                full_name=form.full_name,
+                age=form.age,
+                region=form.region,
+                gender=form.gender,
+                marital_status=form.marital_status,
+                role=form.role,
+            )
+            with suppress(IntegrityError):
+                uow.add(user)
+                await uow.flush((user,))
+                await uow.commit()
+    finally:
+        await container.close()
+
+
+async def warm_up(container: AsyncContainer) -> None:
+    """Открывает соединения пулов и разбирает включённые правила до приёма трафика."""
+    db_config = await container.get(DataBaseConfig)
+    engine = await container.get(AsyncEngine)
+    router = await container.get(ReplicaRouter)
+
+    try:
+        for pool_engine in (engine, *router.engines):
+            async with AsyncExitStack() as stack:
+                for _ in range(db_config.pool_size):
+                    await stack.enter_async_context(pool_engine.connect())
+
+        async with container() as r_container:
+            rules = await (await r_container.get(EnabledRules)).execute()
+
+        rule_cache = await container.get(CompiledRuleCache)
+        for rule in rules:
+            rule_cache.get(rule)
+    except Exception:
+        # Прогрев только ускоряет первые запросы, любая его ошибка не должна мешать воркеру стартовать
+        logger.exception("Прогрев воркера не удался, соединения и правила загрузятся по первым запросам")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     container: AsyncContainer = app.state.dishka_container
 
-    async with container() as r_container:
-        cfg = await r_container.get(AdminConfig)
-        uow = await r_container.get(UoW)
-        hasher = await r_container.get(Hasher)
-
-        form = AdminUserForm(
-            email=cfg.admin_email,
-            password=cfg.admin_password,
-            fullName=cfg.admin_full_name,
-            role=Role.ADMIN,
-        )
-
-        user = User(
-            id=uuid4(),
-            email=form.email,
-            password=hasher.hash(form.password),
-            full_name=form.full_name,
-            age=form.age,
-            region=form.region,
-            gender=form.gender,
-            marital_status=form.marital_status,
-            role=form.role,
-        )
-        with suppress(IntegrityError):
-            uow.add(user)
-            await uow.flush((user,))
-            await uow.commit()
+    # uvicorn начинает принимать соединения только после старта lifespan
+    await warm_up(container)
+
+    # Инвалидация процессных кэшей, изменённых другими воркерами
+    listener = await container.get(CacheInvalidationListener)
+    listener_task = asyncio.create_task(listener.run())
+
+    # Досоздание секций для процессов, которые работают дольше запаса months_ahead
+    partition_maintainer = await container.get(PartitionMaintainer)
+    partition_task = asyncio.create_task(partition_maintainer.run())
 
     yield
+
+    for task in (listener_task, partition_task):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
     await container.close()
 
 
@@ -83,13 +151,47 @@ def setup_logging() -> None:
 
 def main(_args: list[str] | None) -> None:
     setup_logging()
+    asyncio.run(prepare_database())
+
+    uvicorn.run(
+        APP,
+        host=HOST,
+        port=PORT,
+        log_level="info",
+        proxy_headers=True,
+    )
+
+
+def serve(
+    host: str = HOST,
+    port: int = PORT,
+    workers: int | None = None,
+    require_speedups: bool = False,
+    graceful_timeout: int = 30,
+) -> None:
+    """Продовый запуск: БД готовится один раз, затем uvicorn поднимает workers процессов.
+
+    На SIGTERM uvicorn перестаёт принимать соединения и ждёт текущие запросы до graceful_timeout секунд.
+    """
+    setup_logging()
+
+    if require_speedups:
+        missing = [module for module in ("uvloop", "httptools") if importlib.util.find_spec(module) is None]
+        if missing:
+            sys.exit(f"Не установлены: {', '.join(missing)}")
+
+    asyncio.run(prepare_database())
 
     uvicorn.run(
-        "backend.bootstrap.entrypoint.fastapi:app",
-        host="0.0.0.0",
-        port=8080,
+        APP,
+        host=host,
+        port=port,
+        workers=workers or os.cpu_count() or 1,
+        loop="uvloop" if require_speedups else "auto",
+        http="httptools" if require_speedups else "auto",
         log_level="info",
         proxy_headers=True,
+        timeout_graceful_shutdown=graceful_timeout,
     )
 
 
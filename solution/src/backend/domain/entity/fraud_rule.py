@@ -28,3 +28,5 @@ class FraudRuleEvaluationResult:
     priority: int
     matched: bool
     description: str
+    # Совпадает с created_at транзакции, чтобы результаты лежали в той же месячной секции
+    created_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
@@ -28,3 +28,9 @@ class TransactionChannel(Enum):
     MOBILE = "MOBILE"
     POS = "POS"
     OTHER = "OTHER"
+
+
+class StatsGroupBy(Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
@@ -16,14 +16,12 @@ class DSLEvaluator:
         }
 
     def eval_logical(self, node: Logical) -> bool:
-        left = self.eval(node.left)
-        right = self.eval(node.right)
-
+        # Правая часть вычисляется только если результат ещё не определён левой
         if node.operator == "AND":
-            return left and right
+            return self.eval(node.left) and self.eval(node.right)
 
         if node.operator == "OR":
-            return left or right
+            return self.eval(node.left) or self.eval(node.right)
 
         raise ValueError("Unknown logical operator " + node.operator)
 
@@ -4,44 +4,49 @@ from dataclasses import dataclass
 from backend.domain.exception.dsl import DSLParseError
 from backend.domain.service.dsl.tokens import TOKEN_SPECS, Token, TokenType
 
+# Все спецификации объединяются в одну альтернацию с именованными группами.
+# Порядок альтернатив совпадает с порядком TOKEN_SPECS, поэтому приоритет токенов сохраняется
+TOKEN_REGEX = re.compile(
+    "|".join(f"(?P<{token_type.name}>{pattern})" for token_type, pattern in TOKEN_SPECS),
+    re.IGNORECASE,
+)
+TOKEN_TYPES = {token_type.name: token_type for token_type, _ in TOKEN_SPECS}
+
 
 @dataclass(slots=True)
 class Lexer:
     text: str
     pos: int = 0
 
-    def _next_token(self) -> Token | None:
-        for token_type, pattern in TOKEN_SPECS:
-            mtch = re.compile(pattern, re.IGNORECASE).match(self.text, self.pos)
+    def _parse_error(self) -> DSLParseError:
+        return DSLParseError(
+            message="Ошибка при парсинге DSL",
+            position=self.pos,
+            near=self.text[self.pos : self.pos + 10],
+        )
+
+    def tokenize(self) -> list[Token]:
+        tokens = []
 
-            if mtch is None:
-                continue
+        for mtch in TOKEN_REGEX.finditer(self.text, self.pos):
+            # finditer пропускает нераспознанные символы, разрыв между токенами - ошибка
+            if mtch.start() != self.pos:
+                raise self._parse_error()
 
-            value = mtch.group()
-            position = self.pos
             self.pos = mtch.end()
+            token_type = TOKEN_TYPES[mtch.lastgroup]  # type: ignore[index]
 
             if token_type == TokenType.SKIP:
-                return None
+                continue
 
+            value = mtch.group()
             if token_type in (TokenType.AND, TokenType.OR):
                 value = value.upper()
 
-            return Token(token_type=token_type, value=value, pos=position)
-
-        raise DSLParseError(
-            message="Ошибка при парсинге DSL",
-            position=self.pos,
-            near=self.text[self.pos : self.pos + 10],
-        )
-
-    def tokenize(self) -> list[Token]:
-        tokens = []
+            tokens.append(Token(token_type=token_type, value=value, pos=mtch.start()))
 
-        while self.pos < len(self.text):
-            token = self._next_token()
-            if token:
-                tokens.append(token)
+        if self.pos < len(self.text):
+            raise self._parse_error()
 
         tokens.append(Token(TokenType.EOF, "", self.pos))
         return tokens
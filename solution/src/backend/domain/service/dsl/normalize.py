@@ -1,4 +1,8 @@
 from backend.domain.service.dsl.ast_node import ASTNode, Comparison, Logical
+from backend.domain.service.dsl.parser import DECIMAL_FIELDS, NUMERIC_OPERATORS, STRING_FIELDS
+
+DECIMAL_COMPARISON_COST = 1
+STRING_COMPARISON_COST = 2
 
 
 def normalize_ast(node: ASTNode) -> ASTNode:
@@ -19,6 +23,76 @@ def normalize_ast(node: ASTNode) -> ASTNode:
     return node
 
 
+def flatten_logical(node: ASTNode, operator: str) -> list[ASTNode]:
+    if isinstance(node, Logical) and node.operator == operator:
+        return [*flatten_logical(node.left, operator), *flatten_logical(node.right, operator)]
+
+    return [node]
+
+
+def _chain_logical(operands: list[ASTNode], operator: str) -> ASTNode:
+    node = operands[-1]
+
+    for operand in reversed(operands[:-1]):
+        node = Logical(left=operand, operator=operator, right=node)
+
+    return node
+
+
+def _is_well_typed(node: ASTNode) -> bool:
+    if isinstance(node, Logical):
+        return _is_well_typed(node.left) and _is_well_typed(node.right)
+
+    if isinstance(node, Comparison):
+        if node.left in STRING_FIELDS:
+            return isinstance(node.right, str) and node.operator in ("=", "!=")
+        if node.left in DECIMAL_FIELDS:
+            return not isinstance(node.right, str) and node.operator in NUMERIC_OPERATORS
+
+    return False
+
+
+def _cost(node: ASTNode) -> int:
+    if isinstance(node, Comparison):
+        return DECIMAL_COMPARISON_COST if node.left in DECIMAL_FIELDS else STRING_COMPARISON_COST
+
+    return _cost(node.left) + _cost(node.right)
+
+
+def _selectivity_rank(node: ASTNode, operator: str) -> int:
+    # В AND раньше проверяется то, что чаще ложно (=), в OR - то, что чаще истинно (!=)
+    if not isinstance(node, Comparison) or node.operator not in ("=", "!="):
+        return 1
+
+    likely_false = node.operator == "="
+
+    return 0 if likely_false == (operator == "AND") else 2
+
+
+def _reorder(node: ASTNode) -> ASTNode:
+    if not isinstance(node, Logical):
+        return node
+
+    operands = [_reorder(operand) for operand in flatten_logical(node, node.operator)]
+    operands.sort(key=lambda operand: (_cost(operand), _selectivity_rank(operand, node.operator)))
+
+    return _chain_logical(operands, node.operator)
+
+
+def reorder_by_cost(node: ASTNode) -> ASTNode:
+    """Переставляет операнды AND/OR так, чтобы дешёвые и селективные сравнения шли первыми.
+
+    Выражения с некорректными по типам сравнениями не трогаются: при коротком
+    замыкании перестановка могла бы изменить результат их оценки.
+    """
+    node = normalize_ast(node)
+
+    if not _is_well_typed(node):
+        return node
+
+    return _reorder(node)
+
+
 def ast_to_string(node: ASTNode) -> str:
     if isinstance(node, Comparison):
         right = node.right
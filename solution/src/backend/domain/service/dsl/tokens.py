@@ -24,7 +24,7 @@ TOKEN_SPECS = [
     (TokenType.AND, r"\bAND\b"),
     (TokenType.OR, r"\bOR\b"),
     (TokenType.OP, r">=|<=|!=|>|<|="),
-    (TokenType.NUMBER, r"-?\d+(\.\d+)?"),
+    (TokenType.NUMBER, r"-?\d+(?:\.\d+)?"),
     (TokenType.STRING, r"'[^']*'"),
     (TokenType.FIELD, r"[a-zA-Z_.]+"),
     (TokenType.SKIP, r"\s+"),
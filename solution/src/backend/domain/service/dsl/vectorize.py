@@ -0,0 +1,187 @@
+import math
+from collections.abc import Callable, Mapping, Sequence
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from backend.domain.entity.transaction import Transaction
+from backend.domain.exception.dsl import DSLError, DSLInvalidFieldError
+from backend.domain.service.dsl.ast_node import ASTNode, Comparison, Logical
+from backend.domain.service.dsl.compile import DECIMAL_OPERATORS, STRING_OPERATORS, build_context
+from backend.domain.service.dsl.normalize import flatten_logical
+from backend.domain.service.dsl.parser import DECIMAL_FIELDS, STRING_FIELDS
+
+type Mask = npt.NDArray[np.bool_]
+type Columns = Mapping[str, npt.NDArray[Any]]
+type VectorizedDSL = Callable[[Columns], Mask]
+
+# (значение, ошибка): ошибка - строки, для которых скалярная оценка выбросила бы DSLError
+type _MaskedResult = tuple[Mask, Mask]
+type _VectorizedNode = Callable[[Columns], _MaskedResult]
+
+CENTS = 100
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def build_columns(transactions: Sequence[Transaction]) -> dict[str, npt.NDArray[Any]]:
+    contexts = [build_context(transaction) for transaction in transactions]
+
+    columns: dict[str, npt.NDArray[Any]] = {
+        field: np.array([context[field] for context in contexts], dtype=np.str_) for field in STRING_FIELDS
+    }
+
+    amounts: list[Decimal] = [context["amount"] for context in contexts]
+    cents = [amount * CENTS for amount in amounts]
+
+    # Суммы хранятся с точностью до копейки, поэтому обычно сравниваются как int64.
+    # Иначе остаётся столбец Decimal, сравнения по которому точные, но медленнее
+    if all(cent == cent.to_integral_value() for cent in cents):
+        columns["amount"] = np.array([int(cent) for cent in cents], dtype=np.int64)
+    else:
+        columns["amount"] = np.array(amounts, dtype=object)
+
+    return columns
+
+
+def _rows(columns: Columns) -> int:
+    return len(columns["amount"])
+
+
+def _clamp(value: int) -> int:
+    return max(INT64_MIN, min(INT64_MAX, value))
+
+
+def _compare_cents(cents: npt.NDArray[np.int64], operator_: str, literal: Decimal) -> Mask:
+    # Для целого c: c > x <=> c > floor(x), c >= x <=> c >= ceil(x) и т.д.
+    scaled = Fraction(literal) * CENTS
+    floor = _clamp(math.floor(scaled))
+    ceil = _clamp(math.ceil(scaled))
+    is_integral = scaled.denominator == 1
+
+    match operator_:
+        case ">":
+            return cents > floor
+        case ">=":
+            return cents >= ceil
+        case "<":
+            return cents < ceil
+        case "<=":
+            return cents <= floor
+        case "=":
+            return cents == floor if is_integral else np.zeros(len(cents), dtype=np.bool_)
+        case "!=":
+            return cents != floor if is_integral else np.ones(len(cents), dtype=np.bool_)
+
+    raise DSLError(message="Неизвестный оператор сравнения " + operator_)
+
+
+def _vectorize_comparison(node: Comparison) -> _VectorizedNode:
+    field = node.left
+    right = node.right
+
+    if field not in STRING_FIELDS and field not in DECIMAL_FIELDS:
+        raise DSLInvalidFieldError(message=f"Поле отсутствует внутри контекста: {field}")
+
+    if field in STRING_FIELDS and isinstance(right, str) and node.operator in STRING_OPERATORS:
+        op = STRING_OPERATORS[node.operator]
+        string_literal = right.strip("'")
+
+        def string_comparison(columns: Columns) -> _MaskedResult:
+            value = np.asarray(op(columns[field], string_literal), dtype=np.bool_)
+            return value, np.zeros(len(value), dtype=np.bool_)
+
+        return string_comparison
+
+    if field in DECIMAL_FIELDS and isinstance(right, (int, Decimal)) and node.operator in DECIMAL_OPERATORS:
+        decimal_op = DECIMAL_OPERATORS[node.operator]
+        decimal_literal = Decimal(right)
+
+        def decimal_comparison(columns: Columns) -> _MaskedResult:
+            column = columns[field]
+
+            if column.dtype == np.int64:
+                value = _compare_cents(column, node.operator, decimal_literal)
+            else:
+                value = np.asarray(decimal_op(column, decimal_literal), dtype=np.bool_)
+
+            return value, np.zeros(len(value), dtype=np.bool_)
+
+        return decimal_comparison
+
+    def invalid_comparison(columns: Columns) -> _MaskedResult:
+        rows = _rows(columns)
+        return np.zeros(rows, dtype=np.bool_), np.ones(rows, dtype=np.bool_)
+
+    return invalid_comparison
+
+
+def _vectorize_logical(node: Logical) -> _VectorizedNode:
+    operands = tuple(_vectorize(operand) for operand in flatten_logical(node, node.operator))
+
+    # Маски повторяют короткое замыкание скалярной оценки: ошибка операнда
+    # учитывается только для строк, результат которых ещё не определён
+    if node.operator == "AND":
+
+        def conjunction(columns: Columns) -> _MaskedResult:
+            rows = _rows(columns)
+            pending = np.ones(rows, dtype=np.bool_)
+            error = np.zeros(rows, dtype=np.bool_)
+
+            for operand in operands:
+                value, operand_error = operand(columns)
+                error |= pending & operand_error
+                pending &= ~operand_error & value
+
+            return pending, error
+
+        return conjunction
+
+    if node.operator == "OR":
+
+        def disjunction(columns: Columns) -> _MaskedResult:
+            rows = _rows(columns)
+            pending = np.ones(rows, dtype=np.bool_)
+            result = np.zeros(rows, dtype=np.bool_)
+            error = np.zeros(rows, dtype=np.bool_)
+
+            for operand in operands:
+                value, operand_error = operand(columns)
+                error |= pending & operand_error
+                pending &= ~operand_error
+                result |= pending & value
+                pending &= ~value
+
+            return result, error
+
+        return disjunction
+
+    raise DSLError(message="Неизвестный логический оператор " + node.operator)
+
+
+def _vectorize(node: ASTNode) -> _VectorizedNode:
+    if isinstance(node, Logical):
+        return _vectorize_logical(node)
+
+    if isinstance(node, Comparison):
+        return _vectorize_comparison(node)
+
+    raise DSLError(message="Неизвестный ASTNode")
+
+
+def vectorize_ast(node: ASTNode) -> VectorizedDSL:
+    """Компилирует AST в функцию над столбцами пачки транзакций (см. build_columns).
+
+    Возвращает маску сработавших строк; строки, на которых скалярная оценка
+    выбросила бы DSLError, считаются несработавшими, как и в RuleEvaluator.
+    """
+    vectorized = _vectorize(node)
+
+    def predicate(columns: Columns) -> Mask:
+        value, error = vectorized(columns)
+        return value & ~error
+
+    return predicate
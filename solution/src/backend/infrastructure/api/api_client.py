@@ -1,7 +1,8 @@
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from adaptix import NameStyle, Retort, dumper, name_mapping
@@ -9,7 +10,8 @@ from aiohttp import ClientSession
 from descanso import RestBuilder
 from descanso.client import AsyncResponseWrapper
 from descanso.http.aiohttp import AiohttpClient
-from descanso.request import HttpRequest
+from descanso.request import FieldIn, FieldOut, HttpRequest
+from descanso.request_transformers import FormQuery
 from descanso.response import BaseResponseTransformer
 from descanso.response import HttpResponse as DescansoHttpResponse
 from descanso.response_transformers import ErrorRaiser
@@ -23,11 +25,25 @@ from backend.application.forms.fraud_rule import (
 from backend.application.forms.transaction import TransactionForm
 from backend.application.forms.user import AdminUserForm, UpdateUserForm, UserForm
 from backend.application.fraud_rule.validate_dsl import DSLInfo
+from backend.application.stats.dto import (
+    DBPoolStats,
+    MerchantRiskLeaderboard,
+    RuleMatchesStats,
+    StatsOverview,
+    TransactionsTimeSeries,
+    UserRiskProfile,
+)
 from backend.application.transaction.dto import TransactionDecision, TransactionsList
 from backend.application.user.dto import UsersList
 from backend.domain.entity.fraud_rule import FraudRule
 from backend.domain.entity.user import User
-from backend.infrastructure.api.models import APIResponse, PingResponse
+from backend.domain.misc_types import StatsGroupBy
+from backend.infrastructure.api.models import (
+    APIResponse,
+    PingResponse,
+    TransactionBatchRequest,
+    TransactionBatchResponse,
+)
 from backend.infrastructure.auth.login import WebLoginForm
 from backend.infrastructure.serialization.api_client import api_dump_serializer, api_load_serializer
 from backend.presentation.web.controller.login import LoginResponse
@@ -63,6 +79,23 @@ class ApiResponseTransformer(BaseResponseTransformer):
         return response
 
 
+class AliasedFormQuery(FormQuery):
+    """FormQuery с переименованием параметров: name_mapping адаптикса до имён параметров не доходит."""
+
+    def __init__(self, aliases: dict[str, str]) -> None:
+        self.aliases = aliases
+
+    def transform_request(
+        self,
+        request: HttpRequest,
+        fields_in: Sequence[FieldIn],
+        fields_out: Sequence[FieldOut],
+        data: dict[str, Any],
+    ) -> HttpRequest:
+        request.query_params = [(self.aliases.get(name, name), value) for name, value in request.query_params]
+        return super().transform_request(request, fields_in, fields_out, data)
+
+
 rest = RestBuilder(
     request_body_dumper=api_dump_serializer,
     response_body_loader=api_load_serializer,
@@ -121,7 +154,7 @@ class AntiFraudApiClient(AiohttpClient):
         raise NotImplementedError
 
     @rest.get("users/", error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 422)))
-    def read_users(self, page: int = 0, size: int = 20) -> APIResponse[UsersList]:
+    def read_users(self, page: int = 0, size: int = 20, cursor: str | None = None) -> APIResponse[UsersList]:
         raise NotImplementedError
 
     @rest.get("users/{id}", error_raiser=ErrorRaiser(except_codes=(200, 401, 404, 403)))
@@ -181,6 +214,23 @@ class AntiFraudApiClient(AiohttpClient):
     def create_transaction(self, body: TransactionForm) -> APIResponse[TransactionDecision]:
         raise NotImplementedError
 
+    @rest.post(
+        "transactions/batch",
+        error_raiser=ErrorRaiser(except_codes=(201, 207, 401, 403, 422)),
+        request_body_dumper=Retort(
+            recipe=[
+                dumper(datetime, lambda x: x.strftime("%Y-%m-%dT%H:%M:%SZ")),
+                dumper(EmailStr, str),
+                name_mapping(name_style=NameStyle.CAMEL),
+            ],
+        ),
+    )
+    def create_transactions_batch(
+        self,
+        body: TransactionBatchRequest,
+    ) -> APIResponse[TransactionBatchResponse]:
+        raise NotImplementedError
+
     @rest.get(
         "transactions/{id}",
         error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 404)),
@@ -194,9 +244,9 @@ class AntiFraudApiClient(AiohttpClient):
         query_param_dumper=Retort(
             recipe=[
                 dumper(datetime, lambda x: x.strftime("%Y-%m-%dT%H:%M:%SZ")),
-                name_mapping(map={"from_": "from"}),
             ],
         ),
+        query_param_post_dump=AliasedFormQuery({"from_": "from"}),
     )
     def read_transactions(
         self,
@@ -207,5 +257,97 @@ class AntiFraudApiClient(AiohttpClient):
         isFraud: bool | None = None,  # noqa: N803  Пишу в спешке, фиксить некогда
         from_: datetime | None = None,
         to: datetime | None = None,
+        cursor: str | None = None,
     ) -> APIResponse[TransactionsList]:
         raise NotImplementedError
+
+    @rest.get(
+        "stats/overview",
+        error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 422)),
+        query_param_dumper=Retort(
+            recipe=[
+                dumper(datetime, lambda x: x.strftime("%Y-%m-%dT%H:%M:%SZ")),
+            ],
+        ),
+        query_param_post_dump=AliasedFormQuery({"from_": "from"}),
+    )
+    def stats_overview(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+    ) -> APIResponse[StatsOverview]:
+        raise NotImplementedError
+
+    @rest.get(
+        "stats/transactions/timeseries",
+        error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 422)),
+        query_param_dumper=Retort(
+            recipe=[
+                dumper(datetime, lambda x: x.strftime("%Y-%m-%dT%H:%M:%SZ")),
+            ],
+        ),
+        query_param_post_dump=AliasedFormQuery({"from_": "from", "group_by": "groupBy"}),
+    )
+    def stats_timeseries(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        group_by: StatsGroupBy = StatsGroupBy.DAY,
+        timezone: str = "UTC",
+        channel: str | None = None,
+    ) -> APIResponse[TransactionsTimeSeries]:
+        raise NotImplementedError
+
+    @rest.get(
+        "stats/users/{id}/risk-profile",
+        error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 404)),
+    )
+    def stats_risk_profile(self, id: UUID) -> APIResponse[UserRiskProfile]:
+        raise NotImplementedError
+
+    @rest.get(
+        "stats/rules/matches",
+        error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 422)),
+        query_param_dumper=Retort(
+            recipe=[
+                dumper(datetime, lambda x: x.strftime("%Y-%m-%dT%H:%M:%SZ")),
+            ],
+        ),
+        query_param_post_dump=AliasedFormQuery({"from_": "from"}),
+    )
+    def stats_rule_matches(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        top: int = 20,
+        exact: bool = False,
+    ) -> APIResponse[RuleMatchesStats]:
+        raise NotImplementedError
+
+    @rest.get(
+        "stats/merchants/risk",
+        error_raiser=ErrorRaiser(except_codes=(200, 401, 403, 422)),
+        query_param_dumper=Retort(
+            recipe=[
+                dumper(datetime, lambda x: x.strftime("%Y-%m-%dT%H:%M:%SZ")),
+            ],
+        ),
+        query_param_post_dump=AliasedFormQuery(
+            {"from_": "from", "merchant_category_code": "merchantCategoryCode"},
+        ),
+    )
+    def stats_merchant_risk(
+        self,
+        from_: datetime | None = None,
+        to: datetime | None = None,
+        merchant_category_code: str | None = None,
+        top: int = 50,
+    ) -> APIResponse[MerchantRiskLeaderboard]:
+        raise NotImplementedError
+
+    @rest.get(
+        "stats/db-pool",
+        error_raiser=ErrorRaiser(except_codes=(200, 401, 403)),
+    )
+    def stats_db_pool(self) -> APIResponse[DBPoolStats]:
+        raise NotImplementedError
@@ -22,12 +22,15 @@ from backend.application.exception.fraud_rule import (
 from backend.application.exception.transaction import (
     MissingLonOrLatError,
     TransactionDoesNotExistError,
+    TransactionPersistError,
 )
 from backend.application.exception.user import (
     EmailAlreadyExistsError,
     InactiveUserError,
     UserDoesNotExistError,
 )
+from backend.application.forms.transaction import TransactionForm
+from backend.application.transaction.dto import TransactionDecision
 from backend.domain.exception.dsl import (
     DSLError,
     DSLInvalidFieldError,
@@ -61,6 +64,7 @@ ERROR_HTTP_CODE = {
     DSLInvalidOperatorError: 422,
     MissingLonOrLatError: 422,
     TransactionDoesNotExistError: 404,
+    TransactionPersistError: 409,
     CustomValidationError: 422,
 }
 
@@ -83,6 +87,7 @@ ERROR_MESSAGE = {
     DSLInvalidOperatorError: "Оператор неприменим к типу",
     MissingLonOrLatError: "Некоторые поля не прошли валидацию",
     TransactionDoesNotExistError: "Ресурс не найден",
+    TransactionPersistError: "Не удалось сохранить транзакцию",
     CustomValidationError: "Некоторые поля не прошли валидацию",
 }
 
@@ -105,6 +110,7 @@ ERROR_CODE = {
     DSLInvalidOperatorError: "DSL_INVALID_OPERATOR",
     MissingLonOrLatError: "VALIDATION_FAILED",
     TransactionDoesNotExistError: "NOT_FOUND",
+    TransactionPersistError: "TRANSACTION_NOT_SAVED",
     CustomValidationError: "VALIDATION_FAILED",
 }
 
@@ -136,6 +142,23 @@ class ApiErrorResponse:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class TransactionBatchRequest:
+    items: list[TransactionForm]
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionBatchResponseItem:
+    index: int
+    decision: TransactionDecision | None = None
+    error: ApiErrorResponse | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionBatchResponse:
+    items: list[TransactionBatchResponseItem]
+
+
 @dataclass(slots=True, frozen=True)
 class HttpResponse:
     status: int
@@ -1,24 +1,68 @@
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+DEFAULT_WORKERS = 2
+
 
 class Hasher(Protocol):
-    def hash(self, password: str) -> str: ...
+    async def hash(self, password: str) -> str: ...
+
+    async def verify(self, raw: str, hashed: str) -> bool: ...
+
 
-    def verify(self, raw: str, hashed: str) -> bool: ...
+@dataclass(slots=True)
+class HashingPool:
+    """Отдельный пул потоков под Argon2, чтобы хэширование не блокировало event loop.
+
+    argon2-cffi отпускает GIL на время хэширования, поэтому потоки считают параллельно.
+    Одновременно считается не больше workers хэшей, остальные ждут в очереди пула.
+    """
+
+    workers: int = DEFAULT_WORKERS
+    pending: int = field(default=0, init=False)
+    max_queue_depth: int = field(default=0, init=False)
+    completed: int = field(default=0, init=False)
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="argon2")
+
+    async def run[T](self, func: Callable[..., T], *args: str) -> T:
+        # Счётчики меняются только в event loop, без гонок с потоками пула
+        self.pending += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.pending - self.workers, 0)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
 
 
 @dataclass(slots=True, frozen=True)
 class ArgonHasher(Hasher):
     argon: PasswordHasher
+    pool: HashingPool
+
+    async def hash(self, password: str) -> str:
+        return await self.pool.run(self.argon.hash, password)
 
-    def hash(self, password: str) -> str:
-        return self.argon.hash(password)
+    async def verify(self, raw: str, hashed: str) -> bool:
+        return await self.pool.run(self._verify, raw, hashed)
 
-    def verify(self, raw: str, hashed: str) -> bool:
+    def _verify(self, raw: str, hashed: str) -> bool:
         try:
             return self.argon.verify(hashed, raw)
         except VerifyMismatchError:
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 from fastapi import Request
 from jwt import PyJWTError
 
-from backend.application.common.gateway.user import UserGateway
 from backend.application.common.idp import UserIdProvider
 from backend.application.exception.base import UnauthorizedError
 from backend.domain.entity.user import User
@@ -12,6 +12,8 @@ from backend.domain.misc_types import Role
 from backend.infrastructure.auth.access_token import AccessToken
 from backend.infrastructure.auth.idp.token_parser import AccessTokenParser
 from backend.infrastructure.auth.idp.token_processor import AccessTokenProcessor
+from backend.infrastructure.auth.token_cache import VerifiedTokenCache
+from backend.infrastructure.auth.user_cache import CachedUserLoader
 
 TOKEN_TYPE = "Bearer"  # noqa: S105
 BEARER_SECTIONS = 2
@@ -22,6 +24,7 @@ AUTH_HEADER = "Authorization"
 class FastAPITokenParser(AccessTokenParser):
     request: Request
     processor: AccessTokenProcessor
+    token_cache: VerifiedTokenCache
 
     def parse_token(self) -> AccessToken:
         auth_header = self.request.headers.get(AUTH_HEADER)
@@ -38,13 +41,22 @@ class FastAPITokenParser(AccessTokenParser):
         if token_type != TOKEN_TYPE:
             raise UnauthorizedError
 
+        # Клиенты переиспользуют токен до часа, повторная проверка подписи ничего не даёт
+        if (cached := self.token_cache.get(token)) is not None:
+            return cached
+
         try:
             decoded_token = self.processor.decode(token)
         except PyJWTError as e:
             raise UnauthorizedError from e
 
+        try:
+            user_id = UUID(decoded_token["sub"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise UnauthorizedError from e
+
         access_token = AccessToken(
-            user_id=decoded_token["sub"],
+            user_id=user_id,
             role=Role(decoded_token["role"]),
             token=token,
             expires_in=int(decoded_token["exp"]),
@@ -56,19 +68,21 @@ class FastAPITokenParser(AccessTokenParser):
         ):
             raise UnauthorizedError
 
+        self.token_cache.put(access_token)
+
         return access_token
 
 
 @dataclass(slots=True)
 class WebUserIdProvider(UserIdProvider):
     token_parser: AccessTokenParser
-    gateway: UserGateway
+    user_loader: CachedUserLoader
     user: User | None = field(init=False, repr=False, default=None)
 
     async def get_user(self) -> User:
         if self.user is None:
             token_data = self.token_parser.parse_token()
-            user = await self.gateway.get_by_id(token_data.user_id)
+            user = await self.user_loader.get_by_id(token_data.user_id)
 
             if user is None:
                 raise UnauthorizedError
@@ -0,0 +1,54 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+
+from backend.infrastructure.auth.access_token import AccessToken
+
+DEFAULT_MAX_SIZE = 8192
+
+
+@dataclass(slots=True)
+class VerifiedTokenCache:
+    """Процессный LRU-кэш уже проверенных токенов, живёт до истечения токена.
+
+    Подпись и claims токена не зависят от состояния сервера, поэтому результат проверки
+    можно переиспользовать, пока токен не истёк. Истёкшие записи удаляются при обращении.
+    """
+
+    max_size: int = DEFAULT_MAX_SIZE
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict[str, tuple[float, AccessToken]] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+
+    def get(self, token: str) -> AccessToken | None:
+        if (entry := self._entries.get(token)) is None:
+            self.misses += 1
+            return None
+
+        expires_at, access_token = entry
+        if expires_at < time.time():
+            del self._entries[token]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return replace(access_token)
+
+    def put(self, access_token: AccessToken) -> None:
+        expires_at = access_token.created_at.timestamp() + access_token.expires_in
+        self._entries[access_token.token] = (expires_at, replace(access_token))
+        self._entries.move_to_end(access_token.token)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,131 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from backend.application.common.gateway.user import UserGateway
+from backend.application.common.storage import IStorageClient
+from backend.domain.entity.user import User
+from backend.infrastructure.serialization.cache import cache_serializer
+
+USER_KEY_PREFIX = "antifraud:user:"
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_LOCAL_TTL = 5.0
+DEFAULT_STORAGE_TTL = 60
+# Хэш пароля не кэшируется ни в процессе, ни в Redis: пароль проверяется только через UserGateway
+CACHED_PASSWORD = ""
+
+logger = logging.getLogger(__name__)
+
+
+def user_cache_key(user_id: UUID) -> str:
+    return USER_KEY_PREFIX + str(user_id)
+
+
+@dataclass(slots=True)
+class LocalUserCache:
+    """Процессный LRU-кэш пользователей с ttl, первый уровень перед Redis.
+
+    Хранит и отдаёт копии, не привязанные к сессии: изменения в них не сохраняются.
+    В копиях нет хэша пароля.
+    """
+
+    max_size: int = DEFAULT_MAX_SIZE
+    ttl: float = DEFAULT_LOCAL_TTL
+    local_hits: int = field(default=0, init=False)
+    storage_hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict[UUID, tuple[float, User]] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+
+    def get(self, user_id: UUID) -> User | None:
+        if (entry := self._entries.get(user_id)) is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return replace(user)
+
+    def put(self, user: User) -> None:
+        self._entries[user.id] = (time.monotonic() + self.ttl, replace(user, password=CACHED_PASSWORD))
+        self._entries.move_to_end(user.id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.local_hits + self.storage_hits + self.misses
+        return (self.local_hits + self.storage_hits) / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(slots=True, frozen=True)
+class CachedUserLoader:
+    """Read-through загрузка пользователя: процессный кэш -> Redis -> Postgres."""
+
+    local_cache: LocalUserCache
+    storage: IStorageClient
+    gateway: UserGateway
+    storage_ttl: int = DEFAULT_STORAGE_TTL
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        if (user := self.local_cache.get(user_id)) is not None:
+            self.local_cache.local_hits += 1
+            return user
+
+        if (user := await self._get_from_storage(user_id)) is not None:
+            self.local_cache.storage_hits += 1
+            self.local_cache.put(user)
+            return user
+
+        self.local_cache.misses += 1
+
+        if (user := await self.gateway.get_by_id(user_id)) is None:
+            return None
+
+        self.local_cache.put(user)
+        await self._put_to_storage(user)
+
+        return user
+
+    async def _get_from_storage(self, user_id: UUID) -> User | None:
+        try:
+            raw = await self.storage.get(user_cache_key(user_id))
+        except RedisError:
+            logger.warning("Кэш пользователей в Redis недоступен")
+            return None
+
+        if raw is None:
+            return None
+
+        return cache_serializer.load({**json.loads(raw), "password": CACHED_PASSWORD}, User)
+
+    async def _put_to_storage(self, user: User) -> None:
+        data = cache_serializer.dump(user, User)
+        del data["password"]
+        raw = json.dumps(data)
+
+        try:
+            await self.storage.set(user_cache_key(user.id), raw, expire=self.storage_ttl)
+        except RedisError:
+            logger.warning("Кэш пользователей в Redis недоступен")
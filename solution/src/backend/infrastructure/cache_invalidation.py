@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from backend.application.common.cache import CacheInvalidator
+from backend.application.service.rule_snapshot import EnabledRuleSnapshot
+from backend.infrastructure.auth.user_cache import LocalUserCache, user_cache_key
+from backend.infrastructure.redis import RedisClient
+
+INVALIDATION_CHANNEL = "antifraud:cache:invalidate"
+RULES_MESSAGE = "rules"
+ALL_MESSAGE = "all"
+USER_MESSAGE_PREFIX = "user:"
+RECONNECT_DELAY = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class RedisCacheInvalidator(CacheInvalidator):
+    """Сбрасывает локальные кэши и рассылает сообщение остальным воркерам."""
+
+    redis: RedisClient
+    rule_snapshot: EnabledRuleSnapshot
+    user_cache: LocalUserCache
+
+    async def invalidate_rules(self) -> None:
+        self.rule_snapshot.invalidate()
+        await self._publish(RULES_MESSAGE)
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        self.user_cache.invalidate(user_id)
+
+        try:
+            await self.redis.delete(user_cache_key(user_id))
+        except RedisError:
+            logger.warning("Не удалось удалить пользователя из кэша Redis: %s", user_id)
+
+        await self._publish(USER_MESSAGE_PREFIX + str(user_id))
+
+    async def invalidate_all(self) -> None:
+        # Для изменений в обход интеракторов, например очистки таблиц между тестами
+        self.rule_snapshot.invalidate()
+        self.user_cache.clear()
+        await self._publish(ALL_MESSAGE)
+
+    async def _publish(self, message: str) -> None:
+        # Изменение уже закоммичено, поэтому недоступный Redis не должен ронять запрос:
+        # остальные воркеры сбросят кэш по ttl
+        try:
+            await self.redis.publish(INVALIDATION_CHANNEL, message)
+        except RedisError:
+            logger.warning("Не удалось отправить инвалидацию кэша: %s", message)
+
+
+@dataclass(slots=True, frozen=True)
+class CacheInvalidationListener:
+    redis: RedisClient
+    rule_snapshot: EnabledRuleSnapshot
+    user_cache: LocalUserCache
+
+    def handle(self, message: str) -> None:
+        if message == RULES_MESSAGE:
+            self.rule_snapshot.invalidate()
+        elif message == ALL_MESSAGE:
+            self.invalidate_all()
+        elif message.startswith(USER_MESSAGE_PREFIX):
+            self.user_cache.invalidate(UUID(message.removeprefix(USER_MESSAGE_PREFIX)))
+
+    def invalidate_all(self) -> None:
+        self.rule_snapshot.invalidate()
+        self.user_cache.clear()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                # Пока подписки не было, сообщения могли потеряться
+                self.invalidate_all()
+
+                async for message in self.redis.listen(INVALIDATION_CHANNEL):
+                    self.handle(message)
+            except RedisError:
+                logger.warning("Подписка на инвалидацию кэша потеряна, переподключение")
+
+            await asyncio.sleep(RECONNECT_DELAY)
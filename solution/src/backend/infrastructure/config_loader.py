@@ -19,6 +19,21 @@ class DataBaseConfig:
     pg_host: str = "localhost"
     debug: bool = False
 
+    # Пул соединений на воркер: pool_size постоянных и до max_overflow временных
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    # -1 - не пересоздавать соединения по возрасту
+    pool_recycle: int = -1
+    # False - без SELECT 1 на каждый checkout, разорванные соединения отсеиваются по pool_recycle и ошибкам
+    pool_pre_ping: bool = True
+    # Кэш подготовленных запросов asyncpg на соединение, 0 - для pgbouncer в transaction mode
+    statement_cache_size: int = 100
+    # DSN реплик для read-интеракторов, без них всё читается из основной БД
+    replica_urls: tuple[str, ...] = ()
+    # Сколько секунд после commit чтения пользователя идут в основную БД
+    replica_ryw_window: int = 5
+
     driver: str = "asyncpg"
     database_system: str = "postgresql"
 
@@ -39,6 +54,36 @@ class RedisConfig:
     redis_host: str
 
 
+@dataclass(slots=True)
+class CacheConfig:
+    rules_ttl: float = 30.0
+    users_local_ttl: float = 5.0
+    users_storage_ttl: int = 60
+    tokens_max_size: int = 8192
+
+
+@dataclass(slots=True)
+class CountConfig:
+    # EXACT, CACHED или ESTIMATE, см. CountMode
+    transactions_mode: str = "EXACT"
+    users_mode: str = "EXACT"
+    cache_ttl: int = 10
+
+
+@dataclass(slots=True)
+class PartitionConfig:
+    # Сколько месячных секций вперёд создаётся при старте приложения и при периодической проверке
+    months_ahead: int = 3
+    # Раз в сколько секунд каждый воркер досоздаёт секции
+    check_interval: int = 3600
+
+
+@dataclass(slots=True)
+class HasherConfig:
+    # Потоков под Argon2: столько хэшей считается одновременно, остальные ждут в очереди
+    workers: int = 2
+
+
 @dataclass(slots=True)
 class AdminConfig:
     admin_email: str
@@ -57,6 +102,10 @@ class Config:
     redis: RedisConfig
     jwt: JWTConfig
     admin: AdminConfig
+    cache: CacheConfig
+    count: CountConfig
+    partition: PartitionConfig
+    hasher: HasherConfig
 
     @classmethod
     def load_from_environment(cls: type[Config]) -> Config:
@@ -67,6 +116,14 @@ class Config:
             pg_port=int(os.environ.get("DB_PORT", "5432")),
             pg_host=os.environ.get("DB_HOST", "localhost"),
             debug=str_to_bool(os.environ.get("DB_DEBUG", "False")),
+            pool_size=int(os.environ.get("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+            pool_timeout=float(os.environ.get("DB_POOL_TIMEOUT", "30")),
+            pool_recycle=int(os.environ.get("DB_POOL_RECYCLE", "-1")),
+            pool_pre_ping=str_to_bool(os.environ.get("DB_POOL_PRE_PING", "True")),
+            statement_cache_size=int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "100")),
+            replica_urls=tuple(url for url in os.environ.get("DB_REPLICA_URLS", "").split(",") if url),
+            replica_ryw_window=int(os.environ.get("DB_REPLICA_RYW_WINDOW", "5")),
         )
 
         redis = RedisConfig(
@@ -84,4 +141,35 @@ class Config:
             admin_password=os.environ["ADMIN_PASSWORD"],
         )
 
-        return cls(db=db, redis=redis, admin=admin, jwt=jwt)
+        cache = CacheConfig(
+            rules_ttl=float(os.environ.get("RULES_CACHE_TTL", "30")),
+            users_local_ttl=float(os.environ.get("USERS_CACHE_LOCAL_TTL", "5")),
+            users_storage_ttl=int(os.environ.get("USERS_CACHE_REDIS_TTL", "60")),
+            tokens_max_size=int(os.environ.get("TOKENS_CACHE_SIZE", "8192")),
+        )
+
+        count = CountConfig(
+            transactions_mode=os.environ.get("TRANSACTIONS_COUNT_MODE", "EXACT"),
+            users_mode=os.environ.get("USERS_COUNT_MODE", "EXACT"),
+            cache_ttl=int(os.environ.get("COUNT_CACHE_TTL", "10")),
+        )
+
+        partition = PartitionConfig(
+            months_ahead=int(os.environ.get("PARTITIONS_MONTHS_AHEAD", "3")),
+            check_interval=int(os.environ.get("PARTITIONS_CHECK_INTERVAL", "3600")),
+        )
+
+        hasher = HasherConfig(
+            workers=int(os.environ.get("HASHER_WORKERS", "2")),
+        )
+
+        return cls(
+            db=db,
+            redis=redis,
+            admin=admin,
+            jwt=jwt,
+            cache=cache,
+            count=count,
+            partition=partition,
+            hasher=hasher,
+        )
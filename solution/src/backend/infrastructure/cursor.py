@@ -0,0 +1,64 @@
+import base64
+import binascii
+import hashlib
+import hmac
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from backend.application.common.cursor import Cursor, CursorCodec
+from backend.application.exception.base import CustomValidationError
+
+SEPARATOR = "|"
+SIGNATURE_SIZE = 16
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+@dataclass(slots=True, frozen=True)
+class HMACCursorCodec(CursorCodec):
+    """Непрозрачный курсор: base64(scope|значение|id) с обрезанной HMAC-SHA256 подписью.
+
+    scope не даёт подставить курсор одного списка в другой.
+    """
+
+    secret_key: str
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self.secret_key.encode(), payload, hashlib.sha256).digest()[:SIGNATURE_SIZE]
+
+    def encode(self, cursor: Cursor, scope: str) -> str:
+        payload = SEPARATOR.join((scope, cursor.sort_value.isoformat(), str(cursor.id))).encode()
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload))}"
+
+    def decode(self, token: str, scope: str) -> Cursor:
+        try:
+            raw_payload, raw_signature = token.split(".")
+            payload = _b64decode(raw_payload)
+            signature = _b64decode(raw_signature)
+        except (ValueError, binascii.Error) as e:
+            raise self._invalid(token) from e
+
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            raise self._invalid(token)
+
+        try:
+            cursor_scope, sort_value, raw_id = payload.decode().split(SEPARATOR)
+            cursor = Cursor(sort_value=datetime.fromisoformat(sort_value), id=UUID(raw_id))
+        except ValueError as e:
+            raise self._invalid(token) from e
+
+        if cursor_scope != scope:
+            raise self._invalid(token)
+
+        return cursor
+
+    @staticmethod
+    def _invalid(token: str) -> CustomValidationError:
+        return CustomValidationError(field="cursor", rejected_value=token, issue="Невалидный курсор")
@@ -1,5 +1,6 @@
 from .registry import mapper_registry
 from .table.fraud_rule import fraud_rule_evaluation_result_table, fraud_rule_table
+from .table.stats import merchant_daily_stats_table, transaction_hourly_rollup_table
 from .table.transaction import transaction_location_table, transaction_table
 from .table.user import user_table
 
@@ -7,6 +8,8 @@ __all__ = [
     "fraud_rule_evaluation_result_table",
     "fraud_rule_table",
     "mapper_registry",
+    "merchant_daily_stats_table",
+    "transaction_hourly_rollup_table",
     "transaction_location_table",
     "transaction_table",
     "user_table",
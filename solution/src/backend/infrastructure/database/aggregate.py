@@ -0,0 +1,42 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.infrastructure.database.gateway.stats import merchant_daily_backfill_stmt, rollup_backfill_stmt
+from backend.infrastructure.database.table.stats import (
+    merchant_daily_stats_table,
+    transaction_hourly_rollup_table,
+)
+
+AGGREGATE_TABLES = (transaction_hourly_rollup_table.name, merchant_daily_stats_table.name)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class StatsAggregateRebuilder:
+    engine: AsyncEngine
+
+    async def rebuild(self) -> dict[str, int]:
+        """Пересобирает агрегаты статистики из transaction_table, возвращает число строк по таблицам.
+
+        EXCLUSIVE-блокировка ждёт незакоммиченные записи транзакций и задерживает новые до конца
+        пересборки, поэтому каждая транзакция попадает в агрегаты ровно один раз.
+        """
+        rows: dict[str, int] = {}
+
+        async with self.engine.begin() as conn:
+            await conn.execute(text(f"LOCK TABLE {', '.join(AGGREGATE_TABLES)} IN EXCLUSIVE MODE"))
+            await conn.execute(text(f"TRUNCATE {', '.join(AGGREGATE_TABLES)}"))
+
+            for table, stmt in (
+                (transaction_hourly_rollup_table.name, rollup_backfill_stmt()),
+                (merchant_daily_stats_table.name, merchant_daily_backfill_stmt()),
+            ):
+                rows[table] = (await conn.execute(stmt)).rowcount
+
+        logger.info("Агрегаты статистики пересобраны: %s", rows)
+
+        return rows
@@ -7,6 +7,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from backend.infrastructure.config_loader import Config
+from backend.infrastructure.database.partition import is_partition
 from backend.infrastructure.database.registry import mapper_registry
 
 config = context.config
@@ -17,6 +18,11 @@ if config.config_file_name is not None:
 target_metadata = mapper_registry.metadata
 
 
+def include_name(name: str | None, type_: str, _parent_names: object) -> bool:
+    # Месячные секции создаёт PartitionManager, автогенерация не должна их удалять
+    return not (type_ == "table" and name is not None and is_partition(name))
+
+
 def get_url() -> str:
     cfg = Config.load_from_environment()
     return cfg.db.build_connection_str()
@@ -38,6 +44,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -47,7 +54,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_name=include_name)
 
     with context.begin_transaction():
         context.run_migrations()
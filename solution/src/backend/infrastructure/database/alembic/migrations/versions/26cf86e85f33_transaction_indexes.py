@@ -0,0 +1,99 @@
+"""transaction indexes
+
+Revision ID: 26cf86e85f33
+Revises: 7864eed1ffc8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '26cf86e85f33'
+down_revision: Union[str, Sequence[str], None] = '7864eed1ffc8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        # Список транзакций: сортировка по timestamp, в том числе внутри одного пользователя
+        op.create_index(
+            'ix_transaction_table_timestamp_id',
+            'transaction_table',
+            ['timestamp', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_transaction_table_user_id_timestamp_id',
+            'transaction_table',
+            ['user_id', 'timestamp', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Подсчёт по диапазону created_at с фильтрами - index only scan
+        op.create_index(
+            'ix_transaction_table_created_at',
+            'transaction_table',
+            ['created_at'],
+            postgresql_include=['user_id', 'status', 'is_fraud'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_transaction_table_user_id_created_at',
+            'transaction_table',
+            ['user_id', 'created_at'],
+            postgresql_include=['status', 'is_fraud'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Результаты правил для ReadTransaction, уже в порядке priority
+        op.create_index(
+            'ix_fraud_rule_evaluation_result_table_transaction_id_priority',
+            'fraud_rule_evaluation_result_table',
+            ['transaction_id', 'priority'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_fraud_rule_evaluation_result_table_transaction_id_priority',
+            table_name='fraud_rule_evaluation_result_table',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transaction_table_user_id_created_at',
+            table_name='transaction_table',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transaction_table_created_at',
+            table_name='transaction_table',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transaction_table_user_id_timestamp_id',
+            table_name='transaction_table',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transaction_table_timestamp_id',
+            table_name='transaction_table',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,42 @@
+"""user created_at index
+
+Revision ID: 3a8da683bae7
+Revises: 26cf86e85f33
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a8da683bae7'
+down_revision: Union[str, Sequence[str], None] = '26cf86e85f33'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Курсорная пагинация пользователей по (created_at, id)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_table_created_at_id',
+            'user_table',
+            ['created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_user_table_created_at_id',
+            table_name='user_table',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,151 @@
+"""partition transactions by month
+
+Revision ID: 8388f32b8f31
+Revises: 3a8da683bae7
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8388f32b8f31'
+down_revision: Union[str, Sequence[str], None] = '3a8da683bae7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONED_TABLES = ('transaction_table', 'fraud_rule_evaluation_result_table')
+MONTHS_AHEAD = 3
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def create_indexes() -> None:
+    op.create_index('ix_transaction_table_timestamp_id', 'transaction_table', ['timestamp', 'id'])
+    op.create_index('ix_transaction_table_user_id_timestamp_id', 'transaction_table', ['user_id', 'timestamp', 'id'])
+    op.create_index(
+        'ix_transaction_table_created_at',
+        'transaction_table',
+        ['created_at'],
+        postgresql_include=['user_id', 'status', 'is_fraud'],
+    )
+    op.create_index(
+        'ix_transaction_table_user_id_created_at',
+        'transaction_table',
+        ['user_id', 'created_at'],
+        postgresql_include=['status', 'is_fraud'],
+    )
+    op.create_index(
+        'ix_fraud_rule_evaluation_result_table_transaction_id_priority',
+        'fraud_rule_evaluation_result_table',
+        ['transaction_id', 'priority'],
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Внешний ключ на секционированную таблицу должен включать created_at,
+    # поэтому ссылки на transaction_table.id остаются без ограничения
+    op.drop_constraint('transaction_location_table_id_fkey', 'transaction_location_table', type_='foreignkey')
+    op.drop_constraint(
+        'fraud_rule_evaluation_result_table_transaction_id_fkey',
+        'fraud_rule_evaluation_result_table',
+        type_='foreignkey',
+    )
+
+    # Результаты правил секционируются по created_at своей транзакции
+    op.add_column(
+        'fraud_rule_evaluation_result_table',
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        'UPDATE fraud_rule_evaluation_result_table AS result SET created_at = transaction.created_at '
+        'FROM transaction_table AS transaction WHERE transaction.id = result.transaction_id'
+    )
+    op.alter_column('fraud_rule_evaluation_result_table', 'created_at', nullable=False)
+
+    min_created_at = op.get_bind().execute(sa.text('SELECT min(created_at) FROM transaction_table')).scalar()
+    current = datetime.now(tz=UTC).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    first = current
+    if min_created_at is not None:
+        first = min_created_at.astimezone(UTC).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    months = [first]
+    while months[-1] < add_months(current, MONTHS_AHEAD):
+        months.append(add_months(months[-1], 1))
+
+    for table in PARTITIONED_TABLES:
+        op.execute(f'ALTER TABLE {table} RENAME TO {table}_old')
+        op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey')
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            'PARTITION BY RANGE (created_at)'
+        )
+        # Ключ секционирования обязан входить в первичный ключ
+        op.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)')
+
+        for month in months:
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        op.execute(f'INSERT INTO {table} SELECT * FROM {table}_old')
+        op.execute(f'DROP TABLE {table}_old')
+
+    op.create_foreign_key(
+        'transaction_table_user_id_fkey', 'transaction_table', 'user_table', ['user_id'], ['id'],
+    )
+    op.create_foreign_key(
+        'fraud_rule_evaluation_result_table_rule_id_fkey',
+        'fraud_rule_evaluation_result_table',
+        'fraud_rule_table',
+        ['rule_id'],
+        ['id'],
+    )
+    # Индексы на секционированной таблице создаются в каждой секции, CONCURRENTLY здесь недоступен
+    create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in PARTITIONED_TABLES:
+        op.execute(f'ALTER TABLE {table} RENAME TO {table}_partitioned')
+        op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_partitioned_pkey')
+        op.execute(f'CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        op.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id)')
+        op.execute(f'INSERT INTO {table} SELECT * FROM {table}_partitioned')
+        # Секции удаляются вместе с родительской таблицей
+        op.execute(f'DROP TABLE {table}_partitioned')
+
+    op.drop_column('fraud_rule_evaluation_result_table', 'created_at')
+
+    op.create_foreign_key(
+        'transaction_table_user_id_fkey', 'transaction_table', 'user_table', ['user_id'], ['id'],
+    )
+    op.create_foreign_key(
+        'fraud_rule_evaluation_result_table_rule_id_fkey',
+        'fraud_rule_evaluation_result_table',
+        'fraud_rule_table',
+        ['rule_id'],
+        ['id'],
+    )
+    op.create_foreign_key(
+        'fraud_rule_evaluation_result_table_transaction_id_fkey',
+        'fraud_rule_evaluation_result_table',
+        'transaction_table',
+        ['transaction_id'],
+        ['id'],
+    )
+    op.create_foreign_key(
+        'transaction_location_table_id_fkey', 'transaction_location_table', 'transaction_table', ['id'], ['id'],
+    )
+    create_indexes()
@@ -0,0 +1,56 @@
+"""transaction hourly rollup
+
+Revision ID: b4e1d7a2c9f0
+Revises: 8388f32b8f31
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e1d7a2c9f0'
+down_revision: Union[str, Sequence[str], None] = '8388f32b8f31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'transaction_hourly_rollup_table',
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('channel', sa.String(length=16), nullable=False),
+        sa.Column('merchant_id', sa.String(length=64), nullable=False),
+        sa.Column('merchant_category_code', sa.String(length=4), nullable=False),
+        sa.Column('tx_count', sa.BigInteger(), nullable=False),
+        sa.Column('gmv', sa.Numeric(scale=2), nullable=False),
+        sa.Column('approved_count', sa.BigInteger(), nullable=False),
+        sa.Column('declined_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('bucket_start', 'channel', 'merchant_id', 'merchant_category_code'),
+    )
+    # Агрегаты за уже записанные транзакции, дальше они обновляются при каждой записи
+    op.execute(
+        """
+        INSERT INTO transaction_hourly_rollup_table
+        SELECT
+            date_trunc('hour', created_at, 'UTC'),
+            coalesce(channel::text, ''),
+            coalesce(merchant_id, ''),
+            coalesce(merchant_category_code, ''),
+            count(*),
+            sum(amount),
+            count(*) FILTER (WHERE status = 'APPROVED'),
+            count(*) FILTER (WHERE status = 'DECLINED')
+        FROM transaction_table
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transaction_hourly_rollup_table')
@@ -0,0 +1,55 @@
+"""merchant daily stats
+
+Revision ID: c7a3e9f41d28
+Revises: b4e1d7a2c9f0
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a3e9f41d28'
+down_revision: Union[str, Sequence[str], None] = 'b4e1d7a2c9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'merchant_daily_stats_table',
+        sa.Column('day', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('merchant_id', sa.String(length=64), nullable=False),
+        sa.Column('merchant_category_code', sa.String(length=4), nullable=False),
+        sa.Column('tx_count', sa.BigInteger(), nullable=False),
+        sa.Column('gmv', sa.Numeric(scale=2), nullable=False),
+        sa.Column('approved_count', sa.BigInteger(), nullable=False),
+        sa.Column('declined_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'merchant_id', 'merchant_category_code'),
+    )
+    # Агрегаты за уже записанные транзакции, то же самое делает команда `backend stats rebuild`
+    op.execute(
+        """
+        INSERT INTO merchant_daily_stats_table
+        SELECT
+            date_trunc('day', created_at, 'UTC'),
+            merchant_id,
+            coalesce(merchant_category_code, ''),
+            count(*),
+            sum(amount),
+            count(*) FILTER (WHERE status = 'APPROVED'),
+            count(*) FILTER (WHERE status = 'DECLINED')
+        FROM transaction_table
+        WHERE merchant_id IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('merchant_daily_stats_table')
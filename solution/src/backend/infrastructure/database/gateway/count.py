@@ -0,0 +1,135 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import Select, literal_column, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.application.common.count import CountMode, TotalCounter
+from backend.application.common.storage import IStorageClient
+from backend.domain.misc_types import TransactionStatus
+from backend.infrastructure.database.gateway.transaction import transaction_count_stmt
+from backend.infrastructure.database.gateway.user import user_count_stmt
+from backend.infrastructure.database.read_only import SAReadOnlyMode
+from backend.infrastructure.database.table.user import user_table
+
+COUNT_KEY_PREFIX = "antifraud:count:"
+DEFAULT_CACHE_TTL = 10
+# Ниже этого порога оценка планировщика слишком неточна, а точный подсчёт дёшев
+DEFAULT_EXACT_THRESHOLD = 10_000
+
+RELTUPLES_STMT = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class SATotalCounter(TotalCounter):
+    """Считает total в собственной сессии, поэтому может выполняться параллельно со страницей.
+
+    Сессия подключается к движку, выбранному ReadOnlyMode.enable: это реплика или основная БД
+    в окне read-your-writes, как и у сессии запроса, поэтому total согласован со страницей.
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+    read_only: SAReadOnlyMode
+    storage: IStorageClient
+    cache_ttl: int = DEFAULT_CACHE_TTL
+    exact_threshold: int = DEFAULT_EXACT_THRESHOLD
+
+    async def count_transactions(
+        self,
+        mode: CountMode,
+        from_: datetime,
+        to: datetime,
+        user_id: UUID | None = None,
+        status: TransactionStatus | None = None,
+        is_fraud: bool | None = None,
+    ) -> int:
+        stmt = transaction_count_stmt(from_, to, user_id=user_id, status=status, is_fraud=is_fraud)
+
+        if mode == CountMode.ESTIMATE:
+            return await self._estimate(stmt)
+
+        if mode == CountMode.CACHED:
+            # Границы интервала округляются до ttl, иначе from/to "от текущего момента" не попадут в кэш
+            signature = {
+                "from": int(from_.timestamp()) // self.cache_ttl,
+                "to": int(to.timestamp()) // self.cache_ttl,
+                "user_id": str(user_id) if user_id is not None else None,
+                "status": status.value if status is not None else None,
+                "is_fraud": is_fraud,
+            }
+            return await self._cached("transactions", signature, stmt)
+
+        return await self._exact(stmt)
+
+    async def count_users(self, mode: CountMode) -> int:
+        stmt = user_count_stmt()
+
+        if mode == CountMode.ESTIMATE:
+            return await self._estimate_table(user_table.name, stmt)
+
+        if mode == CountMode.CACHED:
+            return await self._cached("users", {}, stmt)
+
+        return await self._exact(stmt)
+
+    def _session(self) -> AsyncSession:
+        return self.session_factory(bind=self.read_only.bind)
+
+    async def _exact(self, stmt: Select[tuple[int]]) -> int:
+        async with self._session() as session:
+            return (await session.execute(stmt)).scalar_one()
+
+    async def _cached(self, resource: str, signature: dict[str, Any], stmt: Select[tuple[int]]) -> int:
+        raw_signature = json.dumps(signature, sort_keys=True).encode()
+        key = f"{COUNT_KEY_PREFIX}{resource}:{hashlib.sha1(raw_signature, usedforsecurity=False).hexdigest()}"
+
+        try:
+            if (raw := await self.storage.get(key)) is not None:
+                return int(raw)
+        except RedisError:
+            logger.warning("Кэш total в Redis недоступен")
+            return await self._exact(stmt)
+
+        total = await self._exact(stmt)
+
+        try:
+            await self.storage.set(key, total, expire=self.cache_ttl)
+        except RedisError:
+            logger.warning("Кэш total в Redis недоступен")
+
+        return total
+
+    async def _estimate_table(self, table: str, stmt: Select[tuple[int]]) -> int:
+        # reltuples обновляется VACUUM/ANALYZE, для новой таблицы он равен -1
+        async with self._session() as session:
+            estimate = (await session.execute(RELTUPLES_STMT, {"table": table})).scalar_one_or_none()
+
+        if estimate is None or estimate < self.exact_threshold:
+            return await self._exact(stmt)
+
+        return int(estimate)
+
+    async def _estimate(self, stmt: Select[tuple[int]]) -> int:
+        # EXPLAIN не принимает параметры, поэтому значения фильтров подставляются литералами
+        plan_stmt: Select[tuple[Any]] = stmt.with_only_columns(literal_column("1"))
+        dialect = self.read_only.bind.dialect
+        compiled = plan_stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+
+        async with self._session() as session:
+            raw_plan = (await session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))).scalar_one()
+
+        plan = json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan
+        estimate = plan[0]["Plan"].get("Plan Rows")
+
+        if estimate is None or estimate < self.exact_threshold:
+            return await self._exact(stmt)
+
+        return int(estimate)
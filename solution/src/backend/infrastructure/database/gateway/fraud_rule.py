@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -60,6 +61,7 @@ class SAFraudRuleEvaluationResultGateway(FraudRuleEvaluationResultGateway):
     async def get_many(
         self,
         transaction_id: UUID | None = None,
+        created_at: datetime | None = None,
     ) -> Sequence[FraudRuleEvaluationResult]:
         stmt = select(FraudRuleEvaluationResult).order_by(
             fraud_rule_evaluation_result_table.c.priority.asc(),
@@ -69,6 +71,9 @@ class SAFraudRuleEvaluationResultGateway(FraudRuleEvaluationResultGateway):
             stmt = stmt.where(
                 fraud_rule_evaluation_result_table.c.transaction_id == transaction_id,
             )
+        if created_at is not None:
+            # created_at транзакции оставляет в плане одну секцию
+            stmt = stmt.where(fraud_rule_evaluation_result_table.c.created_at == created_at)
 
         res = await self.session.execute(stmt)
 
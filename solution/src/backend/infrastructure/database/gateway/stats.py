@@ -0,0 +1,382 @@
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    String,
+    Subquery,
+    Table,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.application.common.gateway.stats import StatsGateway
+from backend.application.stats.dto import MerchantStats, RuleMatchStats, StatsBucket
+from backend.domain.entity.transaction import Transaction
+from backend.domain.misc_types import StatsGroupBy, TransactionChannel, TransactionStatus
+from backend.infrastructure.database.table.fraud_rule import fraud_rule_evaluation_result_table
+from backend.infrastructure.database.table.stats import (
+    merchant_daily_stats_table,
+    transaction_hourly_rollup_table,
+)
+from backend.infrastructure.database.table.transaction import transaction_table
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+ROLLUP_KEY = ("bucket_start", "channel", "merchant_id", "merchant_category_code")
+MERCHANT_DAILY_KEY = ("day", "merchant_id", "merchant_category_code")
+ROLLUP_COUNTERS = ("tx_count", "gmv", "approved_count", "declined_count")
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_hour(value: datetime) -> datetime:
+    hour = floor_hour(value)
+    return hour if hour == value else hour + HOUR
+
+
+def floor_day(value: datetime) -> datetime:
+    return floor_hour(value).replace(hour=0)
+
+
+def ceil_day(value: datetime) -> datetime:
+    day = floor_day(value)
+    return day if day == value else day + DAY
+
+
+def aggregate_rows(
+    transactions: Iterable[Transaction],
+    key_names: Sequence[str],
+    key: Callable[[Transaction], tuple[Any, ...]],
+) -> list[dict[str, Any]]:
+    """Строки агрегатов, сложенные по ключу: ON CONFLICT не обновит одну строку дважды."""
+    rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    for transaction in transactions:
+        row_key = key(transaction)
+        row = rows.setdefault(
+            row_key,
+            dict(zip(key_names, row_key, strict=True)) | dict.fromkeys(ROLLUP_COUNTERS, 0),
+        )
+        row["tx_count"] += 1
+        row["gmv"] += transaction.amount
+        row["approved_count"] += transaction.status == TransactionStatus.APPROVED
+        row["declined_count"] += transaction.status == TransactionStatus.DECLINED
+
+    # Одинаковый порядок строк у конкурентных пачек, чтобы блокировки брались без взаимоблокировок
+    return [rows[row_key] for row_key in sorted(rows)]
+
+
+def rollup_rows(transactions: Iterable[Transaction]) -> list[dict[str, Any]]:
+    return aggregate_rows(
+        transactions,
+        ROLLUP_KEY,
+        lambda transaction: (
+            floor_hour(transaction.created_at),
+            transaction.channel.value if transaction.channel is not None else "",
+            transaction.merchant_id or "",
+            transaction.merchant_category_code or "",
+        ),
+    )
+
+
+def merchant_daily_rows(transactions: Iterable[Transaction]) -> list[dict[str, Any]]:
+    return aggregate_rows(
+        (transaction for transaction in transactions if transaction.merchant_id is not None),
+        MERCHANT_DAILY_KEY,
+        lambda transaction: (
+            floor_day(transaction.created_at),
+            transaction.merchant_id,
+            transaction.merchant_category_code or "",
+        ),
+    )
+
+
+def counters_upsert(table: Table, key_names: Sequence[str], rows: list[dict[str, Any]]) -> Insert:
+    stmt = insert(table).values(rows)
+
+    return stmt.on_conflict_do_update(
+        index_elements=list(key_names),
+        set_={counter: table.c[counter] + stmt.excluded[counter] for counter in ROLLUP_COUNTERS},
+    )
+
+
+def rollup_upsert(rows: list[dict[str, Any]]) -> Insert:
+    return counters_upsert(transaction_hourly_rollup_table, ROLLUP_KEY, rows)
+
+
+def merchant_daily_upsert(rows: list[dict[str, Any]]) -> Insert:
+    return counters_upsert(merchant_daily_stats_table, MERCHANT_DAILY_KEY, rows)
+
+
+def rollup_backfill_stmt() -> Insert:
+    """Почасовые агрегаты по всей истории транзакций."""
+    created_at = transaction_table.c.created_at
+    status = transaction_table.c.status
+    bucket_start = func.date_trunc("hour", created_at, "UTC")
+    channel = func.coalesce(cast(transaction_table.c.channel, String), "")
+    merchant_id = func.coalesce(transaction_table.c.merchant_id, "")
+    merchant_category_code = func.coalesce(transaction_table.c.merchant_category_code, "")
+
+    rows = select(
+        bucket_start,
+        channel,
+        merchant_id,
+        merchant_category_code,
+        func.count(),
+        func.sum(transaction_table.c.amount),
+        func.count().filter(status == TransactionStatus.APPROVED),
+        func.count().filter(status == TransactionStatus.DECLINED),
+    ).group_by(bucket_start, channel, merchant_id, merchant_category_code)
+
+    return insert(transaction_hourly_rollup_table).from_select([*ROLLUP_KEY, *ROLLUP_COUNTERS], rows)
+
+
+def merchant_daily_backfill_stmt() -> Insert:
+    """Суточные агрегаты мерчантов по всей истории транзакций."""
+    status = transaction_table.c.status
+    day = func.date_trunc("day", transaction_table.c.created_at, "UTC")
+    merchant_category_code = func.coalesce(transaction_table.c.merchant_category_code, "")
+
+    rows = (
+        select(
+            day,
+            transaction_table.c.merchant_id,
+            merchant_category_code,
+            func.count(),
+            func.sum(transaction_table.c.amount),
+            func.count().filter(status == TransactionStatus.APPROVED),
+            func.count().filter(status == TransactionStatus.DECLINED),
+        )
+        .where(transaction_table.c.merchant_id.is_not(None))
+        .group_by(day, transaction_table.c.merchant_id, merchant_category_code)
+    )
+
+    return insert(merchant_daily_stats_table).from_select([*MERCHANT_DAILY_KEY, *ROLLUP_COUNTERS], rows)
+
+
+def stats_source(from_: datetime, to: datetime, channel: TransactionChannel | None = None) -> Subquery:
+    """Почасовые строки за [from_, to): целые часы из агрегатов, неполные крайние - из транзакций."""
+    full_from, full_to = ceil_hour(from_), floor_hour(to)
+    rollup = transaction_hourly_rollup_table
+    created_at = transaction_table.c.created_at
+
+    rollup_part = select(
+        rollup.c.bucket_start,
+        rollup.c.channel,
+        rollup.c.merchant_id,
+        rollup.c.merchant_category_code,
+        *(rollup.c[counter] for counter in ROLLUP_COUNTERS),
+    ).where(rollup.c.bucket_start >= full_from, rollup.c.bucket_start < full_to)
+
+    raw_part = select(
+        func.date_trunc("hour", created_at, "UTC").label("bucket_start"),
+        func.coalesce(cast(transaction_table.c.channel, String), "").label("channel"),
+        func.coalesce(transaction_table.c.merchant_id, "").label("merchant_id"),
+        func.coalesce(transaction_table.c.merchant_category_code, "").label("merchant_category_code"),
+        literal(1, BigInteger).label("tx_count"),
+        transaction_table.c.amount.label("gmv"),
+        case((transaction_table.c.status == TransactionStatus.APPROVED, 1), else_=0).label("approved_count"),
+        case((transaction_table.c.status == TransactionStatus.DECLINED, 1), else_=0).label("declined_count"),
+    ).where(
+        or_(
+            and_(created_at >= from_, created_at < min(full_from, to)),
+            and_(created_at >= max(full_to, full_from), created_at < to),
+        ),
+    )
+
+    if channel is not None:
+        rollup_part = rollup_part.where(rollup.c.channel == channel.value)
+        raw_part = raw_part.where(transaction_table.c.channel == channel)
+
+    return union_all(rollup_part, raw_part).subquery("stats_source")
+
+
+def merchant_source(from_: datetime, to: datetime) -> Subquery:
+    """Строки мерчантов за [from_, to): целые сутки из дневных агрегатов, крайние - из stats_source."""
+    full_from, full_to = ceil_day(from_), floor_day(to)
+    daily = merchant_daily_stats_table
+
+    parts = []
+    edges = [(from_, to)]
+    if full_from < full_to:
+        parts.append(
+            select(
+                daily.c.merchant_id,
+                daily.c.merchant_category_code,
+                *(daily.c[counter] for counter in ROLLUP_COUNTERS),
+            ).where(daily.c.day >= full_from, daily.c.day < full_to),
+        )
+        edges = [(from_, full_from), (full_to, to)]
+
+    for edge_from, edge_to in edges:
+        if edge_from >= edge_to:
+            continue
+
+        source = stats_source(edge_from, edge_to)
+        parts.append(
+            select(
+                source.c.merchant_id,
+                source.c.merchant_category_code,
+                *(source.c[counter] for counter in ROLLUP_COUNTERS),
+            ).where(source.c.merchant_id != ""),
+        )
+
+    return union_all(*parts).subquery("merchant_source")
+
+
+@dataclass(slots=True, frozen=True)
+class SAStatsGateway(StatsGateway):
+    session: AsyncSession
+
+    async def get_totals(self, from_: datetime, to: datetime) -> StatsBucket:
+        source = stats_source(from_, to)
+        stmt = select(*self._sums(source))
+
+        row = (await self.session.execute(stmt)).one()
+
+        return StatsBucket(
+            bucket_start=from_,
+            tx_count=int(row.tx_count),
+            gmv=Decimal(row.gmv),
+            approved_count=int(row.approved_count),
+            declined_count=int(row.declined_count),
+        )
+
+    async def get_top_risk_merchants(
+        self,
+        from_: datetime,
+        to: datetime,
+        limit: int,
+        merchant_category_code: str | None = None,
+    ) -> Sequence[MerchantStats]:
+        source = merchant_source(from_, to)
+        tx_count = func.sum(source.c.tx_count)
+        declined_count = func.sum(source.c.declined_count)
+
+        stmt = (
+            select(
+                source.c.merchant_id,
+                func.max(func.nullif(source.c.merchant_category_code, "")).label("merchant_category_code"),
+                tx_count.label("tx_count"),
+                func.sum(source.c.gmv).label("gmv"),
+                declined_count.label("declined_count"),
+            )
+            .group_by(source.c.merchant_id)
+            .order_by((declined_count / tx_count).desc(), tx_count.desc())
+            .limit(limit)
+        )
+        # Postgres переносит условие внутрь каждой ветки UNION ALL
+        if merchant_category_code is not None:
+            stmt = stmt.where(source.c.merchant_category_code == merchant_category_code)
+
+        res = await self.session.execute(stmt)
+
+        return [
+            MerchantStats(
+                merchant_id=row.merchant_id,
+                merchant_category_code=row.merchant_category_code,
+                tx_count=int(row.tx_count),
+                gmv=Decimal(row.gmv),
+                declined_count=int(row.declined_count),
+            )
+            for row in res
+        ]
+
+    async def get_timeseries(
+        self,
+        from_: datetime,
+        to: datetime,
+        group_by: StatsGroupBy,
+        timezone: str,
+        channel: TransactionChannel | None = None,
+    ) -> Sequence[StatsBucket]:
+        source = stats_source(from_, to, channel)
+
+        # Дни и недели собираются из часов в локальном времени и переводятся обратно в UTC
+        bucket: ColumnElement[datetime] = source.c.bucket_start
+        if group_by != StatsGroupBy.HOUR:
+            local_hour = func.timezone(timezone, source.c.bucket_start)
+            bucket = func.timezone(timezone, func.date_trunc(group_by.value, local_hour))
+
+        stmt = select(bucket.label("bucket_start"), *self._sums(source)).group_by(bucket).order_by(bucket)
+
+        res = await self.session.execute(stmt)
+
+        return [
+            StatsBucket(
+                bucket_start=row.bucket_start,
+                tx_count=int(row.tx_count),
+                gmv=Decimal(row.gmv),
+                approved_count=int(row.approved_count),
+                declined_count=int(row.declined_count),
+            )
+            for row in res
+        ]
+
+    async def get_rule_matches(self, from_: datetime, to: datetime, limit: int) -> Sequence[RuleMatchStats]:
+        result = fraud_rule_evaluation_result_table
+        transaction = transaction_table
+        matches = func.count()
+        declined = transaction.c.status == TransactionStatus.DECLINED
+
+        # Условие по created_at обеих таблиц отсекает лишние месячные секции
+        stmt = (
+            select(
+                result.c.rule_id,
+                func.max(result.c.rule_name).label("rule_name"),
+                matches.label("matches"),
+                func.count(transaction.c.user_id.distinct()).label("unique_users"),
+                func.count(transaction.c.merchant_id.distinct()).label("unique_merchants"),
+                func.count().filter(declined).label("declined_matches"),
+            )
+            .join(
+                transaction,
+                and_(
+                    transaction.c.id == result.c.transaction_id,
+                    transaction.c.created_at == result.c.created_at,
+                ),
+            )
+            .where(
+                result.c.matched.is_(True),
+                result.c.created_at >= from_,
+                result.c.created_at < to,
+                transaction.c.created_at >= from_,
+                transaction.c.created_at < to,
+            )
+            .group_by(result.c.rule_id)
+            .order_by(matches.desc())
+            .limit(limit)
+        )
+
+        res = await self.session.execute(stmt)
+
+        return [
+            RuleMatchStats(
+                rule_id=row.rule_id,
+                rule_name=row.rule_name,
+                matches=row.matches,
+                unique_users=row.unique_users,
+                unique_merchants=row.unique_merchants,
+                declined_matches=row.declined_matches,
+            )
+            for row in res
+        ]
+
+    @staticmethod
+    def _sums(source: Subquery) -> list[ColumnElement[Any]]:
+        return [func.coalesce(func.sum(source.c[counter]), 0).label(counter) for counter in ROLLUP_COUNTERS]
@@ -1,15 +1,96 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, insert, literal, select, tuple_
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.application.common.cursor import Cursor
 from backend.application.common.gateway.transaction import TransactionGateway
-from backend.domain.entity.transaction import Transaction
+from backend.application.exception.transaction import TransactionPersistError
+from backend.domain.entity.fraud_rule import FraudRuleEvaluationResult
+from backend.domain.entity.transaction import Transaction, TransactionLocation
 from backend.domain.misc_types import TransactionStatus
-from backend.infrastructure.database.table.transaction import transaction_table
+from backend.infrastructure.database.gateway.stats import (
+    merchant_daily_rows,
+    merchant_daily_upsert,
+    rollup_rows,
+    rollup_upsert,
+)
+from backend.infrastructure.database.table.fraud_rule import fraud_rule_evaluation_result_table
+from backend.infrastructure.database.table.transaction import (
+    transaction_location_table,
+    transaction_table,
+)
+
+
+def transaction_count_stmt(
+    from_: datetime,
+    to: datetime,
+    user_id: UUID | None = None,
+    status: TransactionStatus | None = None,
+    is_fraud: bool | None = None,
+) -> Select[tuple[int]]:
+    stmt = (
+        select(func.count())
+        .select_from(transaction_table)
+        .where(transaction_table.c.created_at >= from_)
+        .where(transaction_table.c.created_at <= to)
+    )
+
+    if user_id is not None:
+        stmt = stmt.where(transaction_table.c.user_id == user_id)
+    if status is not None:
+        stmt = stmt.where(transaction_table.c.status == status)
+    if is_fraud is not None:
+        stmt = stmt.where(transaction_table.c.is_fraud == is_fraud)
+
+    return stmt
+
+
+def transaction_row(transaction: Transaction) -> dict[str, Any]:
+    return {
+        "id": transaction.id,
+        "user_id": transaction.user_id,
+        "amount": transaction.amount,
+        "currency": transaction.currency,
+        "status": transaction.status,
+        "merchant_id": transaction.merchant_id,
+        "merchant_category_code": transaction.merchant_category_code,
+        "timestamp": transaction.timestamp,
+        "ip_address": transaction.ip_address,
+        "device_id": transaction.device_id,
+        "channel": transaction.channel,
+        "is_fraud": transaction.is_fraud,
+        "metadata": transaction.metadata,
+        "created_at": transaction.created_at,
+    }
+
+
+def location_row(transaction_id: UUID, location: TransactionLocation) -> dict[str, Any]:
+    return {
+        "id": transaction_id,
+        "country": location.country,
+        "city": location.city,
+        "latitude": location.latitude,
+        "longitude": location.longitude,
+    }
+
+
+def rule_result_row(rule_result: FraudRuleEvaluationResult) -> dict[str, Any]:
+    return {
+        "id": rule_result.id,
+        "transaction_id": rule_result.transaction_id,
+        "rule_id": rule_result.rule_id,
+        "rule_name": rule_result.rule_name,
+        "priority": rule_result.priority,
+        "matched": rule_result.matched,
+        "description": rule_result.description,
+        "created_at": rule_result.created_at,
+    }
 
 
 @dataclass(slots=True, frozen=True)
@@ -30,10 +111,11 @@ class SATransactionGateway(TransactionGateway):
         user_id: UUID | None = None,
         status: TransactionStatus | None = None,
         is_fraud: bool | None = None,
+        after: Cursor | None = None,
     ) -> Sequence[Transaction]:
         stmt = (
             select(Transaction)
-            .order_by(transaction_table.c.timestamp.desc())
+            .order_by(transaction_table.c.timestamp.desc(), transaction_table.c.id.desc())
             .where(transaction_table.c.created_at >= from_)
             .where(transaction_table.c.created_at <= to)
         )
@@ -44,6 +126,15 @@ class SATransactionGateway(TransactionGateway):
             stmt = stmt.where(transaction_table.c.status == status)
         if is_fraud is not None:
             stmt = stmt.where(transaction_table.c.is_fraud == is_fraud)
+        if after is not None:
+            # Сравнение строк (timestamp, id) < (...) идёт по индексу (timestamp, id) без OFFSET
+            stmt = stmt.where(
+                tuple_(transaction_table.c.timestamp, transaction_table.c.id)
+                < tuple_(
+                    literal(after.sort_value, type_=transaction_table.c.timestamp.type),
+                    literal(after.id, type_=transaction_table.c.id.type),
+                ),
+            )
 
         stmt = stmt.offset(offset).limit(size)
 
@@ -59,20 +150,74 @@ class SATransactionGateway(TransactionGateway):
         status: TransactionStatus | None = None,
         is_fraud: bool | None = None,
     ) -> int | None:
-        stmt = (
-            select(func.count())
-            .select_from(transaction_table)
-            .where(transaction_table.c.created_at >= from_)
-            .where(transaction_table.c.created_at <= to)
+        stmt = transaction_count_stmt(from_, to, user_id=user_id, status=status, is_fraud=is_fraud)
+        res = await self.session.execute(stmt)
+
+        return res.scalar()
+
+    async def add(
+        self,
+        transaction: Transaction,
+        rule_results: Sequence[FraudRuleEvaluationResult],
+    ) -> None:
+        # Транзакция, локация, результаты правил и агрегаты статистики пишутся одним запросом
+        # с data-modifying CTE
+        transaction_cte = (
+            insert(transaction_table)
+            .values(transaction_row(transaction))
+            .returning(transaction_table.c.id)
+            .cte("inserted_transaction")
         )
+        ctes = [rollup_upsert(rollup_rows((transaction,))).cte("updated_rollup")]
 
-        if user_id is not None:
-            stmt = stmt.where(transaction_table.c.user_id == user_id)
-        if status is not None:
-            stmt = stmt.where(transaction_table.c.status == status)
-        if is_fraud is not None:
-            stmt = stmt.where(transaction_table.c.is_fraud == is_fraud)
+        if transaction.location is not None:
+            ctes.append(
+                insert(transaction_location_table)
+                .values(location_row(transaction.id, transaction.location))
+                .cte("inserted_location"),
+            )
+        if transaction.merchant_id is not None:
+            ctes.append(
+                merchant_daily_upsert(merchant_daily_rows((transaction,))).cte("updated_merchant_stats"),
+            )
+        if rule_results:
+            ctes.append(
+                insert(fraud_rule_evaluation_result_table)
+                .values([rule_result_row(rule_result) for rule_result in rule_results])
+                .cte("inserted_rule_results"),
+            )
 
-        res = await self.session.execute(stmt)
+        stmt = select(transaction_cte.c.id).add_cte(*ctes)
 
-        return res.scalar()
+        try:
+            await self.session.execute(stmt)
+        except DBAPIError as e:
+            raise TransactionPersistError from e
+
+    async def add_many(
+        self,
+        transactions: Sequence[Transaction],
+        rule_results: Sequence[FraudRuleEvaluationResult],
+    ) -> None:
+        # Core INSERT со списком параметров: SQLAlchemy собирает его в многострочные
+        # INSERT ... VALUES (insertmanyvalues), по одному запросу на таблицу
+        transaction_rows = [transaction_row(transaction) for transaction in transactions]
+        location_rows = [
+            location_row(transaction.id, transaction.location)
+            for transaction in transactions
+            if transaction.location is not None
+        ]
+        rule_result_rows = [rule_result_row(rule_result) for rule_result in rule_results]
+
+        try:
+            await self.session.execute(insert(transaction_table), transaction_rows)
+            if location_rows:
+                await self.session.execute(insert(transaction_location_table), location_rows)
+            if rule_result_rows:
+                await self.session.execute(insert(fraud_rule_evaluation_result_table), rule_result_rows)
+            if transactions:
+                await self.session.execute(rollup_upsert(rollup_rows(transactions)))
+            if merchant_rows := merchant_daily_rows(transactions):
+                await self.session.execute(merchant_daily_upsert(merchant_rows))
+        except DBAPIError as e:
+            raise TransactionPersistError from e
@@ -1,15 +1,20 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.application.common.cursor import Cursor
 from backend.application.common.gateway.user import UserGateway
 from backend.domain.entity.user import User
 from backend.infrastructure.database.table.user import user_table
 
 
+def user_count_stmt() -> Select[tuple[int]]:
+    return select(func.count()).select_from(user_table)
+
+
 @dataclass(slots=True, frozen=True)
 class SAUserGateway(UserGateway):
     session: AsyncSession
@@ -19,28 +24,47 @@ class SAUserGateway(UserGateway):
 
         return user
 
+    async def get_many_by_ids(self, ids: Collection[UUID]) -> Sequence[User]:
+        if not ids:
+            return []
+
+        stmt = select(User).where(user_table.c.id.in_(ids))
+        res = await self.session.execute(stmt)
+
+        return res.scalars().all()
+
     async def get_by_email(self, email: str) -> User | None:
         stmt = select(User).where(user_table.c.email == email)
         res = await self.session.execute(stmt)
 
         return res.scalar()
 
-    async def get_many(self, offset: int, size: int) -> Sequence[User]:
+    async def get_many(self, offset: int, size: int, after: Cursor | None = None) -> Sequence[User]:
         stmt = (
             select(User)
             .order_by(
                 user_table.c.created_at.asc(),
+                user_table.c.id.asc(),
             )
             .offset(offset)
             .limit(size)
         )
 
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(user_table.c.created_at, user_table.c.id)
+                > tuple_(
+                    literal(after.sort_value, type_=user_table.c.created_at.type),
+                    literal(after.id, type_=user_table.c.id.type),
+                ),
+            )
+
         res = await self.session.execute(stmt)
 
         return res.scalars().all()
 
     async def get_count(self) -> int | None:
-        stmt = select(func.count()).select_from(user_table)
+        stmt = user_count_stmt()
         res = await self.session.execute(stmt)
 
         return res.scalar()
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from backend.infrastructure.database.table.fraud_rule import fraud_rule_evaluation_result_table
+from backend.infrastructure.database.table.transaction import transaction_location_table, transaction_table
+
+# Таблицы с месячными секциями по created_at
+PARTITIONED_TABLES = (transaction_table.name, fraud_rule_evaluation_result_table.name)
+PARTITION_SUFFIX_FORMAT = "_p%Y_%m"
+DEFAULT_PARTITION_SUFFIX = "_default"
+DEFAULT_MONTHS_AHEAD = 3
+DEFAULT_CHECK_INTERVAL = 3600
+# Ключ pg_advisory_xact_lock, чтобы воркеры не создавали секции одновременно
+PARTITION_LOCK_KEY = 7_460_301
+
+LIST_PARTITIONS_STMT = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = CAST(:table AS regclass)
+    ORDER BY child.relname
+    """,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return table + month.strftime(PARTITION_SUFFIX_FORMAT)
+
+
+def partition_month(table: str, name: str) -> datetime | None:
+    """Месяц секции по её имени, None для DEFAULT и посторонних секций."""
+    try:
+        return datetime.strptime(name.removeprefix(table), PARTITION_SUFFIX_FORMAT).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def is_partition(name: str) -> bool:
+    return any(
+        name == table + DEFAULT_PARTITION_SUFFIX or partition_month(table, name) is not None
+        for table in PARTITIONED_TABLES
+        if name.startswith(table)
+    )
+
+
+def create_partition_stmts(table: str, month: datetime) -> tuple[TextClause, ...]:
+    """Создание секции месяца с переносом строк этого месяца, уже попавших в DEFAULT.
+
+    CREATE TABLE ... PARTITION OF падает, если в DEFAULT есть строки из диапазона секции. Поэтому секция
+    создаётся отдельной таблицей, строки переносятся в неё из DEFAULT и только затем она присоединяется.
+    Имена и границы берутся из метаданных и дат, а не из ввода.
+    """
+    lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+    name = partition_name(table, month)
+    default = table + DEFAULT_PARTITION_SUFFIX
+
+    return (
+        text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"),
+        text(
+            f"WITH moved AS ("  # noqa: S608
+            f"DELETE FROM {default} WHERE created_at >= '{lower}' AND created_at < '{upper}' RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved",
+        ),
+        text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{lower}') TO ('{upper}')"),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class PartitionManager:
+    engine: AsyncEngine
+
+    async def ensure(
+        self,
+        months_ahead: int = DEFAULT_MONTHS_AHEAD,
+        months_back: int = 0,
+        now: datetime | None = None,
+    ) -> list[str]:
+        """Создаёт недостающие месячные секции от now - months_back до now + months_ahead."""
+        current = month_start(now or datetime.now(tz=UTC))
+        created: list[str] = []
+        moved = 0
+
+        async with self.engine.begin() as conn:
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+            for table in PARTITIONED_TABLES:
+                existing = set(await self._partitions(conn, table))
+
+                for offset in range(-months_back, months_ahead + 1):
+                    month = add_months(current, offset)
+                    name = partition_name(table, month)
+                    if name in existing:
+                        continue
+
+                    create_stmt, move_stmt, attach_stmt = create_partition_stmts(table, month)
+                    await conn.execute(create_stmt)
+                    moved += (await conn.execute(move_stmt)).rowcount
+                    await conn.execute(attach_stmt)
+                    created.append(name)
+
+        if created:
+            logger.info("Созданы секции: %s", ", ".join(created))
+        if moved:
+            logger.warning("Из DEFAULT в новые секции перенесено строк: %s", moved)
+
+        return created
+
+    async def detach(
+        self,
+        retention_months: int,
+        drop: bool = False,
+        now: datetime | None = None,
+    ) -> list[str]:
+        """Отсоединяет секции, целиком старше retention_months месяцев, и при drop удаляет их."""
+        cutoff = add_months(month_start(now or datetime.now(tz=UTC)), -retention_months)
+        detached: list[str] = []
+
+        async with self.engine.begin() as conn:
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+            for table in PARTITIONED_TABLES:
+                for name in await self._partitions(conn, table):
+                    month = partition_month(table, name)
+                    if month is None or add_months(month, 1) > cutoff:
+                        continue
+
+                    # Имена таблиц берутся из метаданных и каталога, а не из ввода
+                    await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                    if drop:
+                        if table == transaction_table.name:
+                            # Локации не секционированы и без внешнего ключа, их удаляют вместе с секцией.
+                            # Отсоединённая секция остаётся архивом, и её локации сохраняются
+                            await conn.execute(
+                                text(
+                                    f"DELETE FROM {transaction_location_table.name} "  # noqa: S608
+                                    f"WHERE id IN (SELECT id FROM {name})",
+                                ),
+                            )
+                        await conn.execute(text(f"DROP TABLE {name}"))
+
+                    detached.append(name)
+
+        if detached:
+            logger.info("%s секции: %s", "Удалены" if drop else "Отсоединены", ", ".join(detached))
+
+        return detached
+
+    async def _partitions(self, conn: AsyncConnection, table: str) -> list[str]:
+        return list((await conn.execute(LIST_PARTITIONS_STMT, {"table": table})).scalars())
+
+
+@dataclass(slots=True, frozen=True)
+class PartitionMaintainer:
+    """Периодически досоздаёт секции, чтобы долго работающий процесс не начал писать в DEFAULT."""
+
+    manager: PartitionManager
+    months_ahead: int = DEFAULT_MONTHS_AHEAD
+    interval: float = DEFAULT_CHECK_INTERVAL
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+
+            try:
+                await self.manager.ensure(months_ahead=self.months_ahead)
+            except (DBAPIError, OSError):
+                logger.exception("Не удалось создать секции транзакций, повтор через %s с", self.interval)
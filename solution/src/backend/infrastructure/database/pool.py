@@ -0,0 +1,66 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from backend.application.common.pool_metrics import DBPoolMetrics
+from backend.application.stats.dto import DBPoolStats
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Пул asyncpg, который считает выдачи соединений, тайм-ауты и время получения соединения."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            self._record_wait(start)
+            raise
+
+        self.checkouts += 1
+        self._record_wait(start)
+        return connection
+
+    def _record_wait(self, start: float) -> None:
+        wait = time.perf_counter() - start
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+
+@dataclass(slots=True, frozen=True)
+class SAPoolMetrics(DBPoolMetrics):
+    engine: AsyncEngine
+
+    def get(self) -> DBPoolStats:
+        pool = self.engine.sync_engine.pool
+        if not isinstance(pool, TimedAsyncQueuePool):
+            raise TypeError(type(pool).__name__)
+
+        attempts = pool.checkouts + pool.timeouts
+
+        return DBPoolStats(
+            worker_pid=os.getpid(),
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,  # noqa: SLF001
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # overflow() отрицателен, пока открыты не все pool_size соединений
+            overflow=max(pool.overflow(), 0),
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_avg_ms=pool.wait_total * 1000 / attempts if attempts else 0.0,
+            wait_max_ms=pool.wait_max * 1000,
+        )
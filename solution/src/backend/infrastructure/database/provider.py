@@ -7,20 +7,32 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from backend.application.common.storage import IStorageClient
 from backend.infrastructure.config_loader import DataBaseConfig
+from backend.infrastructure.database.pool import TimedAsyncQueuePool
+from backend.infrastructure.database.replica import ReplicaRouter, TrackedSession
 
 
-async def get_async_engine(
-    db_config: DataBaseConfig,
-) -> AsyncGenerator[AsyncEngine]:
-    sqlalchemy_url = db_config.build_connection_str()
-    async_engine = create_async_engine(
-        url=sqlalchemy_url,
+def build_async_engine(url: str, db_config: DataBaseConfig) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
         echo=db_config.debug,
-        pool_pre_ping=True,
+        poolclass=TimedAsyncQueuePool,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_timeout=db_config.pool_timeout,
+        pool_recycle=db_config.pool_recycle,
+        pool_pre_ping=db_config.pool_pre_ping,
+        connect_args={"prepared_statement_cache_size": db_config.statement_cache_size},
         future=True,
     )
 
+
+async def get_async_engine(
+    db_config: DataBaseConfig,
+) -> AsyncGenerator[AsyncEngine]:
+    async_engine = build_async_engine(db_config.build_connection_str(), db_config)
+
     yield async_engine
 
     await async_engine.dispose()
@@ -29,7 +41,27 @@ async def get_async_engine(
 def get_async_sessionmaker(
     async_engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
-    return async_sessionmaker(bind=async_engine, expire_on_commit=False, class_=AsyncSession)
+    return async_sessionmaker(
+        bind=async_engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=TrackedSession,
+    )
+
+
+async def get_replica_router(
+    db_config: DataBaseConfig,
+    storage: IStorageClient,
+) -> AsyncGenerator[ReplicaRouter]:
+    router = ReplicaRouter(
+        engines=[build_async_engine(url, db_config) for url in db_config.replica_urls],
+        storage=storage,
+        window=db_config.replica_ryw_window,
+    )
+
+    yield router
+
+    await router.dispose()
 
 
 async def get_async_session(
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.application.common.uow import ReadOnlyMode
+from backend.application.exception.base import UnauthorizedError
+from backend.infrastructure.auth.idp.token_parser import AccessTokenParser
+from backend.infrastructure.database.replica import ReplicaRouter
+
+
+@dataclass(slots=True)
+class SAReadOnlyMode(ReadOnlyMode):
+    session: AsyncSession
+    engine: AsyncEngine
+    router: ReplicaRouter
+    token_parser: AccessTokenParser
+    _bind: AsyncEngine | None = field(default=None, init=False)
+
+    @property
+    def bind(self) -> AsyncEngine:
+        """Движок, выбранный enable, для дополнительных сессий того же запроса."""
+        return self._bind if self._bind is not None else self.engine
+
+    async def enable(self) -> None:
+        # Сессия берёт соединение из пула только на первом запросе, до него достаточно сменить bind
+        if self.session.in_transaction():
+            return
+
+        engine = self.engine
+        if (replica := await self._pick_replica()) is not None:
+            engine = replica
+
+        # asyncpg открывает транзакцию как BEGIN READ ONLY без лишнего запроса,
+        # при возврате соединения в пул режим сбрасывается
+        self._bind = engine.execution_options(postgresql_readonly=True)
+        self.session.sync_session.bind = self._bind.sync_engine
+
+    async def _pick_replica(self) -> AsyncEngine | None:
+        if not self.router.engines:
+            return None
+
+        try:
+            token = self.token_parser.parse_token()
+        except UnauthorizedError:
+            # Запрос без токена всё равно отклонит UserIdProvider
+            return None
+
+        # Токен только что выдан при регистрации или входе, реплика может ещё не видеть пользователя
+        if token.created_at > datetime.now(tz=UTC) - timedelta(seconds=self.router.window):
+            return None
+
+        return await self.router.pick(token.user_id)
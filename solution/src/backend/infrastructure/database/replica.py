@@ -0,0 +1,79 @@
+import logging
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.application.common.storage import IStorageClient
+
+RYW_KEY_PREFIX = "antifraud:ryw:"
+COMMITTED = "committed"
+DEFAULT_RYW_WINDOW = 5
+
+logger = logging.getLogger(__name__)
+
+
+def ryw_key(user_id: UUID) -> str:
+    return RYW_KEY_PREFIX + str(user_id)
+
+
+class TrackedSession(Session):
+    """Session, которая отмечает в info, что в ней был commit."""
+
+
+@event.listens_for(TrackedSession, "after_commit")
+def mark_committed(session: Session) -> None:
+    session.info[COMMITTED] = True
+
+
+@dataclass(slots=True)
+class ReplicaRouter:
+    """Раскладывает чтения по репликам по кругу.
+
+    После commit у пользователя открывается окно read-your-writes: пока оно не истекло, его чтения
+    идут в основную БД. Окно хранится в Redis, чтобы его видели все воркеры.
+
+    Окно открывается для автора записи, а не для владельца строк: после того как админ создал
+    транзакцию или изменил пользователя X, чтения X могут до window секунд идти на отстающую реплику.
+    """
+
+    engines: list[AsyncEngine]
+    storage: IStorageClient
+    window: int = DEFAULT_RYW_WINDOW
+    _next: int = field(default=0, init=False, repr=False)
+
+    async def pick(self, user_id: UUID) -> AsyncEngine | None:
+        if not self.engines:
+            return None
+
+        try:
+            if await self.storage.get(ryw_key(user_id)) is not None:
+                return None
+        except RedisError:
+            # Без Redis не узнать, писал ли пользователь, поэтому читаем из основной БД
+            logger.warning("Окно read-your-writes в Redis недоступно")
+            return None
+
+        engine = self.engines[self._next % len(self.engines)]
+        self._next += 1
+        return engine
+
+    async def mark_write(self, user_id: UUID) -> None:
+        if not self.engines:
+            return
+
+        try:
+            await self.storage.set(ryw_key(user_id), "1", expire=self.window)
+        except RedisError:
+            logger.warning("Окно read-your-writes в Redis недоступно")
+
+    async def mark_write_if_committed(self, session: AsyncSession, user_id: UUID) -> None:
+        if session.info.get(COMMITTED):
+            await self.mark_write(user_id)
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
@@ -22,12 +22,8 @@ fraud_rule_evaluation_result_table = sa.Table(
     "fraud_rule_evaluation_result_table",
     metadata,
     sa.Column("id", sa.UUID(as_uuid=True), primary_key=True),
-    sa.Column(
-        "transaction_id",
-        sa.UUID(as_uuid=True),
-        sa.ForeignKey("transaction_table.id"),
-        nullable=False,
-    ),
+    # Внешнего ключа на секционированную transaction_table нет, строки пишутся одним запросом с ней
+    sa.Column("transaction_id", sa.UUID(as_uuid=True), nullable=False),
     sa.Column(
         "rule_id",
         sa.UUID(as_uuid=True),
@@ -38,7 +34,15 @@ fraud_rule_evaluation_result_table = sa.Table(
     sa.Column("priority", sa.Integer, nullable=False),
     sa.Column("matched", sa.Boolean, nullable=False),
     sa.Column("description", sa.Text, nullable=False),
+    # created_at транзакции, секционируется по тем же месяцам
+    sa.Column("created_at", sa.DateTime(timezone=True), primary_key=True),
+    sa.Index("ix_fraud_rule_evaluation_result_table_transaction_id_priority", "transaction_id", "priority"),
+    postgresql_partition_by="RANGE (created_at)",
 )
 
 mapper_registry.map_imperatively(FraudRule, fraud_rule_table)
-mapper_registry.map_imperatively(FraudRuleEvaluationResult, fraud_rule_evaluation_result_table)
+mapper_registry.map_imperatively(
+    FraudRuleEvaluationResult,
+    fraud_rule_evaluation_result_table,
+    primary_key=[fraud_rule_evaluation_result_table.c.id],
+)
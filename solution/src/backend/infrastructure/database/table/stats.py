@@ -0,0 +1,34 @@
+import sqlalchemy as sa
+
+from backend.infrastructure.database.registry import mapper_registry
+
+metadata = mapper_registry.metadata
+
+# Почасовые агрегаты транзакций, обновляются в той же транзакции БД, что и запись транзакции.
+# Отсутствующие channel/merchant_id/merchant_category_code хранятся пустой строкой,
+# потому что столбцы входят в первичный ключ и ON CONFLICT
+transaction_hourly_rollup_table = sa.Table(
+    "transaction_hourly_rollup_table",
+    metadata,
+    sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+    sa.Column("channel", sa.String(16), primary_key=True),
+    sa.Column("merchant_id", sa.String(64), primary_key=True),
+    sa.Column("merchant_category_code", sa.String(4), primary_key=True),
+    sa.Column("tx_count", sa.BigInteger, nullable=False),
+    sa.Column("gmv", sa.Numeric(scale=2), nullable=False),
+    sa.Column("approved_count", sa.BigInteger, nullable=False),
+    sa.Column("declined_count", sa.BigInteger, nullable=False),
+)
+
+# Суточные агрегаты по мерчантам для топа рискованных мерчантов, транзакции без merchant_id не попадают
+merchant_daily_stats_table = sa.Table(
+    "merchant_daily_stats_table",
+    metadata,
+    sa.Column("day", sa.DateTime(timezone=True), primary_key=True),
+    sa.Column("merchant_id", sa.String(64), primary_key=True),
+    sa.Column("merchant_category_code", sa.String(4), primary_key=True),
+    sa.Column("tx_count", sa.BigInteger, nullable=False),
+    sa.Column("gmv", sa.Numeric(scale=2), nullable=False),
+    sa.Column("approved_count", sa.BigInteger, nullable=False),
+    sa.Column("declined_count", sa.BigInteger, nullable=False),
+)
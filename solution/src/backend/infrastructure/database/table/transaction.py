@@ -1,5 +1,5 @@
 import sqlalchemy as sa
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import foreign, relationship
 
 from backend.domain.entity.transaction import Transaction, TransactionLocation
 from backend.domain.misc_types import TransactionChannel, TransactionStatus
@@ -10,7 +10,8 @@ metadata = mapper_registry.metadata
 transaction_location_table = sa.Table(
     "transaction_location_table",
     metadata,
-    sa.Column("id", sa.UUID(as_uuid=True), sa.ForeignKey("transaction_table.id"), primary_key=True),
+    # Внешнего ключа нет: transaction_table секционирована, и её первичный ключ - (id, created_at)
+    sa.Column("id", sa.UUID(as_uuid=True), primary_key=True),
     sa.Column("country", sa.String(2), nullable=True),
     sa.Column("city", sa.String(128), nullable=True),
     sa.Column("latitude", sa.Numeric(), nullable=True),
@@ -33,16 +34,34 @@ transaction_table = sa.Table(
     sa.Column("channel", sa.Enum(TransactionChannel), nullable=True),
     sa.Column("is_fraud", sa.Boolean, nullable=False, default=False),
     sa.Column("metadata", sa.JSON, nullable=True),
-    sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    # Ключ секционирования обязан входить в первичный ключ
+    sa.Column("created_at", sa.DateTime(timezone=True), primary_key=True),
+    sa.Index("ix_transaction_table_timestamp_id", "timestamp", "id"),
+    sa.Index("ix_transaction_table_user_id_timestamp_id", "user_id", "timestamp", "id"),
+    sa.Index(
+        "ix_transaction_table_created_at",
+        "created_at",
+        postgresql_include=["user_id", "status", "is_fraud"],
+    ),
+    sa.Index(
+        "ix_transaction_table_user_id_created_at",
+        "user_id",
+        "created_at",
+        postgresql_include=["status", "is_fraud"],
+    ),
+    postgresql_partition_by="RANGE (created_at)",
 )
 
 mapper_registry.map_imperatively(TransactionLocation, transaction_location_table)
 mapper_registry.map_imperatively(
     Transaction,
     transaction_table,
+    # Для ORM транзакция по-прежнему идентифицируется одним id
+    primary_key=[transaction_table.c.id],
     properties={
         "location": relationship(
             TransactionLocation,
+            primaryjoin=transaction_table.c.id == foreign(transaction_location_table.c.id),
             uselist=False,
             cascade="all, delete-orphan",
             lazy="selectin",
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from types import TracebackType
 from typing import Any, Self
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 from redis.asyncio.connection import ConnectionPool
 
 from backend.application.common.storage import IStorageClient
@@ -45,6 +47,23 @@ class RedisClient(IStorageClient):
         redis = await self._ensure_connected()
         return int(await redis.delete(key)) > 0
 
+    async def pipeline(self) -> Pipeline:
+        redis = await self._ensure_connected()
+        return redis.pipeline(transaction=False)
+
+    async def publish(self, channel: str, message: str) -> int:
+        redis = await self._ensure_connected()
+        return int(await redis.publish(channel, message))
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        redis = await self._ensure_connected()
+
+        async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(channel)
+
+            async for message in pubsub.listen():
+                yield str(message["data"].decode("utf-8"))
+
     async def close(self) -> None:
         if self._redis is not None:
             await self._redis.close()
@@ -0,0 +1,130 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from backend.application.common.risk_profile import RiskProfileCounters
+from backend.application.stats.dto import UserRiskCounters
+from backend.domain.entity.transaction import Transaction
+from backend.domain.misc_types import TransactionStatus
+from backend.infrastructure.redis import RedisClient
+
+RISK_KEY_PREFIX = "antifraud:risk:"
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+# Окно "24h" - текущий час и 23 предыдущих, окно "30d" - текущий день и 29 предыдущих
+HOURLY_BUCKETS = 24
+DAILY_BUCKETS = 30
+LAST_SEEN_MEMBER = "last_seen"
+HOURLY_FIELDS = ["tx_count", "gmv_cents"]
+DAILY_FIELDS = ["tx_count", "declined_count"]
+
+logger = logging.getLogger(__name__)
+
+
+def hour_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def day_start(value: datetime) -> datetime:
+    return hour_start(value).replace(hour=0)
+
+
+def risk_key(user_id: UUID, kind: str, bucket: datetime | None = None) -> str:
+    key = f"{RISK_KEY_PREFIX}{user_id}:{kind}"
+    if bucket is not None:
+        key += bucket.strftime(":%Y%m%d%H")
+    return key
+
+
+@dataclass(slots=True, frozen=True)
+class RedisRiskProfileCounters(RiskProfileCounters):
+    """Почасовые и посуточные счётчики в Redis, уникальные устройства, IP и города - HyperLogLog.
+
+    Ключ бакета живёт, пока бакет входит в окно, поэтому память на пользователя ограничена.
+    """
+
+    redis: RedisClient
+
+    async def record(self, transactions: Sequence[Transaction]) -> None:
+        # Транзакции уже закоммичены, недоступный Redis не должен ронять запрос
+        try:
+            pipe = await self.redis.pipeline()
+
+            for transaction in transactions:
+                user_id = transaction.user_id
+                hour = hour_start(transaction.created_at)
+                day = day_start(transaction.created_at)
+                hour_expire_at = hour + HOURLY_BUCKETS * HOUR
+                day_expire_at = day + DAILY_BUCKETS * DAY
+
+                hour_key = risk_key(user_id, "h", hour)
+                pipe.hincrby(hour_key, "tx_count", 1)
+                # Сумма хранится в копейках, чтобы не накапливать ошибку HINCRBYFLOAT
+                pipe.hincrby(hour_key, "gmv_cents", int(transaction.amount * 100))
+                pipe.expireat(hour_key, hour_expire_at)
+
+                location = transaction.location
+                for kind, value in (
+                    ("devices", transaction.device_id),
+                    ("ips", transaction.ip_address),
+                    ("cities", location.city if location is not None else None),
+                ):
+                    if value is None:
+                        continue
+                    pipe.pfadd(risk_key(user_id, kind, hour), value)
+                    pipe.expireat(risk_key(user_id, kind, hour), hour_expire_at)
+
+                day_key = risk_key(user_id, "d", day)
+                pipe.hincrby(day_key, "tx_count", 1)
+                if transaction.status == TransactionStatus.DECLINED:
+                    pipe.hincrby(day_key, "declined_count", 1)
+                pipe.expireat(day_key, day_expire_at)
+
+                # GT оставляет большее значение, поэтому конкурентные записи не откатывают lastSeenAt назад
+                last_seen = {LAST_SEEN_MEMBER: transaction.created_at.timestamp()}
+                pipe.zadd(risk_key(user_id, "seen"), last_seen, gt=True)
+
+            await pipe.execute()
+        except RedisError:
+            logger.warning("Не удалось обновить счётчики профиля риска в Redis")
+
+    async def get(self, user_id: UUID, now: datetime) -> UserRiskCounters | None:
+        hours = [hour_start(now) - offset * HOUR for offset in range(HOURLY_BUCKETS)]
+        days = [day_start(now) - offset * DAY for offset in range(DAILY_BUCKETS)]
+
+        try:
+            pipe = await self.redis.pipeline()
+            for hour in hours:
+                pipe.hmget(risk_key(user_id, "h", hour), HOURLY_FIELDS)
+            # PFCOUNT по нескольким ключам объединяет HyperLogLog на лету, не изменяя их
+            for kind in ("devices", "ips", "cities"):
+                pipe.pfcount(*(risk_key(user_id, kind, hour) for hour in hours))
+            for day in days:
+                pipe.hmget(risk_key(user_id, "d", day), DAILY_FIELDS)
+            pipe.zscore(risk_key(user_id, "seen"), LAST_SEEN_MEMBER)
+
+            res = await pipe.execute()
+        except RedisError:
+            logger.warning("Не удалось прочитать счётчики профиля риска из Redis")
+            return None
+
+        hourly = res[:HOURLY_BUCKETS]
+        devices, ips, cities = res[HOURLY_BUCKETS : HOURLY_BUCKETS + 3]
+        daily = res[HOURLY_BUCKETS + 3 : -1]
+        last_seen = res[-1]
+
+        return UserRiskCounters(
+            tx_count_24h=sum(int(tx_count or 0) for tx_count, _ in hourly),
+            gmv_24h=Decimal(sum(int(gmv_cents or 0) for _, gmv_cents in hourly)) / 100,
+            distinct_devices_24h=devices,
+            distinct_ips_24h=ips,
+            distinct_cities_24h=cities,
+            tx_count_30d=sum(int(tx_count or 0) for tx_count, _ in daily),
+            declined_count_30d=sum(int(declined_count or 0) for _, declined_count in daily),
+            last_seen_at=datetime.fromtimestamp(last_seen, tz=UTC) if last_seen is not None else None,
+        )
@@ -0,0 +1,148 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from backend.application.common.rule_stats import RuleMatchCounters
+from backend.application.stats.dto import RuleMatchStats
+from backend.domain.entity.fraud_rule import FraudRule, FraudRuleEvaluationResult
+from backend.domain.entity.transaction import Transaction
+from backend.domain.misc_types import TransactionStatus
+from backend.infrastructure.redis import RedisClient
+from backend.infrastructure.risk_profile import DAY, HOUR, day_start, hour_start
+
+RULE_STATS_KEY_PREFIX = "antifraud:rule_stats:"
+# Самое длинное окно /stats/rules/matches - 90 дней, плюс день на границы окна
+RETENTION = timedelta(days=91)
+COUNTER_FIELDS = ["matches", "declined_matches"]
+
+logger = logging.getLogger(__name__)
+
+
+def rule_stats_key(rule_id: UUID, kind: str, bucket: datetime, daily: bool) -> str:
+    return f"{RULE_STATS_KEY_PREFIX}{rule_id}:{kind}:{'d' if daily else 'h'}:{bucket:%Y%m%d%H}"
+
+
+def window_buckets(from_: datetime, to: datetime) -> list[tuple[datetime, bool]]:
+    """Бакеты окна с точностью до часа: целые дни посуточно, неполные крайние дни по часам."""
+    start = hour_start(from_)
+    end = hour_start(to) if hour_start(to) == to else hour_start(to) + HOUR
+    first_day = start if start == day_start(start) else day_start(start) + DAY
+    last_day = day_start(end)
+
+    if first_day >= last_day:
+        first_day = last_day = end
+
+    buckets: list[tuple[datetime, bool]] = []
+    for bound_from, bound_to, step, daily in (
+        (start, first_day, HOUR, False),
+        (first_day, last_day, DAY, True),
+        (last_day, end, HOUR, False),
+    ):
+        bucket = bound_from
+        while bucket < bound_to:
+            buckets.append((bucket, daily))
+            bucket += step
+
+    return buckets
+
+
+@dataclass(slots=True, frozen=True)
+class RedisRuleMatchCounters(RuleMatchCounters):
+    """Почасовые и посуточные счётчики срабатываний, уникальные пользователи и мерчанты - HyperLogLog.
+
+    Посуточные бакеты дублируют почасовые, чтобы окно в 90 дней читалось по ~90 ключам, а не по 2160.
+    """
+
+    redis: RedisClient
+
+    async def record(
+        self,
+        transactions: Sequence[Transaction],
+        rule_results: Sequence[FraudRuleEvaluationResult],
+    ) -> None:
+        by_id = {transaction.id: transaction for transaction in transactions}
+
+        # Транзакции уже закоммичены, недоступный Redis не должен ронять запрос
+        try:
+            pipe = await self.redis.pipeline()
+
+            for rule_result in rule_results:
+                transaction = by_id.get(rule_result.transaction_id)
+                if not rule_result.matched or transaction is None:
+                    continue
+
+                for bucket, daily in (
+                    (hour_start(transaction.created_at), False),
+                    (day_start(transaction.created_at), True),
+                ):
+                    expire_at = bucket + RETENTION
+
+                    counters_key = rule_stats_key(rule_result.rule_id, "counters", bucket, daily)
+                    pipe.hincrby(counters_key, "matches", 1)
+                    if transaction.status == TransactionStatus.DECLINED:
+                        pipe.hincrby(counters_key, "declined_matches", 1)
+                    pipe.expireat(counters_key, expire_at)
+
+                    users_key = rule_stats_key(rule_result.rule_id, "users", bucket, daily)
+                    pipe.pfadd(users_key, str(transaction.user_id))
+                    pipe.expireat(users_key, expire_at)
+
+                    if transaction.merchant_id is not None:
+                        merchants_key = rule_stats_key(rule_result.rule_id, "merchants", bucket, daily)
+                        pipe.pfadd(merchants_key, transaction.merchant_id)
+                        pipe.expireat(merchants_key, expire_at)
+
+            await pipe.execute()
+        except RedisError:
+            logger.warning("Не удалось обновить счётчики срабатываний правил в Redis")
+
+    async def get(
+        self,
+        rules: Sequence[FraudRule],
+        from_: datetime,
+        to: datetime,
+    ) -> list[RuleMatchStats] | None:
+        buckets = window_buckets(from_, to)
+
+        try:
+            res = await self._read(rules, buckets)
+        except RedisError:
+            logger.warning("Счётчики срабатываний правил в Redis недоступны")
+            return None
+
+        stats: list[RuleMatchStats] = []
+        per_rule = len(buckets) + 2
+        for index, rule in enumerate(rules):
+            *counters, unique_users, unique_merchants = res[index * per_rule : (index + 1) * per_rule]
+            matches = sum(int(matched or 0) for matched, _ in counters)
+            if matches == 0:
+                continue
+
+            stats.append(
+                RuleMatchStats(
+                    rule_id=rule.id,
+                    rule_name=rule.name,
+                    matches=matches,
+                    unique_users=unique_users,
+                    unique_merchants=unique_merchants,
+                    declined_matches=sum(int(declined or 0) for _, declined in counters),
+                ),
+            )
+
+        return stats
+
+    async def _read(self, rules: Sequence[FraudRule], buckets: list[tuple[datetime, bool]]) -> list[Any]:
+        pipe = await self.redis.pipeline()
+        for rule in rules:
+            for bucket, daily in buckets:
+                pipe.hmget(rule_stats_key(rule.id, "counters", bucket, daily), COUNTER_FIELDS)
+            # PFCOUNT по нескольким ключам объединяет HyperLogLog на лету, не изменяя их
+            pipe.pfcount(*(rule_stats_key(rule.id, "users", bucket, daily) for bucket, daily in buckets))
+            pipe.pfcount(*(rule_stats_key(rule.id, "merchants", bucket, daily) for bucket, daily in buckets))
+
+        return await pipe.execute()
@@ -4,6 +4,7 @@ from adaptix import NameStyle, Retort, as_sentinel, dumper, loader, name_mapping
 from pydantic import EmailStr
 
 from backend.infrastructure.serialization.base import FieldSkip
+from backend.infrastructure.serialization.stats import risk_profile_names
 
 api_dump_serializer = Retort(
     recipe=[
@@ -18,6 +19,7 @@ api_dump_serializer = Retort(
 api_load_serializer = Retort(
     recipe=[
         loader(datetime, lambda x: datetime.strptime(x, "%Y-%m-%dT%H:%M:%SZ").astimezone(tz=UTC)),
+        risk_profile_names,
         name_mapping(name_style=NameStyle.CAMEL),
     ],
 )
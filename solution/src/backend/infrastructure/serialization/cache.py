@@ -0,0 +1,4 @@
+from adaptix import Retort
+
+# Формат значений в Redis: стандартные правила adaptix (datetime и UUID - строки, Enum - значения)
+cache_serializer = Retort()
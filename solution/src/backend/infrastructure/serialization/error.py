@@ -1,12 +1,21 @@
 from datetime import datetime
+from typing import Any
 
-from adaptix import NameStyle, Retort, as_sentinel, dumper, name_mapping
+from adaptix import NameStyle, P, Retort, as_sentinel, dumper, name_mapping
 
+from backend.infrastructure.parser.pydantic_error import FieldErrorInfo
 from backend.infrastructure.serialization.base import FieldSkip
 
+
+def dump_rejected_value(value: Any) -> Any:
+    # Поле объявлено как Any и иначе уходит в JSONResponse как есть, datetime и UUID там не сериализуются
+    return error_serializer.dump(value, type(value))
+
+
 error_serializer = Retort(
     recipe=[
         dumper(datetime, lambda x: f"{x.strftime('%Y-%m-%d')}T{x.strftime('%H:%M:%S')}Z"),
+        dumper(P[FieldErrorInfo].rejected_value, dump_rejected_value),
         name_mapping(name_style=NameStyle.CAMEL),
         name_mapping(omit_default=True),
         as_sentinel(FieldSkip),
@@ -0,0 +1,16 @@
+from adaptix import name_mapping
+
+from backend.application.stats.dto import UserRiskProfile
+
+# Имена полей из спецификации: NameStyle.CAMEL превратил бы tx_count_24h в txCount24H
+risk_profile_names = name_mapping(
+    UserRiskProfile,
+    map={
+        "tx_count_24h": "txCount_24h",
+        "gmv_24h": "gmv_24h",
+        "distinct_devices_24h": "distinctDevices_24h",
+        "distinct_ips_24h": "distinctIps_24h",
+        "distinct_cities_24h": "distinctCities_24h",
+        "decline_rate_30d": "declineRate_30d",
+    },
+)
@@ -25,7 +25,7 @@ class WebLogin:
     async def execute(self, form: WebLoginForm) -> LoginResponse:
         user = await self.gateway.get_by_email(form.email)
 
-        if (user is None) or (self.hasher.verify(form.password, user.password) is False):
+        if (user is None) or (await self.hasher.verify(form.password, user.password) is False):
             raise UnauthorizedError
 
         if user.is_active is False:
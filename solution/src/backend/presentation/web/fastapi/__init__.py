@@ -21,6 +21,7 @@ from backend.presentation.web.fastapi.exc_handler import (
 )
 from backend.presentation.web.fastapi.fraud_rules import fraud_rules_router
 from backend.presentation.web.fastapi.main import main_router
+from backend.presentation.web.fastapi.stats import stats_router
 from backend.presentation.web.fastapi.transactions import transactions_router
 from backend.presentation.web.fastapi.users import users_router
 
@@ -31,6 +32,7 @@ def include_routers(app: FastAPI) -> None:
     app.include_router(users_router, prefix="/api/v1/users", tags=["users"])
     app.include_router(fraud_rules_router, prefix="/api/v1/fraud-rules", tags=["fraud-rules"])
     app.include_router(transactions_router, prefix="/api/v1/transactions", tags=["transactions"])
+    app.include_router(stats_router, prefix="/api/v1/stats", tags=["stats"])
 
 
 def include_exception_handlers(app: FastAPI) -> None:
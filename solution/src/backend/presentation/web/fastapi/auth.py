@@ -1,13 +1,13 @@
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
 
 from backend.application.forms.user import UserForm
 from backend.bootstrap.di.providers.parsed_data import RequestBody
 from backend.infrastructure.auth.login import WebLoginForm
 from backend.presentation.web.controller.login import WebLogin
 from backend.presentation.web.controller.registration import WebRegistration
+from backend.presentation.web.response import SerializedJSONResponse
 from backend.presentation.web.serializer import serializer
 
 auth_router = APIRouter(route_class=DishkaRoute)
@@ -18,7 +18,7 @@ async def register(
     web_register: FromDishka[WebRegistration],
     web_login: FromDishka[WebLogin],
     form: RequestBody[UserForm],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     await web_register.execute(form.data)
 
     result = await web_login.execute(
@@ -28,7 +28,7 @@ async def register(
         ),
     )
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=201,
     )
@@ -38,7 +38,7 @@ async def register(
 async def login(
     web_login: FromDishka[WebLogin],
     form: RequestBody[WebLoginForm],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await web_login.execute(
         WebLoginForm(
             email=form.data.email,
@@ -46,7 +46,7 @@ async def login(
         ),
     )
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -9,7 +9,7 @@ from backend.application.exception.fraud_rule import FraudRuleNameAlreadyExistsE
 from backend.application.exception.transaction import MissingLonOrLatError
 from backend.application.exception.user import EmailAlreadyExistsError
 from backend.infrastructure.api.exception import InternalServerError
-from backend.infrastructure.api.models import ERROR_HTTP_CODE, ApiErrorResponse
+from backend.infrastructure.api.models import ERROR_CODE, ERROR_HTTP_CODE, ApiErrorResponse
 from backend.infrastructure.parser.pydantic_error import FieldErrorInfo, PydanticErrorInfoParser
 from backend.infrastructure.serialization.error import error_serializer
 
@@ -112,3 +112,28 @@ async def internal_server_error_handler(request: Request, exc: Exception) -> JSO
         content=error_serializer.dump(response),
         status_code=ERROR_HTTP_CODE[InternalServerError],
     )
+
+
+def build_api_error(exc: Exception, path: str) -> ApiErrorResponse:
+    # Тело ошибки в том же виде, что и у обработчиков выше, для ответов с несколькими результатами
+    if isinstance(exc, ValidationError):
+        response = ApiErrorResponse.generate_default(ValidationError, path)
+        response.field_errors = PydanticErrorInfoParser().get_validation_error_info(exc)
+        return response
+
+    if isinstance(exc, (CustomValidationError, MissingLonOrLatError)):
+        response = ApiErrorResponse.generate_default(ValidationError, path)
+        response.field_errors = [
+            FieldErrorInfo(
+                field=exc.field,
+                issue=exc.issue,
+                rejected_value=exc.rejected_value,
+            ),
+        ]
+        return response
+
+    if type(exc) in ERROR_CODE:
+        return ApiErrorResponse.generate_default(type(exc), path)
+
+    logging.error(exc)
+    return ApiErrorResponse.generate_default(InternalServerError, path)
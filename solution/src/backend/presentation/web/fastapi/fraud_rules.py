@@ -3,7 +3,6 @@ from uuid import UUID
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
 
 from backend.application.forms.fraud_rule import (
     DSLValidationForm,
@@ -17,6 +16,7 @@ from backend.application.fraud_rule.update import UpdateFraudRule
 from backend.application.fraud_rule.validate_dsl import ValidateDSL
 from backend.bootstrap.di.providers.parsed_data import RequestBody
 from backend.domain.entity.fraud_rule import FraudRule
+from backend.presentation.web.response import SerializedJSONResponse
 from backend.presentation.web.serializer import serializer
 
 fraud_rules_router = APIRouter(route_class=DishkaRoute)
@@ -26,10 +26,10 @@ fraud_rules_router = APIRouter(route_class=DishkaRoute)
 async def create_fraud_rule(
     interactor: FromDishka[CreateFraudRule],
     form: RequestBody[FraudRuleForm],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(form.data)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=201,
     )
@@ -39,20 +39,20 @@ async def create_fraud_rule(
 async def validate_dsl(
     interactor: FromDishka[ValidateDSL],
     form: RequestBody[DSLValidationForm],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     """DSL пока поддерживается на уровне 0."""
     result = await interactor.execute(form.data.dsl_expression)
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
 
 
 @fraud_rules_router.get("/")
-async def read_fraud_rules(interactor: FromDishka[ReadFraudRules]) -> JSONResponse:
+async def read_fraud_rules(interactor: FromDishka[ReadFraudRules]) -> SerializedJSONResponse:
     result = await interactor.execute()
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result, list[FraudRule]),
         status_code=200,
     )
@@ -62,10 +62,10 @@ async def read_fraud_rules(interactor: FromDishka[ReadFraudRules]) -> JSONRespon
 async def read_fraud_rule(
     id: UUID,
     interactor: FromDishka[ReadFraudRule],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(id)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -76,10 +76,10 @@ async def update_fraud_rule(
     id: UUID,
     form: RequestBody[UpdateFraudRuleForm],
     interactor: FromDishka[UpdateFraudRule],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(form=form.data, id=id)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
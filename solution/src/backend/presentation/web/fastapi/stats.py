@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Query
+
+from backend.application.forms.stats import (
+    MerchantRiskForm,
+    RuleMatchesForm,
+    StatsOverviewForm,
+    TransactionsTimeSeriesForm,
+)
+from backend.application.stats.read import (
+    ReadDBPoolStats,
+    ReadMerchantRisk,
+    ReadRuleMatches,
+    ReadStatsOverview,
+    ReadTransactionsTimeSeries,
+    ReadUserRiskProfile,
+)
+from backend.domain.misc_types import StatsGroupBy, TransactionChannel
+from backend.presentation.web.response import SerializedJSONResponse
+from backend.presentation.web.serializer import serializer
+
+stats_router = APIRouter(route_class=DishkaRoute)
+
+
+@stats_router.get("/overview")
+async def read_stats_overview(
+    interactor: FromDishka[ReadStatsOverview],
+    from_: Annotated[datetime | None, Query(alias="from")] = None,
+    to: Annotated[datetime | None, Query()] = None,
+) -> SerializedJSONResponse:
+    form = StatsOverviewForm()
+    if from_ is not None:
+        form.from_ = from_
+    if to is not None:
+        form.to = to
+
+    result = await interactor.execute(form=form)
+
+    return SerializedJSONResponse(
+        content=serializer.dump(result),
+        status_code=200,
+    )
+
+
+@stats_router.get("/transactions/timeseries")
+async def read_transactions_timeseries(
+    interactor: FromDishka[ReadTransactionsTimeSeries],
+    from_: Annotated[datetime | None, Query(alias="from")] = None,
+    to: Annotated[datetime | None, Query()] = None,
+    group_by: Annotated[StatsGroupBy, Query(alias="groupBy")] = StatsGroupBy.DAY,
+    timezone: Annotated[str, Query()] = "UTC",
+    channel: Annotated[TransactionChannel | None, Query()] = None,
+) -> SerializedJSONResponse:
+    form = TransactionsTimeSeriesForm(groupBy=group_by, timezone=timezone, channel=channel)
+    if from_ is not None:
+        form.from_ = from_
+    if to is not None:
+        form.to = to
+
+    result = await interactor.execute(form=form)
+
+    return SerializedJSONResponse(
+        content=serializer.dump(result),
+        status_code=200,
+    )
+
+
+@stats_router.get("/users/{id}/risk-profile")
+async def read_user_risk_profile(
+    id: UUID,
+    interactor: FromDishka[ReadUserRiskProfile],
+) -> SerializedJSONResponse:
+    result = await interactor.execute(id=id)
+
+    return SerializedJSONResponse(
+        content=serializer.dump(result),
+        status_code=200,
+    )
+
+
+@stats_router.get("/rules/matches")
+async def read_rule_matches(
+    interactor: FromDishka[ReadRuleMatches],
+    from_: Annotated[datetime | None, Query(alias="from")] = None,
+    to: Annotated[datetime | None, Query()] = None,
+    top: Annotated[int, Query(ge=1, le=100)] = 20,
+    exact: Annotated[bool, Query()] = False,
+) -> SerializedJSONResponse:
+    form = RuleMatchesForm(top=top, exact=exact)
+    if from_ is not None:
+        form.from_ = from_
+    if to is not None:
+        form.to = to
+
+    result = await interactor.execute(form=form)
+
+    return SerializedJSONResponse(
+        content=serializer.dump(result),
+        status_code=200,
+    )
+
+
+@stats_router.get("/merchants/risk")
+async def read_merchant_risk(
+    interactor: FromDishka[ReadMerchantRisk],
+    from_: Annotated[datetime | None, Query(alias="from")] = None,
+    to: Annotated[datetime | None, Query()] = None,
+    merchant_category_code: Annotated[str | None, Query(alias="merchantCategoryCode")] = None,
+    top: Annotated[int, Query(ge=1, le=200)] = 50,
+) -> SerializedJSONResponse:
+    form = MerchantRiskForm(merchantCategoryCode=merchant_category_code, top=top)
+    if from_ is not None:
+        form.from_ = from_
+    if to is not None:
+        form.to = to
+
+    result = await interactor.execute(form=form)
+
+    return SerializedJSONResponse(
+        content=serializer.dump(result),
+        status_code=200,
+    )
+
+
+@stats_router.get("/db-pool")
+async def read_db_pool_stats(
+    interactor: FromDishka[ReadDBPoolStats],
+) -> SerializedJSONResponse:
+    result = await interactor.execute()
+
+    return SerializedJSONResponse(
+        content=serializer.dump(result),
+        status_code=200,
+    )
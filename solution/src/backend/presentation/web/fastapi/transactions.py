@@ -4,15 +4,22 @@ from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Query, Request
 
 from backend.application.exception.base import CustomValidationError
-from backend.application.forms.transaction import ManyTransactionReadForm, TransactionForm
-from backend.application.transaction.create import CreateTransaction
+from backend.application.forms.transaction import (
+    ManyTransactionReadForm,
+    TransactionBatchForm,
+    TransactionForm,
+)
+from backend.application.transaction.create import CreateTransaction, CreateTransactionsBatch
 from backend.application.transaction.read import ReadTransaction, ReadTransactions
 from backend.bootstrap.di.providers.parsed_data import RequestBody
 from backend.domain.misc_types import TransactionStatus
+from backend.infrastructure.api.models import ApiErrorResponse
+from backend.infrastructure.serialization.error import error_serializer
+from backend.presentation.web.fastapi.exc_handler import build_api_error
+from backend.presentation.web.response import SerializedJSONResponse
 from backend.presentation.web.serializer import serializer
 
 transactions_router = APIRouter(route_class=DishkaRoute)
@@ -22,15 +29,40 @@ transactions_router = APIRouter(route_class=DishkaRoute)
 async def create_transaction(
     interactor: FromDishka[CreateTransaction],
     form: RequestBody[TransactionForm],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(form=form.data)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=201,
     )
 
 
+@transactions_router.post("/batch")
+async def create_transactions_batch(
+    request: Request,
+    interactor: FromDishka[CreateTransactionsBatch],
+    form: RequestBody[TransactionBatchForm],
+) -> SerializedJSONResponse:
+    result = await interactor.execute(form=form.data)
+
+    items = [
+        {"index": item.index, "decision": serializer.dump(item.decision)}
+        if item.error is None
+        else {
+            "index": item.index,
+            "error": error_serializer.dump(build_api_error(item.error, request.url.path), ApiErrorResponse),
+        }
+        for item in result.items
+    ]
+
+    # 207 - часть элементов пачки не создана, подробности в items[].error
+    return SerializedJSONResponse(
+        content={"items": items},
+        status_code=207 if result.has_errors else 201,
+    )
+
+
 @transactions_router.get("/")
 async def read_transactions(
     interactor: FromDishka[ReadTransactions],
@@ -41,7 +73,8 @@ async def read_transactions(
     is_fraud: Annotated[bool | None, Query(alias="isFraud")] = None,
     from_: Annotated[datetime | None, Query(alias="from")] = None,
     to: Annotated[datetime | None, Query()] = None,
-) -> JSONResponse:
+    cursor: Annotated[str | None, Query()] = None,
+) -> SerializedJSONResponse:
     if user_id is None:
         u_id = user_id
     try:
@@ -59,6 +92,7 @@ async def read_transactions(
         userId=u_id,
         status=status,
         isFraud=is_fraud,
+        cursor=cursor,
     )
     if from_ is not None:
         form.from_ = from_
@@ -67,7 +101,7 @@ async def read_transactions(
 
     result = await interactor.execute(form=form)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -77,10 +111,10 @@ async def read_transactions(
 async def read_transaction(
     id: UUID,
     interactor: FromDishka[ReadTransaction],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(id=id)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -3,7 +3,6 @@ from uuid import UUID
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
 
 from backend.application.forms.user import AdminUserForm, UpdateUserForm
 from backend.application.user.create import CreateAdminUser
@@ -11,6 +10,7 @@ from backend.application.user.delete import DeleteUser
 from backend.application.user.read import ReadUser, ReadUsers
 from backend.application.user.update import UpdateUser
 from backend.bootstrap.di.providers.parsed_data import RequestBody
+from backend.presentation.web.response import SerializedJSONResponse
 from backend.presentation.web.serializer import serializer
 
 users_router = APIRouter(route_class=DishkaRoute)
@@ -20,20 +20,20 @@ users_router = APIRouter(route_class=DishkaRoute)
 async def create_user(
     interactor: FromDishka[CreateAdminUser],
     form: RequestBody[AdminUserForm],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(form.data)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=201,
     )
 
 
 @users_router.get("/me")
-async def read_user(interactor: FromDishka[ReadUser]) -> JSONResponse:
+async def read_user(interactor: FromDishka[ReadUser]) -> SerializedJSONResponse:
     result = await interactor.execute()
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -44,10 +44,11 @@ async def read_many(
     interactor: FromDishka[ReadUsers],
     page: int = 0,
     size: int = 20,
-) -> JSONResponse:
-    result = await interactor.execute(page=page, size=size)
+    cursor: str | None = None,
+) -> SerializedJSONResponse:
+    result = await interactor.execute(page=page, size=size, cursor=cursor)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -57,10 +58,10 @@ async def read_many(
 async def read_user_by_id(
     id: UUID,
     interactor: FromDishka[ReadUser],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(id)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -70,10 +71,10 @@ async def read_user_by_id(
 async def update_user(
     form: RequestBody[UpdateUserForm],
     interactor: FromDishka[UpdateUser],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(form=form.data)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
@@ -84,10 +85,10 @@ async def update_user_by_id(
     id: UUID,
     form: RequestBody[UpdateUserForm],
     interactor: FromDishka[UpdateUser],
-) -> JSONResponse:
+) -> SerializedJSONResponse:
     result = await interactor.execute(form=form.data, id=id)
 
-    return JSONResponse(
+    return SerializedJSONResponse(
         content=serializer.dump(result),
         status_code=200,
     )
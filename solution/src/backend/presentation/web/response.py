@@ -0,0 +1,39 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def dump_default(value: Any) -> str:
+    # dict и list orjson пишет сам, сюда попадают datetime и Decimal, которые serializer не трогает.
+    # UUID orjson тоже пишет сам, но он нужен запасному пути через json
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+
+    raise TypeError(type(value).__name__)
+
+
+class SerializedJSONResponse(JSONResponse):
+    """Рендерит результат serializer.dump одним проходом orjson."""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, default=dump_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            # orjson не пишет целые вне int64, а они могут прийти в metadata транзакции
+            return json.dumps(
+                content,
+                default=dump_default,
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            ).encode("utf-8")
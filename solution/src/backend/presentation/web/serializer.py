@@ -1,10 +1,19 @@
 from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
 
-from adaptix import NameStyle, Retort, dumper, name_mapping
+from adaptix import NameStyle, Retort, as_is_dumper, name_mapping
 
+from backend.infrastructure.serialization.stats import risk_profile_names
+
+# datetime, Decimal и UUID остаются как есть и пишутся SerializedJSONResponse без промежуточных строк,
+# поэтому результат dump отдаётся только через SerializedJSONResponse
 serializer = Retort(
     recipe=[
-        dumper(datetime, lambda x: f"{x.strftime('%Y-%m-%d')}T{x.strftime('%H:%M:%S')}Z"),
+        as_is_dumper(datetime),
+        as_is_dumper(Decimal),
+        as_is_dumper(UUID),
+        risk_profile_names,
         name_mapping(name_style=NameStyle.CAMEL),
     ],
 )
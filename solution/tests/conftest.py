@@ -7,9 +7,11 @@ import aiohttp
 import pytest
 from aiohttp import ClientSession
 from dishka import AsyncContainer
+from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.application.common.cache import CacheInvalidator
 from backend.application.forms.fraud_rule import (
     DSLValidationForm,
     FraudRuleForm,
@@ -25,6 +27,7 @@ from backend.infrastructure.auth.hasher import Hasher
 from backend.infrastructure.auth.idp.token_processor import AccessTokenProcessor
 from backend.infrastructure.auth.login import WebLoginForm
 from backend.infrastructure.config_loader import Config
+from backend.infrastructure.redis import RedisClient
 from tests.utils.misc_types import AuthorizedUser
 
 
@@ -47,8 +50,24 @@ async def config(async_container: AsyncContainer) -> AsyncIterator[Config]:
         yield (await r.get(Config))
 
 
+@pytest.fixture
+async def redis_client(async_container: AsyncContainer) -> AsyncIterator[RedisClient]:
+    async with async_container() as r:
+        yield (await r.get(RedisClient))
+
+
+@pytest.fixture
+async def cache_invalidator(async_container: AsyncContainer) -> AsyncIterator[CacheInvalidator]:
+    async with async_container() as r:
+        yield (await r.get(CacheInvalidator))
+
+
 @pytest.fixture(autouse=True)
-async def gracefully_teardown(session: AsyncSession, config: Config) -> AsyncIterable[None]:
+async def gracefully_teardown(
+    session: AsyncSession,
+    config: Config,
+    cache_invalidator: CacheInvalidator,
+) -> AsyncIterable[None]:
     yield
     await session.execute(
         text(f"""
@@ -75,6 +94,14 @@ async def gracefully_teardown(session: AsyncSession, config: Config) -> AsyncIte
 
     await session.commit()
 
+    # Таблицы очищены в обход интеракторов: счётчики и кэши в Redis и процессные кэши API устарели
+    redis = Redis(host=config.redis.redis_host, port=config.redis.redis_port)
+    try:
+        await redis.flushdb()
+    finally:
+        await redis.aclose()
+    await cache_invalidator.invalidate_all()
+
 
 @pytest.fixture(scope="session")
 def base_url() -> str:
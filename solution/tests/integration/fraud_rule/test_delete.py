@@ -1,9 +1,18 @@
+import asyncio
+from decimal import Decimal
 from uuid import uuid4
 
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.application.common.cache import CacheInvalidator
 from backend.application.exception.base import ForbiddenError, UnauthorizedError
 from backend.application.exception.fraud_rule import FraudRuleDoesNotExistError
+from backend.application.forms.transaction import TransactionForm
 from backend.domain.entity.fraud_rule import FraudRule
+from backend.domain.misc_types import TransactionStatus
 from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.database.table.fraud_rule import fraud_rule_table
 from tests.utils.exception_validation import validate_exception
 from tests.utils.misc_types import AuthorizedUser
 
@@ -18,6 +27,57 @@ async def test_ok(
     (await api_client.delete_fraud_rule(fraud_rule.id)).expect_status(204)
 
 
+async def test_transaction_no_longer_matches(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule: FraudRule,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    transaction_form.amount = Decimal("1500.00")
+
+    decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert decision.transaction.status == TransactionStatus.DECLINED
+    assert [rule_result.rule_id for rule_result in decision.rule_results] == [fraud_rule.id]
+
+    (await api_client.delete_fraud_rule(fraud_rule.id)).expect_status(204)
+
+    decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert decision.transaction.status == TransactionStatus.APPROVED
+    assert decision.rule_results == []
+
+
+async def test_disabled_bypassing_api(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule: FraudRule,
+    transaction_form: TransactionForm,
+    session: AsyncSession,
+    cache_invalidator: CacheInvalidator,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    transaction_form.amount = Decimal("1500.00")
+
+    decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert decision.transaction.status == TransactionStatus.DECLINED
+
+    await session.execute(
+        update(fraud_rule_table).where(fraud_rule_table.c.id == fraud_rule.id).values(enabled=False),
+    )
+    await session.commit()
+    await cache_invalidator.invalidate_all()
+    # Сообщение об инвалидации доходит до воркеров API асинхронно
+    await asyncio.sleep(0.1)
+
+    decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert decision.transaction.status == TransactionStatus.APPROVED
+    assert decision.rule_results == []
+
+
 async def test_no_auth(
     api_client: AntiFraudApiClient,
     fraud_rule: FraudRule,
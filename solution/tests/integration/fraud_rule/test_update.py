@@ -1,3 +1,4 @@
+from decimal import Decimal
 from uuid import uuid4
 
 from backend.application.exception.base import ForbiddenError, UnauthorizedError
@@ -6,7 +7,9 @@ from backend.application.exception.fraud_rule import (
     FraudRuleNameAlreadyExistsError,
 )
 from backend.application.forms.fraud_rule import FraudRuleForm, UpdateFraudRuleForm
+from backend.application.forms.transaction import TransactionForm
 from backend.domain.entity.fraud_rule import FraudRule
+from backend.domain.misc_types import TransactionStatus
 from backend.infrastructure.api.api_client import AntiFraudApiClient
 from tests.utils.exception_validation import validate_exception
 from tests.utils.misc_types import AuthorizedUser
@@ -33,6 +36,60 @@ async def test_ok(
     assert updated_rule.enabled == update_fraud_rule_form.enabled
 
 
+async def test_transaction_uses_updated_rule(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule: FraudRule,
+    update_fraud_rule_form: UpdateFraudRuleForm,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    transaction_form.amount = Decimal("1500.00")
+
+    decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert decision.transaction.status == TransactionStatus.DECLINED
+
+    update_fraud_rule_form.enabled = True
+    (await api_client.update_fraud_rule(fraud_rule.id, update_fraud_rule_form)).expect_status(200)
+
+    decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert decision.transaction.status == TransactionStatus.APPROVED
+    assert len(decision.rule_results) == 1
+    assert decision.rule_results[0].rule_name == update_fraud_rule_form.name
+    assert decision.rule_results[0].matched is False
+
+
+async def test_transaction_follows_repeated_edits(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule: FraudRule,
+    update_fraud_rule_form: UpdateFraudRuleForm,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    transaction_form.amount = Decimal("1500.00")
+    update_fraud_rule_form.enabled = True
+
+    # Каждая правка меняет updated_at, скомпилированное правило прошлой версии не должно переиспользоваться
+    expected = [
+        ("amount < 10", 2, False),
+        (fraud_rule.dsl_expression, 2, True),
+        (fraud_rule.dsl_expression, 5, True),
+    ]
+    for dsl_expression, priority, matched in expected:
+        update_fraud_rule_form.dsl_expression = dsl_expression
+        update_fraud_rule_form.priority = priority
+        (await api_client.update_fraud_rule(fraud_rule.id, update_fraud_rule_form)).expect_status(200)
+
+        decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+        assert len(decision.rule_results) == 1
+        assert decision.rule_results[0].matched is matched
+        assert decision.rule_results[0].priority == priority
+
+
 async def test_used_name(
     api_client: AntiFraudApiClient,
     admin_user: AuthorizedUser,
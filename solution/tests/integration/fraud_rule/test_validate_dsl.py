@@ -91,6 +91,44 @@ async def test_parse_error(
     assert dsl_info.errors[0].code == "DSL_PARSE_ERROR"
 
 
+async def test_unknown_character(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    dsl_validation_form: DSLValidationForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    dsl_validation_form.dsl_expression = "amount > 100 $ currency = 'RUB'"
+    dsl_info = (await api_client.validate_dsl(dsl_validation_form)).expect_status(200).unwrap()
+
+    assert dsl_info.is_valid is False
+    assert dsl_info.normalized_expression is None
+
+    assert len(dsl_info.errors) == 1
+    assert dsl_info.errors[0].position == 13
+    assert dsl_info.errors[0].near == "$ currency"
+    assert dsl_info.errors[0].code == "DSL_PARSE_ERROR"
+
+
+async def test_unterminated_string(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    dsl_validation_form: DSLValidationForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    dsl_validation_form.dsl_expression = "amount > 100 AND currency = 'RUB"
+    dsl_info = (await api_client.validate_dsl(dsl_validation_form)).expect_status(200).unwrap()
+
+    assert dsl_info.is_valid is False
+    assert dsl_info.normalized_expression is None
+
+    assert len(dsl_info.errors) == 1
+    assert dsl_info.errors[0].position == 28
+    assert dsl_info.errors[0].near == "'RUB"
+    assert dsl_info.errors[0].code == "DSL_PARSE_ERROR"
+
+
 async def test_invalid_operator(
     api_client: AntiFraudApiClient,
     admin_user: AuthorizedUser,
@@ -168,6 +206,37 @@ async def test_ok_level_3_normalization(
     assert len(dsl_info.errors) == 0
 
 
+async def test_ok_operators_normalization(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    dsl_validation_form: DSLValidationForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    dsl_validation_form.dsl_expression = "amount>=100 or currency!='RUB'"
+
+    dsl_info = (await api_client.validate_dsl(dsl_validation_form)).expect_status(200).unwrap()
+
+    assert dsl_info.is_valid is True
+    assert dsl_info.normalized_expression == "amount >= 100 OR currency != 'RUB'"
+    assert len(dsl_info.errors) == 0
+
+
+async def test_ok_operand_order_kept(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    dsl_validation_form: DSLValidationForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    # При компиляции amount проверяется первым, но нормализованный текст сохраняет порядок автора
+    dsl_validation_form.dsl_expression = "currency = 'RUB' AND deviceId != 'x' AND amount > 100"
+
+    dsl_info = (await api_client.validate_dsl(dsl_validation_form)).expect_status(200).unwrap()
+
+    assert dsl_info.is_valid is True
+    assert dsl_info.normalized_expression == dsl_validation_form.dsl_expression
+    assert len(dsl_info.errors) == 0
+
+
 async def test_no_auth(
     api_client: AntiFraudApiClient,
     dsl_validation_form: DSLValidationForm,
@@ -0,0 +1,59 @@
+from backend.application.exception.base import ForbiddenError, UnauthorizedError
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from tests.utils.exception_validation import validate_exception
+from tests.utils.misc_types import AuthorizedUser
+
+
+async def test_ok(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    result = (await api_client.stats_db_pool()).expect_status(200).unwrap()
+
+    assert result.worker_pid > 0
+    assert result.pool_size > 0
+    assert result.checkouts > 0
+    assert result.checked_out + result.checked_in <= result.pool_size + result.overflow
+    assert result.wait_max_ms >= result.wait_avg_ms >= 0
+
+
+async def test_forbidden(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    error_data = (await api_client.stats_db_pool()).expect_status(403).err_unwrap()
+
+    validate_exception(error_data, ForbiddenError)
+
+
+async def test_no_auth(
+    api_client: AntiFraudApiClient,
+) -> None:
+    error_data = (await api_client.stats_db_pool()).expect_status(401).err_unwrap()
+
+    validate_exception(error_data, UnauthorizedError)
+
+
+async def test_cached_request_skips_pool(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    authorized_user: AuthorizedUser,
+) -> None:
+    # Первые запросы кладут обоих пользователей в кэш
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.stats_risk_profile(authorized_user.user.id)).expect_status(200).unwrap()
+    api_client.authorize(admin_user.access_token)
+    before = (await api_client.stats_db_pool()).expect_status(200).unwrap()
+
+    # Свой профиль риска читается только из Redis, пользователь - из кэша, сессия так и не берёт соединение
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.stats_risk_profile(authorized_user.user.id)).expect_status(200).unwrap()
+    api_client.authorize(admin_user.access_token)
+    after = (await api_client.stats_db_pool()).expect_status(200).unwrap()
+
+    assert after.worker_pid == before.worker_pid
+    assert after.checkouts == before.checkouts
@@ -0,0 +1,121 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from backend.application.exception.base import CustomValidationError, ForbiddenError
+from backend.application.forms.transaction import TransactionForm
+from backend.domain.entity.fraud_rule import FraudRule
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from tests.utils.exception_validation import validate_exception, validate_validation_error
+from tests.utils.misc_types import AuthorizedUser
+
+
+async def test_ok(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    fraud_rule: FraudRule,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    for merchant_id, merchant_category_code, amount in (
+        ("merchant_risky", "5411", "1500.00"),
+        ("merchant_risky", "5411", "100.00"),
+        ("merchant_safe", "5411", "100.00"),
+        ("merchant_other_mcc", "7995", "2000.00"),
+    ):
+        form = transaction_form.model_copy(
+            update={
+                "merchant_id": merchant_id,
+                "merchant_category_code": merchant_category_code,
+                "amount": Decimal(amount),
+            },
+        )
+        (await api_client.create_transaction(form)).expect_status(201)
+
+    now = datetime.now(tz=UTC)
+    result = (
+        (
+            await api_client.stats_merchant_risk(
+                from_=now - timedelta(days=3),
+                to=now + timedelta(minutes=1),
+                merchant_category_code="5411",
+            )
+        )
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert [item.merchant_id for item in result.items] == ["merchant_risky", "merchant_safe"]
+    assert result.items[0].tx_count == 2
+    assert result.items[0].gmv == 1600.0
+    assert result.items[0].decline_rate == 0.5
+    assert result.items[1].decline_rate == 0
+
+
+async def test_top(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    for merchant_id in ("merchant_001", "merchant_002", "merchant_003"):
+        form = transaction_form.model_copy(update={"merchant_id": merchant_id})
+        (await api_client.create_transaction(form)).expect_status(201)
+
+    now = datetime.now(tz=UTC)
+    result = (
+        (
+            await api_client.stats_merchant_risk(
+                from_=now - timedelta(days=1),
+                to=now + timedelta(minutes=1),
+                top=2,
+            )
+        )
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert len(result.items) == 2
+
+
+async def test_forbidden(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    error_data = (await api_client.stats_merchant_risk()).expect_status(403).err_unwrap()
+
+    validate_exception(error_data, ForbiddenError)
+
+
+async def test_from_greater_than_to(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    now = datetime.now(tz=UTC)
+    error_data = (
+        (await api_client.stats_merchant_risk(from_=now, to=now - timedelta(days=1)))
+        .expect_status(422)
+        .err_unwrap()
+    )
+
+    validate_exception(error_data, CustomValidationError)
+
+
+async def test_invalid_merchant_category_code(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    error_data = (
+        (await api_client.stats_merchant_risk(merchant_category_code="abc")).expect_status(422).err_unwrap()
+    )
+
+    validate_validation_error(error_data, {"merchantCategoryCode": "abc"})
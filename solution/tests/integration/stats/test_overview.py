@@ -0,0 +1,84 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from backend.application.exception.base import CustomValidationError, ForbiddenError, UnauthorizedError
+from backend.application.forms.transaction import TransactionForm
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from tests.utils.exception_validation import validate_exception
+from tests.utils.misc_types import AuthorizedUser
+
+
+async def test_ok(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    for amount in ("100.00", "200.50"):
+        form = transaction_form.model_copy(update={"amount": Decimal(amount)})
+        (await api_client.create_transaction(form)).expect_status(201)
+
+    now = datetime.now(tz=UTC)
+    result = (
+        (await api_client.stats_overview(from_=now - timedelta(days=1), to=now + timedelta(minutes=1)))
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert result.volume == 2
+    assert result.gmv == 300.5
+    assert result.approval_rate + result.decline_rate == 1
+    assert len(result.top_risk_merchants) == 1
+    assert result.top_risk_merchants[0].merchant_id == transaction_form.merchant_id
+    assert result.top_risk_merchants[0].tx_count == 2
+
+
+async def test_ok_empty(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    result = (await api_client.stats_overview()).expect_status(200).unwrap()
+
+    assert result.volume == 0
+    assert result.gmv == 0
+    assert result.approval_rate == 0
+    assert result.top_risk_merchants == []
+
+
+async def test_forbidden(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    error_data = (await api_client.stats_overview()).expect_status(403).err_unwrap()
+
+    validate_exception(error_data, ForbiddenError)
+
+
+async def test_no_auth(
+    api_client: AntiFraudApiClient,
+) -> None:
+    error_data = (await api_client.stats_overview()).expect_status(401).err_unwrap()
+
+    validate_exception(error_data, UnauthorizedError)
+
+
+async def test_from_greater_than_to(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    now = datetime.now(tz=UTC)
+    error_data = (
+        (await api_client.stats_overview(from_=now, to=now - timedelta(days=1)))
+        .expect_status(422)
+        .err_unwrap()
+    )
+
+    validate_exception(error_data, CustomValidationError)
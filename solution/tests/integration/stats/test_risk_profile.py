@@ -0,0 +1,109 @@
+from urllib.parse import urljoin
+from uuid import uuid4
+
+from aiohttp import ClientSession
+
+from backend.application.exception.base import ForbiddenError, UnauthorizedError
+from backend.application.exception.user import UserDoesNotExistError
+from backend.application.forms.transaction import TransactionForm
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from tests.utils.exception_validation import validate_exception
+from tests.utils.misc_types import AuthorizedUser
+
+
+async def test_ok_self(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    (await api_client.create_transaction(transaction_form)).expect_status(201)
+    form = transaction_form.model_copy(update={"device_id": "device_other"})
+    (await api_client.create_transaction(form)).expect_status(201)
+
+    api_client.authorize(another_authorized_user.access_token)
+    result = (
+        (await api_client.stats_risk_profile(another_authorized_user.user.id)).expect_status(200).unwrap()
+    )
+
+    assert result.user_id == another_authorized_user.user.id
+    assert result.tx_count_24h == 2
+    assert result.gmv_24h == float(transaction_form.amount * 2)
+    assert result.distinct_devices_24h == 2
+    assert result.distinct_ips_24h == 1
+    assert result.distinct_cities_24h == 1
+    assert result.last_seen_at is not None
+
+
+async def test_spec_field_names(
+    base_url: str,
+    http_session: ClientSession,
+    authorized_user: AuthorizedUser,
+) -> None:
+    async with http_session.get(
+        urljoin(base_url, f"stats/users/{authorized_user.user.id}/risk-profile"),
+        headers={"Authorization": f"Bearer {authorized_user.access_token}"},
+    ) as response:
+        assert response.status == 200
+        body = await response.json()
+
+    assert set(body) == {
+        "userId",
+        "txCount_24h",
+        "gmv_24h",
+        "distinctDevices_24h",
+        "distinctIps_24h",
+        "distinctCities_24h",
+        "declineRate_30d",
+        "lastSeenAt",
+    }
+
+
+async def test_ok_admin_empty(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    result = (await api_client.stats_risk_profile(authorized_user.user.id)).expect_status(200).unwrap()
+
+    assert result.tx_count_24h == 0
+    assert result.gmv_24h == 0
+    assert result.decline_rate_30d == 0
+    assert result.last_seen_at is None
+
+
+async def test_forbidden(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    error_data = (
+        (await api_client.stats_risk_profile(another_authorized_user.user.id)).expect_status(403).err_unwrap()
+    )
+
+    validate_exception(error_data, ForbiddenError)
+
+
+async def test_not_found(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    error_data = (await api_client.stats_risk_profile(uuid4())).expect_status(404).err_unwrap()
+
+    validate_exception(error_data, UserDoesNotExistError)
+
+
+async def test_no_auth(
+    api_client: AntiFraudApiClient,
+) -> None:
+    error_data = (await api_client.stats_risk_profile(uuid4())).expect_status(401).err_unwrap()
+
+    validate_exception(error_data, UnauthorizedError)
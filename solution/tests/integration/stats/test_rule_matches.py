@@ -0,0 +1,86 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from backend.application.exception.base import CustomValidationError, ForbiddenError
+from backend.application.forms.fraud_rule import FraudRuleForm
+from backend.application.forms.transaction import TransactionForm
+from backend.domain.entity.fraud_rule import FraudRule
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from tests.utils.exception_validation import validate_exception
+from tests.utils.misc_types import AuthorizedUser
+
+
+@pytest.mark.parametrize("exact", [False, True])
+async def test_ok(
+    exact: bool,
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    fraud_rule: FraudRule,
+    fraud_rule_form: FraudRuleForm,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    small_rule_form = fraud_rule_form.model_copy(
+        update={"name": "Small amount", "dsl_expression": "amount < 150"},
+    )
+    small_rule = (await api_client.create_fraud_rule(small_rule_form)).expect_status(201).unwrap()
+
+    for amount in ("1500.00", "2000.00", "100.00"):
+        form = transaction_form.model_copy(update={"amount": Decimal(amount)})
+        (await api_client.create_transaction(form)).expect_status(201)
+
+    now = datetime.now(tz=UTC)
+    result = (
+        (
+            await api_client.stats_rule_matches(
+                from_=now - timedelta(days=1),
+                to=now + timedelta(minutes=1),
+                exact=exact,
+            )
+        )
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert result.exact is exact
+    assert len(result.items) == 2
+    assert result.items[0].rule_id == fraud_rule.id
+    assert result.items[0].matches == 2
+    assert result.items[0].unique_users == 1
+    assert result.items[0].unique_merchants == 1
+    # Все три транзакции отклонены: две этим правилом, одна вторым
+    assert result.items[0].share_of_declines == pytest.approx(2 / 3)
+    assert result.items[1].rule_id == small_rule.id
+    assert result.items[1].matches == 1
+    assert result.items[1].share_of_declines == pytest.approx(1 / 3)
+
+
+async def test_forbidden(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    error_data = (await api_client.stats_rule_matches()).expect_status(403).err_unwrap()
+
+    validate_exception(error_data, ForbiddenError)
+
+
+async def test_interval_too_large(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    now = datetime.now(tz=UTC)
+    error_data = (
+        (await api_client.stats_rule_matches(from_=now - timedelta(days=100), to=now))
+        .expect_status(422)
+        .err_unwrap()
+    )
+
+    validate_exception(error_data, CustomValidationError)
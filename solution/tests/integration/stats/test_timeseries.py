@@ -0,0 +1,171 @@
+from datetime import UTC, datetime, timedelta
+
+from backend.application.exception.base import CustomValidationError, ForbiddenError
+from backend.application.forms.transaction import TransactionForm
+from backend.domain.misc_types import StatsGroupBy
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from tests.utils.exception_validation import validate_exception
+from tests.utils.misc_types import AuthorizedUser
+
+
+async def test_ok(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    (await api_client.create_transaction(transaction_form)).expect_status(201)
+    (await api_client.create_transaction(transaction_form)).expect_status(201)
+
+    now = datetime.now(tz=UTC)
+    result = (
+        (
+            await api_client.stats_timeseries(
+                from_=now - timedelta(days=1),
+                to=now + timedelta(minutes=1),
+                group_by=StatsGroupBy.HOUR,
+            )
+        )
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert sum(point.tx_count for point in result.points) == 2
+    for point in result.points:
+        assert point.bucket_start.minute == 0
+
+
+async def test_ok_timezone(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    (await api_client.create_transaction(transaction_form)).expect_status(201)
+
+    result = (
+        (await api_client.stats_timeseries(group_by=StatsGroupBy.DAY, timezone="Europe/Moscow"))
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert len(result.points) == 1
+    assert result.points[0].tx_count == 1
+
+
+async def test_forbidden(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    error_data = (await api_client.stats_timeseries()).expect_status(403).err_unwrap()
+
+    validate_exception(error_data, ForbiddenError)
+
+
+async def test_hourly_interval_too_large(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    now = datetime.now(tz=UTC)
+    error_data = (
+        (
+            await api_client.stats_timeseries(
+                from_=now - timedelta(days=8),
+                to=now,
+                group_by=StatsGroupBy.HOUR,
+            )
+        )
+        .expect_status(422)
+        .err_unwrap()
+    )
+
+    validate_exception(error_data, CustomValidationError)
+
+
+async def test_ok_weekly_long_interval(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    (await api_client.create_transaction(transaction_form)).expect_status(201)
+
+    now = datetime.now(tz=UTC)
+    result = (
+        (
+            await api_client.stats_timeseries(
+                from_=now - timedelta(days=200),
+                to=now + timedelta(minutes=1),
+                group_by=StatsGroupBy.WEEK,
+            )
+        )
+        .expect_status(200)
+        .unwrap()
+    )
+
+    assert sum(point.tx_count for point in result.points) == 1
+
+
+async def test_daily_interval_too_large(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    now = datetime.now(tz=UTC)
+    error_data = (
+        (
+            await api_client.stats_timeseries(
+                from_=now - timedelta(days=200),
+                to=now,
+                group_by=StatsGroupBy.DAY,
+            )
+        )
+        .expect_status(422)
+        .err_unwrap()
+    )
+
+    validate_exception(error_data, CustomValidationError)
+
+
+async def test_weekly_interval_too_large(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    now = datetime.now(tz=UTC)
+    error_data = (
+        (
+            await api_client.stats_timeseries(
+                from_=now - timedelta(days=366),
+                to=now,
+                group_by=StatsGroupBy.WEEK,
+            )
+        )
+        .expect_status(422)
+        .err_unwrap()
+    )
+
+    validate_exception(error_data, CustomValidationError)
+
+
+async def test_unknown_timezone(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    error_data = (await api_client.stats_timeseries(timezone="Mars/Olympus")).expect_status(422).err_unwrap()
+
+    validate_exception(error_data, CustomValidationError)
@@ -0,0 +1,44 @@
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.application.exception.base import UnauthorizedError
+from backend.infrastructure.auth.access_token import AccessToken
+from backend.infrastructure.auth.idp.token_parser import AccessTokenParser
+from backend.infrastructure.database.read_only import SAReadOnlyMode
+from backend.infrastructure.database.replica import ReplicaRouter
+from tests.utils.misc_types import AuthorizedUser
+
+
+class NoTokenParser(AccessTokenParser):
+    def parse_token(self) -> AccessToken:
+        raise UnauthorizedError
+
+
+async def test_session_rejects_writes(
+    async_container: AsyncContainer,
+    authorized_user: AuthorizedUser,
+) -> None:
+    # Отдельная сессия запроса: общую сессию фикстур очистка после теста использует для записи
+    async with async_container() as r:
+        session = await r.get(AsyncSession)
+        read_only = SAReadOnlyMode(
+            session=session,
+            engine=await r.get(AsyncEngine),
+            router=await r.get(ReplicaRouter),
+            token_parser=NoTokenParser(),
+        )
+
+        await read_only.enable()
+
+        assert (await session.execute(text("SHOW transaction_read_only"))).scalar_one() == "on"
+
+        with pytest.raises(DBAPIError, match="read-only transaction"):
+            await session.execute(
+                text("UPDATE user_table SET full_name = 'Changed' WHERE id = :id"),
+                {"id": authorized_user.user.id},
+            )
+
+        await session.rollback()
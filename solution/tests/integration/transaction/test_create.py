@@ -57,6 +57,20 @@ async def test_ok_round(
     assert transaction.amount == Decimal("100.12")
 
 
+async def test_metadata_big_int(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    transaction_form.metadata = {"source": "test", "externalId": 2**70}
+
+    transaction_decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+    assert transaction_decision.transaction.metadata == transaction_form.metadata
+
+
 async def test_rule_results_approved(
     api_client: AntiFraudApiClient,
     admin_user: AuthorizedUser,
@@ -176,6 +190,84 @@ async def test_rule_results_declined(
         prev_priority = rule_result.priority
 
 
+async def test_rule_operators(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule_form: FraudRuleForm,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    transaction_form.amount = Decimal("101.50")
+    expected: dict[str, bool] = {
+        "amount = 101.5": True,
+        "amount != 101.5": False,
+        "amount > 101.5": False,
+        "amount >= 101.5": True,
+        "amount < 101.5": False,
+        "amount <= 101.5": True,
+        "deviceId = 'device_abc123'": True,
+        "ipAddress != '192.168.1.1'": False,
+        "currency = 'USD' OR merchantId = 'merchant_001'": True,
+        "amount > 100 AND amount < 200": True,
+    }
+    jobs = []
+    for i, dsl_expression in enumerate(expected):
+        form = fraud_rule_form.model_copy(
+            update={"name": f"rule{i}", "priority": i + 1, "dsl_expression": dsl_expression},
+        )
+        jobs.append(api_client.create_fraud_rule(form))
+
+    for response in await asyncio.gather(*jobs):
+        response.expect_status(201)
+
+    transaction_decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+    rule_results = transaction_decision.rule_results
+
+    assert len(rule_results) == len(expected)
+    for i, dsl_expression in enumerate(expected):
+        rule_result = next(result for result in rule_results if result.rule_name == f"rule{i}")
+        assert rule_result.matched is expected[dsl_expression], dsl_expression
+
+
+async def test_rule_logical_precedence(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule_form: FraudRuleForm,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    transaction_form.amount = Decimal("101.50")
+    # Операнды переставляются по стоимости и вычисляются с коротким замыканием, результат не меняется
+    expected: dict[str, bool] = {
+        "currency = 'USD' OR amount > 100 AND merchantId = 'merchant_001'": True,
+        "currency = 'RUB' AND amount > 1000 OR deviceId = 'device_xyz'": False,
+        "merchantId != 'merchant_001' OR currency = 'RUB' AND amount <= 101.5": True,
+        "currency = 'RUB' AND deviceId = 'device_abc123' AND amount > 1000": False,
+        "deviceId = 'device_xyz' OR ipAddress = '192.168.1.1' OR amount > 1000": True,
+    }
+    jobs = []
+    for i, dsl_expression in enumerate(expected):
+        form = fraud_rule_form.model_copy(
+            update={"name": f"rule{i}", "priority": i + 1, "dsl_expression": dsl_expression},
+        )
+        jobs.append(api_client.create_fraud_rule(form))
+
+    for response in await asyncio.gather(*jobs):
+        rule = response.expect_status(201).unwrap()
+        # Сохранённый текст правила остаётся в порядке, в котором его написали
+        assert rule.dsl_expression in expected
+
+    transaction_decision = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+    rule_results = transaction_decision.rule_results
+
+    assert len(rule_results) == len(expected)
+    for i, dsl_expression in enumerate(expected):
+        rule_result = next(result for result in rule_results if result.rule_name == f"rule{i}")
+        assert rule_result.matched is expected[dsl_expression], dsl_expression
+
+
 async def test_ok_self(
     api_client: AntiFraudApiClient,
     authorized_user: AuthorizedUser,
@@ -0,0 +1,149 @@
+import asyncio
+from decimal import Decimal
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from backend.application.exception.base import UnauthorizedError
+from backend.application.exception.user import UserDoesNotExistError
+from backend.application.forms.fraud_rule import FraudRuleForm
+from backend.application.forms.transaction import TransactionForm
+from backend.domain.misc_types import TransactionStatus
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.api.models import ERROR_CODE, TransactionBatchRequest
+from tests.utils.misc_types import AuthorizedUser
+
+
+async def test_ok_admin(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    body = TransactionBatchRequest(items=[transaction_form, transaction_form, transaction_form])
+    result = (await api_client.create_transactions_batch(body)).expect_status(201).unwrap()
+
+    assert [item.index for item in result.items] == [0, 1, 2]
+    assert len({item.decision.transaction.id for item in result.items if item.decision is not None}) == 3
+
+    for item in result.items:
+        assert item.error is None
+        assert item.decision is not None
+
+        transaction = item.decision.transaction
+        assert transaction.user_id == another_authorized_user.user.id
+        assert transaction.amount == transaction_form.amount
+        assert transaction.status == TransactionStatus.APPROVED
+
+        saved = (await api_client.read_transaction(transaction.id)).expect_status(200).unwrap()
+        assert saved.transaction.id == transaction.id
+
+
+async def test_rule_results_match_single(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    fraud_rule_form: FraudRuleForm,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    dsl_expressions = [
+        "amount >= 1000",
+        "currency = 'USD' OR amount < 50",
+        "deviceId = 'device_abc123' AND amount > 100",
+    ]
+    jobs = []
+    for i, dsl_expression in enumerate(dsl_expressions):
+        form = fraud_rule_form.model_copy(
+            update={"name": f"rule{i}", "priority": i + 1, "dsl_expression": dsl_expression},
+        )
+        jobs.append(api_client.create_fraud_rule(form))
+    for response in await asyncio.gather(*jobs):
+        response.expect_status(201)
+
+    items = [
+        transaction_form.model_copy(update={"amount": Decimal("101.50")}),
+        transaction_form.model_copy(update={"amount": Decimal("1500.00")}),
+        transaction_form.model_copy(update={"amount": Decimal("20.00"), "currency": "USD"}),
+        transaction_form.model_copy(update={"amount": Decimal("60.00"), "device_id": "device_other"}),
+    ]
+    expected = [
+        [False, False, True],
+        [True, False, True],
+        [False, True, False],
+        [False, False, False],
+    ]
+
+    # Пачка оценивается векторно по колонкам, результат должен совпадать с поштучной оценкой
+    body = TransactionBatchRequest(items=items)
+    result = (await api_client.create_transactions_batch(body)).expect_status(201).unwrap()
+    for item, form, matched in zip(result.items, items, expected, strict=True):
+        assert item.decision is not None
+        batch_matched = {rule.rule_name: rule.matched for rule in item.decision.rule_results}
+        assert batch_matched == {f"rule{i}": value for i, value in enumerate(matched)}
+        assert item.decision.transaction.is_fraud is any(matched)
+
+        single = (await api_client.create_transaction(form)).expect_status(201).unwrap()
+        single_matched = {rule.rule_name: rule.matched for rule in single.rule_results}
+        assert single_matched == batch_matched
+
+
+async def test_partial_validation_error(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    invalid_form = transaction_form.model_copy(deep=True)
+    invalid_form.location.latitude = None
+
+    body = TransactionBatchRequest(items=[transaction_form, invalid_form])
+    result = (await api_client.create_transactions_batch(body)).expect_status(207).unwrap()
+
+    ok_item, error_item = result.items
+
+    assert ok_item.index == 0
+    assert ok_item.error is None
+    assert ok_item.decision is not None
+    assert ok_item.decision.transaction.user_id == authorized_user.user.id
+
+    assert error_item.index == 1
+    assert error_item.decision is None
+    assert error_item.error is not None
+    assert error_item.error.code == ERROR_CODE[ValidationError]
+    assert isinstance(error_item.error.field_errors, list)
+    assert [field_error.field for field_error in error_item.error.field_errors] == ["location.latitude"]
+
+
+async def test_partial_user_not_found(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    missing_user_form = transaction_form.model_copy()
+    missing_user_form.user_id = uuid4()
+
+    body = TransactionBatchRequest(items=[missing_user_form, transaction_form])
+    result = (await api_client.create_transactions_batch(body)).expect_status(207).unwrap()
+
+    error_item, ok_item = result.items
+
+    assert error_item.decision is None
+    assert error_item.error is not None
+    assert error_item.error.code == ERROR_CODE[UserDoesNotExistError]
+    assert ok_item.decision is not None
+
+
+async def test_no_auth(
+    api_client: AntiFraudApiClient,
+    transaction_form: TransactionForm,
+) -> None:
+    body = TransactionBatchRequest(items=[transaction_form])
+    error_data = (await api_client.create_transactions_batch(body)).expect_status(401).err_unwrap()
+
+    assert error_data.error_data.code == ERROR_CODE[UnauthorizedError]
@@ -0,0 +1,103 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.application.forms.transaction import TransactionForm
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.database.partition import PartitionManager, add_months
+from backend.infrastructure.database.table.transaction import transaction_table
+from tests.utils.misc_types import AuthorizedUser
+
+# Месяц, для которого секции заведомо ещё нет, и строки попадают в DEFAULT
+FUTURE_MONTH = datetime(2099, 1, 1, tzinfo=UTC)
+# Месяц заведомо старше любого срока хранения
+PAST_MONTH = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def partition_manager(async_container: AsyncContainer) -> AsyncIterator[PartitionManager]:
+    async with async_container() as r:
+        yield (await r.get(PartitionManager))
+
+
+async def test_ensure_moves_rows_from_default(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+    partition_manager: PartitionManager,
+    session: AsyncSession,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    created = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+    transaction_id = created.transaction.id
+
+    await session.execute(
+        text("UPDATE transaction_table SET created_at = :created_at WHERE id = :id"),
+        {"created_at": FUTURE_MONTH, "id": transaction_id},
+    )
+    await session.commit()
+
+    created_partitions = await partition_manager.ensure(months_ahead=0, now=FUTURE_MONTH)
+    try:
+        assert f"{transaction_table.name}_p2099_01" in created_partitions
+
+        in_partition = await session.scalar(
+            text("SELECT count(*) FROM transaction_table_p2099_01 WHERE id = :id"),
+            {"id": transaction_id},
+        )
+        in_default = await session.scalar(
+            text("SELECT count(*) FROM transaction_table_default WHERE id = :id"),
+            {"id": transaction_id},
+        )
+        assert in_partition == 1
+        assert in_default == 0
+
+        read_result = (await api_client.read_transaction(transaction_id)).expect_status(200).unwrap()
+        assert read_result.transaction.id == transaction_id
+    finally:
+        await session.rollback()
+        for name in created_partitions:
+            await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        await session.commit()
+
+
+async def test_detach_without_drop_keeps_locations(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+    partition_manager: PartitionManager,
+    session: AsyncSession,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+    created = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+    transaction_id = created.transaction.id
+
+    await session.execute(
+        text("UPDATE transaction_table SET created_at = :created_at WHERE id = :id"),
+        {"created_at": PAST_MONTH, "id": transaction_id},
+    )
+    await session.commit()
+
+    created_partitions = await partition_manager.ensure(months_ahead=0, now=PAST_MONTH)
+    try:
+        detached = await partition_manager.detach(
+            retention_months=1,
+            now=add_months(PAST_MONTH, 2),
+        )
+        assert f"{transaction_table.name}_p2000_01" in detached
+
+        # Отсоединённая секция остаётся архивом, поэтому её локации не удаляются
+        locations = await session.scalar(
+            text("SELECT count(*) FROM transaction_location_table WHERE id = :id"),
+            {"id": transaction_id},
+        )
+        assert locations == 1
+    finally:
+        await session.rollback()
+        for name in created_partitions:
+            await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        await session.commit()
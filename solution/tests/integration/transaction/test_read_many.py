@@ -175,3 +175,44 @@ async def test_interval_too_large(
     )
 
     validate_exception(error_data, CustomValidationError)
+
+
+async def test_ok_cursor_pagination(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    another_authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    for i in range(5):
+        form = transaction_form.model_copy(update={"amount": Decimal(f"{100 + i}.00")})
+        (await api_client.create_transaction(form)).expect_status(201)
+
+    seen_ids = []
+    cursor = None
+
+    for expected_size in (2, 2, 1):
+        result = (await api_client.read_transactions(size=2, cursor=cursor)).expect_status(200).unwrap()
+
+        assert len(result.items) == expected_size
+        assert result.total == 5
+        seen_ids.extend(item.id for item in result.items)
+        cursor = result.next_cursor
+
+    assert cursor is None
+    assert len(set(seen_ids)) == 5
+
+    offset_result = (await api_client.read_transactions(page=0, size=5)).expect_status(200).unwrap()
+    assert [item.id for item in offset_result.items] == seen_ids
+
+
+async def test_invalid_cursor(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    error_data = (await api_client.read_transactions(cursor="invalid.cursor")).expect_status(422).err_unwrap()
+
+    validate_exception(error_data, CustomValidationError)
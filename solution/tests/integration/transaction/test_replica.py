@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from backend.application.forms.transaction import TransactionForm
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.config_loader import Config
+from tests.utils.misc_types import AuthorizedUser
+
+
+@pytest.fixture
+async def replica_engine(config: Config) -> AsyncIterator[AsyncEngine]:
+    # Запускается через just tests-replica, без реплики проверять нечего
+    if not config.db.replica_urls:
+        pytest.skip("DB_REPLICA_URLS не задан")
+
+    engine = create_async_engine(config.db.replica_urls[0])
+    yield engine
+    await engine.dispose()
+
+
+async def test_reads_inside_ryw_window_go_to_primary(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+    replica_engine: AsyncEngine,
+    config: Config,
+) -> None:
+    window = config.db.replica_ryw_window
+    api_client.authorize(authorized_user.access_token)
+    transaction_form.user_id = authorized_user.user.id
+
+    # Свежий токен читает из основной БД, ждём, пока окно после регистрации истечёт и реплика догонит
+    await asyncio.sleep(window + 0.5)
+
+    async with replica_engine.connect() as conn:
+        await conn.execute(text("SELECT pg_wal_replay_pause()"))
+        await conn.commit()
+
+    try:
+        created = (await api_client.create_transaction(transaction_form)).expect_status(201).unwrap()
+
+        # Внутри окна read-your-writes и страница, и total читаются из основной БД
+        inside = (await api_client.read_transactions()).expect_status(200).unwrap()
+        assert [item.id for item in inside.items] == [created.transaction.id]
+        assert inside.total == 1
+
+        await asyncio.sleep(window + 0.5)
+
+        # После окна чтение уходит на реплику, которая из-за паузы не видит транзакцию.
+        # total считается там же, поэтому согласован со страницей
+        outside = (await api_client.read_transactions()).expect_status(200).unwrap()
+        assert outside.items == []
+        assert outside.total == 0
+    finally:
+        async with replica_engine.connect() as conn:
+            await conn.execute(text("SELECT pg_wal_replay_resume()"))
+            await conn.commit()
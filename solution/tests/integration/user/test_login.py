@@ -1,9 +1,11 @@
+import asyncio
 from datetime import UTC, datetime
 
 import pytest
 
 from backend.application.exception.base import UnauthorizedError
 from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.auth.hasher import Hasher
 from backend.infrastructure.auth.idp.token_processor import AccessTokenProcessor
 from backend.infrastructure.auth.login import WebLoginForm
 from tests.utils.exception_validation import validate_exception, validate_validation_error
@@ -68,6 +70,37 @@ async def test_invalid_auth_data(
     validate_exception(error_data, UnauthorizedError)
 
 
+async def test_concurrent(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    login_form: WebLoginForm,
+) -> None:
+    # Проверки паролей идут через ограниченный пул потоков, часть запросов ждёт в его очереди
+    wrong_form = login_form.model_copy(update={"password": login_form.password + "a"})
+    forms = [login_form, wrong_form] * 4
+
+    responses = await asyncio.gather(*(api_client.login(form) for form in forms))
+
+    for form, response in zip(forms, responses, strict=True):
+        if form is login_form:
+            assert response.expect_status(200).unwrap().user.id == authorized_user.user.id
+        else:
+            validate_exception(response.expect_status(401).err_unwrap(), UnauthorizedError)
+
+
+async def test_hasher_concurrent(hasher: Hasher) -> None:
+    passwords = [f"Qwerty_{i}!!!" for i in range(8)]
+
+    hashes = await asyncio.gather(*(hasher.hash(password) for password in passwords))
+    verified = await asyncio.gather(
+        *(hasher.verify(password, hashed) for password, hashed in zip(passwords, hashes, strict=True)),
+        *(hasher.verify(password + "a", hashed) for password, hashed in zip(passwords, hashes, strict=True)),
+    )
+
+    assert len(set(hashes)) == len(passwords)
+    assert verified == [True] * len(passwords) + [False] * len(passwords)
+
+
 @pytest.mark.parametrize(
     ("email", "password"),
     [("1", TestField.USE_DEFAULT), ("a" * 255 + "@example.com", "a" * 73)],
@@ -122,3 +122,49 @@ async def test_forbidden(
     error_data = (await api_client.read_users()).expect_status(403).err_unwrap()
 
     validate_exception(error_data, ForbiddenError)
+
+
+async def test_ok_cursor(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    admin_user_form: AdminUserForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    admin_user_form.role = Role.USER
+
+    for i in range(2):
+        form = admin_user_form.model_copy(update={"email": f"user{i}@example.com"})
+        (await api_client.create_user(form)).expect_status(201)
+
+    first_page = (await api_client.read_users(size=2)).expect_status(200).unwrap()
+    assert len(first_page.items) == 2
+    assert first_page.next_cursor is not None
+
+    second_page = (
+        (await api_client.read_users(size=2, cursor=first_page.next_cursor)).expect_status(200).unwrap()
+    )
+    assert len(second_page.items) == 1
+    assert second_page.total == 3
+    assert second_page.next_cursor is None
+
+    seen_ids = {user.id for user in first_page.items} | {user.id for user in second_page.items}
+    assert len(seen_ids) == 3
+
+
+async def test_cursor_from_another_list(
+    api_client: AntiFraudApiClient,
+    admin_user: AuthorizedUser,
+    admin_user_form: AdminUserForm,
+) -> None:
+    api_client.authorize(admin_user.access_token)
+
+    admin_user_form.role = Role.USER
+    (await api_client.create_user(admin_user_form)).expect_status(201)
+
+    users_cursor = (await api_client.read_users(size=1)).expect_status(200).unwrap().next_cursor
+    assert users_cursor is not None
+
+    error_data = (await api_client.read_transactions(cursor=users_cursor)).expect_status(422).err_unwrap()
+
+    validate_validation_error(error_data, {"cursor": users_cursor})
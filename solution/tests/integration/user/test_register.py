@@ -25,7 +25,7 @@ async def test_ok(
     user = data.user
 
     assert user.email == user_form.email
-    assert hasher.verify(user_form.password, user.password)
+    assert await hasher.verify(user_form.password, user.password)
     assert user.full_name == user_form.full_name
     assert user.region == user_form.region
     assert user.gender == user_form.gender
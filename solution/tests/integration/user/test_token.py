@@ -0,0 +1,93 @@
+import asyncio
+from datetime import UTC, datetime
+
+import jwt
+
+from backend.application.exception.base import ForbiddenError, UnauthorizedError
+from backend.application.forms.transaction import TransactionForm
+from backend.domain.misc_types import Role
+from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.auth.idp.token_processor import ALG, EXPIRATION_TIME
+from backend.infrastructure.config_loader import Config
+from tests.utils.exception_validation import validate_exception
+from tests.utils.misc_types import AuthorizedUser
+
+
+def issue_token(config: Config, user: AuthorizedUser, issued_at: float) -> str:
+    return jwt.encode(
+        {
+            "sub": str(user.user.id),
+            "role": Role.USER.value,
+            "iat": int(issued_at),
+            "exp": EXPIRATION_TIME,
+        },
+        config.jwt.secret_key,
+        ALG,
+    )
+
+
+async def test_expired(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    config: Config,
+) -> None:
+    issued_at = datetime.now(tz=UTC).timestamp() - EXPIRATION_TIME - 60
+    api_client.authorize(issue_token(config, authorized_user, issued_at))
+
+    error_data = (await api_client.read_user()).expect_status(401).err_unwrap()
+
+    validate_exception(error_data, UnauthorizedError)
+
+
+async def test_expires_while_cached(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    config: Config,
+) -> None:
+    issued_at = datetime.now(tz=UTC).timestamp() - EXPIRATION_TIME + 2
+    api_client.authorize(issue_token(config, authorized_user, issued_at))
+
+    # Первый запрос кладёт токен в кэш проверенных токенов
+    (await api_client.read_user()).expect_status(200).unwrap()
+
+    await asyncio.sleep(3)
+
+    error_data = (await api_client.read_user()).expect_status(401).err_unwrap()
+
+    validate_exception(error_data, UnauthorizedError)
+
+
+async def test_tampered_signature(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.read_user()).expect_status(200).unwrap()
+
+    header, payload, signature = authorized_user.access_token.split(".")
+    forged_signature = ("A" if signature[0] != "A" else "B") + signature[1:]
+    api_client.authorize(f"{header}.{payload}.{forged_signature}")
+
+    error_data = (await api_client.read_user()).expect_status(401).err_unwrap()
+
+    validate_exception(error_data, UnauthorizedError)
+
+
+async def test_deactivated_with_cached_token(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    admin_user: AuthorizedUser,
+    transaction_form: TransactionForm,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.read_user()).expect_status(200).unwrap()
+
+    api_client.authorize(admin_user.access_token)
+    (await api_client.delete_user(authorized_user.user.id)).expect_status(204)
+
+    # Токен остаётся в кэше, но состояние пользователя берётся заново
+    api_client.authorize(authorized_user.access_token)
+    transaction_form.user_id = authorized_user.user.id
+    error_data = (await api_client.create_transaction(transaction_form)).expect_status(403).err_unwrap()
+
+    validate_exception(error_data, ForbiddenError)
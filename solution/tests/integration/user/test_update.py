@@ -3,7 +3,10 @@ from uuid import uuid4
 from backend.application.exception.base import ForbiddenError, UnauthorizedError
 from backend.application.exception.user import UserDoesNotExistError
 from backend.application.forms.user import UpdateUserForm
+from backend.domain.misc_types import Role
 from backend.infrastructure.api.api_client import AntiFraudApiClient
+from backend.infrastructure.auth.user_cache import user_cache_key
+from backend.infrastructure.redis import RedisClient
 from tests.utils.exception_validation import validate_exception
 from tests.utils.misc_types import AuthorizedUser
 
@@ -44,6 +47,59 @@ async def test_ok_by_id(
     assert updated_user.marital_status == update_user_form.marital_status
 
 
+async def test_update_visible_through_cache(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    update_user_form: UpdateUserForm,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+
+    # Первый запрос кладёт пользователя в кэш
+    (await api_client.read_user()).expect_status(200).unwrap()
+    (await api_client.update_user(update_user_form)).expect_status(200).unwrap()
+
+    me = (await api_client.read_user()).expect_status(200).unwrap()
+
+    assert me.full_name == update_user_form.full_name
+    assert me.region == update_user_form.region
+
+
+async def test_role_change_visible_through_cache(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    admin_user: AuthorizedUser,
+    update_user_form: UpdateUserForm,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.read_users()).expect_status(403).err_unwrap()
+
+    api_client.authorize(admin_user.access_token)
+    update_user_form.role = Role.ADMIN
+    user_id = authorized_user.user.id
+    (await api_client.update_user_by_id(user_id, update_user_form)).expect_status(200).unwrap()
+
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.read_users()).expect_status(200).unwrap()
+    me = (await api_client.read_user()).expect_status(200).unwrap()
+
+    assert me.role == Role.ADMIN
+
+
+async def test_password_not_cached(
+    api_client: AntiFraudApiClient,
+    authorized_user: AuthorizedUser,
+    redis_client: RedisClient,
+) -> None:
+    api_client.authorize(authorized_user.access_token)
+    (await api_client.read_user()).expect_status(200).unwrap()
+
+    raw = await redis_client.get(user_cache_key(authorized_user.user.id))
+
+    assert raw is not None
+    assert "password" not in raw
+    assert "argon2" not in raw
+
+
 async def test_no_auth_me(api_client: AntiFraudApiClient, update_user_form: UpdateUserForm) -> None:
     error_data = (await api_client.update_user(update_user_form)).expect_status(401).err_unwrap()
 
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def gracefully_teardown() -> None:
+    # Модульные тесты не трогают Postgres и Redis, очищать нечего
+    return
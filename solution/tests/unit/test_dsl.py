@@ -0,0 +1,153 @@
+import operator
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from backend.application.service.rule_cache import compile_rule
+from backend.domain.exception.dsl import DSLInvalidOperatorError
+from backend.domain.service.dsl.ast_node import Comparison, Logical
+from backend.domain.service.dsl.compile import DECIMAL_OPERATORS, STRING_OPERATORS, compile_ast
+from backend.domain.service.dsl.lex import Lexer
+from backend.domain.service.dsl.normalize import ast_to_string, normalize_ast, reorder_by_cost
+from backend.domain.service.dsl.parser import DSLParser
+
+CONTEXT: dict[str, Any] = {
+    "amount": Decimal("101.50"),
+    "currency": "USD",
+    "merchantId": "merchant_001",
+    "ipAddress": "192.168.1.1",
+    "deviceId": "device_abc123",
+}
+
+# Результат для amount 100, 101.5 и 200 при сравнении с 101.5
+DECIMAL_EXPECTED: dict[str, tuple[bool, bool, bool]] = {
+    "=": (False, True, False),
+    "!=": (True, False, True),
+    ">": (False, False, True),
+    "<": (True, False, False),
+    ">=": (False, True, True),
+    "<=": (True, True, False),
+}
+# Результат для deviceId 'device_abc123' и 'device_xyz' при сравнении с 'device_abc123'
+STRING_EXPECTED: dict[str, tuple[bool, bool]] = {
+    "=": (True, False),
+    "!=": (False, True),
+}
+
+
+def parse(dsl_expression: str) -> Any:
+    return normalize_ast(DSLParser(Lexer(dsl_expression).tokenize()).parse())
+
+
+def test_operator_tables_are_covered() -> None:
+    assert DECIMAL_EXPECTED.keys() == DECIMAL_OPERATORS.keys()
+    assert STRING_EXPECTED.keys() == STRING_OPERATORS.keys()
+
+
+@pytest.mark.parametrize(("op", "expected"), DECIMAL_EXPECTED.items())
+def test_decimal_operator(op: str, expected: tuple[bool, bool, bool]) -> None:
+    predicate = compile_rule(f"amount {op} 101.5").predicate
+    assert predicate is not None
+
+    amounts = (Decimal(100), Decimal("101.5"), Decimal(200))
+
+    assert tuple(predicate({**CONTEXT, "amount": amount}) for amount in amounts) == expected
+
+
+@pytest.mark.parametrize(("op", "expected"), STRING_EXPECTED.items())
+def test_string_operator(op: str, expected: tuple[bool, bool]) -> None:
+    predicate = compile_rule(f"deviceId {op} 'device_abc123'").predicate
+    assert predicate is not None
+
+    devices = ("device_abc123", "device_xyz")
+
+    assert tuple(predicate({**CONTEXT, "deviceId": device}) for device in devices) == expected
+
+
+def test_comparison_is_resolved_at_compile_time() -> None:
+    predicate = compile_ast(Comparison(left="amount", operator=">=", right=Decimal("101.5")))
+
+    # Оператор и литерал уже лежат в замыкании, при оценке ничего не разбирается
+    captured = {cell.cell_contents for cell in predicate.__closure__ or ()}
+    assert operator.ge in captured
+    assert Decimal("101.5") in captured
+
+    assert predicate(CONTEXT) is True
+
+
+def test_or_short_circuits() -> None:
+    predicate = compile_rule("amount > 100 OR merchantId = 'merchant_001'", reorder=False).predicate
+    assert predicate is not None
+
+    # merchantId в контексте нет: правый операнд упал бы с KeyError, если бы до него дошла очередь
+    assert predicate({"amount": Decimal(150)}) is True
+    with pytest.raises(KeyError):
+        predicate({"amount": Decimal(50)})
+
+
+def test_and_short_circuits() -> None:
+    predicate = compile_rule("amount > 1000 AND merchantId = 'merchant_001'", reorder=False).predicate
+    assert predicate is not None
+
+    assert predicate({"amount": Decimal(150)}) is False
+    with pytest.raises(KeyError):
+        predicate({"amount": Decimal(1500)})
+
+
+def test_invalid_comparison_raises_only_when_reached() -> None:
+    node = Logical(
+        left=Comparison(left="amount", operator=">", right=100),
+        operator="OR",
+        right=Comparison(left="currency", operator=">", right=5),
+    )
+    predicate = compile_ast(node)
+
+    assert predicate(CONTEXT) is True
+    with pytest.raises(DSLInvalidOperatorError):
+        predicate({**CONTEXT, "amount": Decimal(50)})
+
+
+@pytest.mark.parametrize(
+    ("dsl_expression", "reordered"),
+    [
+        # Сравнение суммы дешевле строкового и идёт первым
+        ("currency = 'USD' OR amount > 100", "amount > 100 OR currency = 'USD'"),
+        ("deviceId = 'device_xyz' AND amount > 1000", "amount > 1000 AND deviceId = 'device_xyz'"),
+        # В AND первым проверяется =, которое чаще ложно, в OR - !=, которое чаще истинно
+        ("merchantId != 'm1' AND deviceId = 'd1'", "deviceId = 'd1' AND merchantId != 'm1'"),
+        ("merchantId = 'm1' OR deviceId != 'd1'", "deviceId != 'd1' OR merchantId = 'm1'"),
+        # Цепочка из трёх операндов переставляется целиком, а не попарно
+        (
+            "currency = 'RUB' AND deviceId = 'device_abc123' AND amount > 1000",
+            "amount > 1000 AND currency = 'RUB' AND deviceId = 'device_abc123'",
+        ),
+    ],
+)
+def test_reorder_by_cost(dsl_expression: str, reordered: str) -> None:
+    assert ast_to_string(reorder_by_cost(parse(dsl_expression))) == reordered
+
+
+def test_ill_typed_expression_is_not_reordered() -> None:
+    node = Logical(
+        left=Comparison(left="currency", operator=">", right=5),
+        operator="OR",
+        right=Comparison(left="amount", operator=">", right=100),
+    )
+
+    assert reorder_by_cost(node) == node
+
+
+def test_reordered_rule_evaluates_cheap_operand_first() -> None:
+    dsl_expression = "currency = 'USD' OR amount > 100"
+    # currency в контексте нет: без перестановки сравнение строки вычисляется первым и падает
+    context = {"amount": Decimal(150)}
+
+    reordered = compile_rule(dsl_expression).predicate
+    written_order = compile_rule(dsl_expression, reorder=False).predicate
+    assert reordered is not None
+    assert written_order is not None
+
+    assert reordered(context) is True
+    with pytest.raises(KeyError):
+        written_order(context)
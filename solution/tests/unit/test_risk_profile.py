@@ -0,0 +1,14 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from backend.infrastructure.config_loader import RedisConfig
+from backend.infrastructure.redis import RedisClient
+from backend.infrastructure.risk_profile import RedisRiskProfileCounters
+
+
+async def test_get_returns_none_when_redis_is_down() -> None:
+    # На этом порту никто не слушает, пайплайн падает с ConnectionError
+    async with RedisClient(RedisConfig(redis_port=1, redis_host="127.0.0.1")) as redis:
+        counters = RedisRiskProfileCounters(redis)
+
+        assert await counters.get(uuid4(), datetime.now(tz=UTC)) is None